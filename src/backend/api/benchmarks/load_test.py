@@ -0,0 +1,417 @@
+"""
+API 부하 테스트
+
+로컬 서버(기본: 임시 데이터베이스로 새로 실행)에 합성 사용자를 가입/로그인시키고
+Health Connect 샘플 데이터를 동기화한 뒤, 지정한 동시성과 경로 비율로 요청을 보내
+경로별 처리량과 p50/p95/p99 지연 시간을 JSON으로 출력합니다.
+
+    python src/backend/api/benchmarks/load_test.py --concurrency 16 --duration 30
+    python src/backend/api/benchmarks/load_test.py --server uvicorn --workers 4 --etag
+    python src/backend/api/benchmarks/load_test.py --mix sleep_summary=3,sleep=1 --output load.json
+    python src/backend/api/benchmarks/load_test.py --url http://127.0.0.1:5000 --users 20
+
+클라이언트는 스레드마다 연결 하나를 유지(keep-alive)합니다. --etag를 주면 경로별로
+마지막 ETag를 If-None-Match로 보내 캐시를 쓰는 앱 클라이언트처럼 동작합니다.
+"""
+import argparse
+import http.client
+import json
+import os
+import random
+import socket
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, timedelta
+from urllib.parse import urlsplit
+
+PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '../../../../'))
+
+# 합성 사용자 비밀번호
+PASSWORD = 'load-test-password'
+
+def _feedback_body(rng, days):
+    day = date.today() - timedelta(days=rng.randint(1, days))
+    return {
+        "date": day.isoformat(),
+        "sleep_satisfaction": rng.randint(1, 5),
+        "morning_condition": rng.randint(1, 5),
+        "notes": "load test"
+    }
+
+# 경로 이름 -> (메서드, 경로, 본문 생성 함수 또는 None, 기본 비율)
+ROUTES = {
+    "sleep_summary": ("GET", "/api/analysis/sleep_summary", None, 4),
+    "comprehensive": ("GET", "/api/analysis/comprehensive", None, 2),
+    "trends": ("GET", "/api/analysis/trends", None, 2),
+    "optimal_sleep": ("GET", "/api/analysis/optimal_sleep", None, 1),
+    "correlations": ("GET", "/api/analysis/correlations", None, 1),
+    "batch": ("GET", "/api/analysis/batch", None, 1),
+    "sleep": ("GET", "/api/health_connect/sleep", None, 3),
+    "activity": ("GET", "/api/health_connect/activity", None, 1),
+    "stress": ("GET", "/api/health_connect/stress", None, 1),
+    "status": ("GET", "/api/health_connect/status", None, 1),
+    "feedback": ("POST", "/api/health_connect/feedback", _feedback_body, 1),
+    "verify": ("GET", "/api/auth/verify", None, 1),
+    # 비밀번호 해시와 업스트림 동기화는 비용이 크므로 기본 비율에서 제외
+    "login": ("POST", "/api/auth/login", None, 0),
+    "sync": ("POST", "/api/health_connect/sync", None, 0)
+}
+
+def parse_mix(text):
+    """
+    경로 비율 문자열 해석 ("sleep_summary=3,sleep=1", 없으면 기본 비율)
+
+    Returns:
+        dict: 경로 이름 -> 비율 (0보다 큰 경로만)
+    """
+    if not text:
+        return {name: route[3] for name, route in ROUTES.items() if route[3] > 0}
+    mix = {}
+    for item in text.split(','):
+        name, _, weight = item.strip().partition('=')
+        if name not in ROUTES:
+            raise ValueError(f"알 수 없는 경로: {name} (사용 가능: {', '.join(ROUTES)})")
+        mix[name] = float(weight) if weight else 1.0
+    mix = {name: weight for name, weight in mix.items() if weight > 0}
+    if not mix:
+        raise ValueError("비율이 0보다 큰 경로가 하나 이상 필요합니다.")
+    return mix
+
+def percentile(sorted_values, fraction):
+    """
+    정렬된 값의 백분위수 (최근접 순위)
+    """
+    if not sorted_values:
+        return None
+    index = max(0, min(len(sorted_values) - 1, int(round(fraction * len(sorted_values) + 0.5)) - 1))
+    return sorted_values[index]
+
+class Client:
+    """
+    keep-alive 연결 하나를 쓰는 HTTP 클라이언트 (스레드마다 하나)
+    """
+
+    def __init__(self, url, timeout=60, accept_encoding='gzip'):
+        parts = urlsplit(url)
+        self.host = parts.hostname
+        self.port = parts.port or 80
+        self.timeout = timeout
+        self.accept_encoding = accept_encoding
+        self.connection = None
+
+    def request(self, method, path, body=None, headers=None):
+        """
+        요청을 보내고 응답 본문까지 읽음 (끊긴 연결은 한 번 다시 연결)
+
+        Returns:
+            tuple: (상태 코드, 응답 헤더 (대소문자 구분 없음), 본문 bytes)
+        """
+        headers = dict(headers or {})
+        if self.accept_encoding:
+            headers.setdefault('Accept-Encoding', self.accept_encoding)
+        payload = None
+        if body is not None:
+            payload = json.dumps(body).encode('utf-8')
+            headers['Content-Type'] = 'application/json'
+        for attempt in range(2):
+            if self.connection is None:
+                self.connection = http.client.HTTPConnection(self.host, self.port, timeout=self.timeout)
+            try:
+                self.connection.request(method, path, body=payload, headers=headers)
+                response = self.connection.getresponse()
+                data = response.read()
+                return response.status, response.headers, data
+            except (http.client.RemoteDisconnected, ConnectionResetError, BrokenPipeError):
+                self.close()
+                if attempt:
+                    raise
+
+    def close(self):
+        if self.connection is not None:
+            self.connection.close()
+            self.connection = None
+
+def _free_port():
+    with socket.socket() as sock:
+        sock.bind(('127.0.0.1', 0))
+        return sock.getsockname()[1]
+
+class LocalServer:
+    """
+    임시 데이터베이스로 실행한 로컬 API 서버 (with 문으로 사용)
+
+    flask: 개발 서버 (threaded), uvicorn: ASGI 진입점 (--workers 프로세스)
+    """
+
+    def __init__(self, kind='flask', workers=1, startup_timeout=60):
+        self.kind = kind
+        self.workers = workers
+        self.startup_timeout = startup_timeout
+        self.port = _free_port()
+        self.url = f'http://127.0.0.1:{self.port}'
+        self.directory = None
+        self.process = None
+        self.log = None
+
+    def _command(self):
+        if self.kind == 'uvicorn':
+            return [
+                sys.executable, '-m', 'uvicorn', 'src.backend.api.src.asgi:app',
+                '--host', '127.0.0.1', '--port', str(self.port), '--workers', str(self.workers), '--log-level', 'warning'
+            ]
+        code = (
+            'from src.backend.api.src.main import create_app; '
+            f'create_app().run(host="127.0.0.1", port={self.port}, threaded=True)'
+        )
+        return [sys.executable, '-c', code]
+
+    def __enter__(self):
+        self.directory = tempfile.TemporaryDirectory()
+        env = dict(os.environ)
+        env['PYTHONPATH'] = PROJECT_ROOT + os.pathsep + env.get('PYTHONPATH', '')
+        env['HEALTH_DB_PATH'] = os.path.join(self.directory.name, 'health.db')
+        env['DATABASE_URL'] = 'sqlite:///' + os.path.join(self.directory.name, 'users.db')
+        env['SEED_SAMPLE_DATA'] = '0'
+        self.log = open(os.path.join(self.directory.name, 'server.log'), 'w+', encoding='utf-8')
+        self.process = subprocess.Popen(self._command(), cwd=PROJECT_ROOT, env=env, stdout=self.log, stderr=subprocess.STDOUT)
+        try:
+            self._wait_ready()
+        except Exception:
+            self.__exit__(None, None, None)
+            raise
+        return self
+
+    def _wait_ready(self):
+        deadline = time.monotonic() + self.startup_timeout
+        client = Client(self.url, timeout=5)
+        while time.monotonic() < deadline:
+            if self.process.poll() is not None:
+                break
+            try:
+                if client.request('GET', '/')[0] == 200:
+                    client.close()
+                    return
+            except OSError:
+                client.close()
+            time.sleep(0.2)
+        self.log.seek(0)
+        raise RuntimeError("서버를 시작하지 못했습니다:\n" + self.log.read()[-4000:])
+
+    def __exit__(self, *exc):
+        if self.process is not None and self.process.poll() is None:
+            self.process.terminate()
+            try:
+                self.process.wait(timeout=10)
+            except subprocess.TimeoutExpired:
+                self.process.kill()
+                self.process.wait()
+        if self.log is not None:
+            self.log.close()
+        if self.directory is not None:
+            self.directory.cleanup()
+
+def prepare_users(url, count, days, concurrency=4):
+    """
+    합성 사용자 가입, 로그인, 샘플 데이터 동기화
+
+    이미 가입된 사용자는 로그인만 합니다 (--url로 기존 서버를 쓸 때).
+
+    Returns:
+        list: 사용자별 JWT 토큰
+    """
+    start_date = (date.today() - timedelta(days=days)).isoformat()
+    end_date = (date.today() - timedelta(days=1)).isoformat()
+
+    def prepare(index):
+        client = Client(url)
+        email = f'load-test-{index}@example.com'
+        client.request('POST', '/api/auth/register', {"email": email, "password": PASSWORD, "name": f"부하 테스트 {index}"})
+        status, _, body = client.request('POST', '/api/auth/login', {"email": email, "password": PASSWORD})
+        if status != 200:
+            raise RuntimeError(f"{email} 로그인 실패 ({status}): {body[:200]!r}")
+        token = json.loads(body)["token"]
+        status, _, body = client.request(
+            'POST', '/api/health_connect/sync', {"start_date": start_date, "end_date": end_date},
+            headers={'Authorization': f'Bearer {token}'}
+        )
+        if status != 200:
+            raise RuntimeError(f"{email} 동기화 실패 ({status}): {body[:200]!r}")
+        client.close()
+        return token
+
+    # 가입/로그인은 서버의 해시 작업 풀 크기에 묶이므로 적은 동시성으로 준비
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        return list(executor.map(prepare, range(count)))
+
+def run_load(url, tokens, mix, concurrency, duration=None, total_requests=None, warmup=0.0,
+             etag=False, days=30, seed=0, accept_encoding='gzip'):
+    """
+    부하 생성 (duration초 동안 또는 total_requests건, 워밍업 요청은 통계에서 제외)
+
+    Returns:
+        tuple: (경로 이름 -> [(상태 코드 또는 오류 이름, 지연 시간 초)], 측정 시간 초)
+    """
+    names = list(mix)
+    weights = [mix[name] for name in names]
+    samples = {name: [] for name in names}
+    samples_lock = threading.Lock()
+    remaining = [total_requests]
+    started = time.monotonic()
+    measure_from = started + warmup
+    stop_at = measure_from + duration if duration else None
+
+    def take_request():
+        # 요청 수 기준이면 남은 건수를 나눠 가짐 (워밍업 요청은 세지 않음)
+        if stop_at is not None:
+            return time.monotonic() < stop_at
+        if time.monotonic() < measure_from:
+            return True
+        with samples_lock:
+            if remaining[0] <= 0:
+                return False
+            remaining[0] -= 1
+            return True
+
+    def worker(index):
+        rng = random.Random(seed + index)
+        client = Client(url, accept_encoding=accept_encoding)
+        etags = {}
+        local = {name: [] for name in names}
+        token = tokens[index % len(tokens)]
+        while take_request():
+            name = rng.choices(names, weights)[0]
+            method, path, body_factory, _ = ROUTES[name]
+            headers = {'Authorization': f'Bearer {token}'}
+            body = None
+            if name == 'login':
+                body = {"email": f'load-test-{index % len(tokens)}@example.com', "password": PASSWORD}
+            elif body_factory is not None:
+                body = body_factory(rng, days)
+            if etag and (token, name) in etags:
+                headers['If-None-Match'] = etags[(token, name)]
+            request_started = time.monotonic()
+            try:
+                status, response_headers, _ = client.request(method, path, body, headers)
+            except (OSError, http.client.HTTPException) as e:
+                status, response_headers = type(e).__name__, {}
+                client.close()
+            finished = time.monotonic()
+            if response_headers.get('ETag'):
+                etags[(token, name)] = response_headers.get('ETag')
+            if request_started >= measure_from:
+                local[name].append((status, finished - request_started))
+        client.close()
+        with samples_lock:
+            for name, values in local.items():
+                samples[name].extend(values)
+
+    threads = [threading.Thread(target=worker, args=(index,), daemon=True) for index in range(concurrency)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return samples, time.monotonic() - measure_from
+
+def summarize(samples, elapsed):
+    """
+    경로별 처리량, 상태 코드, 지연 시간 백분위수 (ms)
+
+    2xx와 304는 성공, 그 밖의 상태 코드와 연결 오류는 실패로 셉니다.
+    """
+
+    def stats(values):
+        latencies = sorted(latency for _, latency in values)
+        status_counts = {}
+        for status, _ in values:
+            status_counts[str(status)] = status_counts.get(str(status), 0) + 1
+        errors = sum(1 for status, _ in values if not (isinstance(status, int) and (200 <= status < 300 or status == 304)))
+        result = {
+            "requests": len(values),
+            "errors": errors,
+            "throughput_rps": round(len(values) / elapsed, 2) if elapsed > 0 else None,
+            "status_counts": status_counts
+        }
+        if latencies:
+            result["latency_ms"] = {
+                "mean": round(sum(latencies) / len(latencies) * 1000, 2),
+                "p50": round(percentile(latencies, 0.50) * 1000, 2),
+                "p95": round(percentile(latencies, 0.95) * 1000, 2),
+                "p99": round(percentile(latencies, 0.99) * 1000, 2),
+                "max": round(latencies[-1] * 1000, 2)
+            }
+        return result
+
+    return {
+        "elapsed_seconds": round(elapsed, 3),
+        "total": stats([value for values in samples.values() for value in values]),
+        "routes": {name: stats(values) for name, values in samples.items() if values}
+    }
+
+def main():
+    parser = argparse.ArgumentParser(description='API 부하 테스트')
+    parser.add_argument('--url', help='대상 서버 URL (없으면 임시 데이터베이스로 로컬 서버 실행)')
+    parser.add_argument('--server', choices=('flask', 'uvicorn'), default='flask', help='로컬 서버 종류')
+    parser.add_argument('--workers', type=int, default=1, help='uvicorn 워커 프로세스 수')
+    parser.add_argument('--users', type=int, default=10, help='합성 사용자 수')
+    parser.add_argument('--days', type=int, default=30, help='사용자별 동기화할 데이터 기간 (일)')
+    parser.add_argument('--concurrency', type=int, default=8, help='동시 클라이언트 수')
+    parser.add_argument('--duration', type=float, default=20.0, help='측정 시간 (초)')
+    parser.add_argument('--requests', type=int, help='측정 요청 수 (지정하면 --duration 대신 사용)')
+    parser.add_argument('--warmup', type=float, default=2.0, help='통계에서 제외할 워밍업 시간 (초)')
+    parser.add_argument('--mix', help=f'경로 비율 (예: sleep_summary=3,sleep=1, 경로: {", ".join(ROUTES)})')
+    parser.add_argument('--etag', action='store_true', help='마지막 ETag를 If-None-Match로 전송')
+    parser.add_argument('--accept-encoding', default='gzip', help='Accept-Encoding 헤더 (빈 문자열이면 보내지 않음)')
+    parser.add_argument('--seed', type=int, default=0, help='요청 순서 난수 시드')
+    parser.add_argument('--output', help='결과 JSON 파일 경로')
+    args = parser.parse_args()
+
+    try:
+        mix = parse_mix(args.mix)
+    except ValueError as e:
+        parser.error(str(e))
+
+    def run(url):
+        tokens = prepare_users(url, args.users, args.days)
+        samples, elapsed = run_load(
+            url, tokens, mix, args.concurrency,
+            duration=None if args.requests else args.duration, total_requests=args.requests,
+            warmup=args.warmup, etag=args.etag, days=args.days, seed=args.seed,
+            accept_encoding=args.accept_encoding
+        )
+        return summarize(samples, elapsed)
+
+    if args.url:
+        result = run(args.url.rstrip('/'))
+    else:
+        with LocalServer(args.server, args.workers) as server:
+            result = run(server.url)
+
+    result = {
+        "config": {
+            "server": args.url or args.server,
+            "workers": None if args.url else args.workers,
+            "users": args.users,
+            "days": args.days,
+            "concurrency": args.concurrency,
+            "duration": None if args.requests else args.duration,
+            "requests": args.requests,
+            "warmup": args.warmup,
+            "etag": args.etag,
+            "accept_encoding": args.accept_encoding,
+            "mix": mix
+        },
+        **result
+    }
+
+    text = json.dumps(result, indent=2, ensure_ascii=False)
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            f.write(text + '\n')
+    print(text)
+
+if __name__ == '__main__':
+    main()
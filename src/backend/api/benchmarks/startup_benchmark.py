@@ -0,0 +1,120 @@
+"""
+API 서버 시작 시간 벤치마크
+
+새 프로세스에서 main 모듈 import, create_app(), 첫 요청(GET /), 첫 분석 요청까지의
+시간을 여러 번 측정해 중앙값을 출력합니다. 매 실행마다 임시 데이터베이스를 사용합니다.
+
+    python src/backend/api/benchmarks/startup_benchmark.py --runs 5
+    python src/backend/api/benchmarks/startup_benchmark.py --importtime 15
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+
+PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '../../../../'))
+
+# 자식 프로세스에서 실행할 측정 코드 (결과는 마지막 줄에 JSON으로 출력)
+_MEASURE = r'''
+import json, resource, sys, time
+started = time.perf_counter()
+from src.backend.api.src.main import create_app
+imported = time.perf_counter()
+app = create_app()
+created = time.perf_counter()
+client = app.test_client()
+client.get('/')
+first_request = time.perf_counter()
+result = {
+    "import_seconds": imported - started,
+    "create_app_seconds": created - imported,
+    "first_request_seconds": first_request - created,
+    "pandas_loaded_at_startup": "pandas" in sys.modules
+}
+if ANALYSIS:
+    token = client.post('/api/auth/login', json={"email": "test@example.com", "password": "password123"}).get_json()["token"]
+    before = time.perf_counter()
+    client.get('/api/analysis/sleep_summary', headers={"Authorization": "Bearer " + token})
+    result["first_analysis_seconds"] = time.perf_counter() - before
+result["total_seconds"] = time.perf_counter() - started
+result["max_rss_mb"] = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+print(json.dumps(result))
+'''
+
+def _child_env(directory, seed):
+    """
+    측정용 자식 프로세스 환경 변수 (임시 데이터베이스 사용)
+    """
+    env = dict(os.environ)
+    env['PYTHONPATH'] = PROJECT_ROOT + os.pathsep + env.get('PYTHONPATH', '')
+    env['HEALTH_DB_PATH'] = os.path.join(directory, 'health.db')
+    env['DATABASE_URL'] = 'sqlite:///' + os.path.join(directory, 'users.db')
+    env['SEED_SAMPLE_DATA'] = '1' if seed else '0'
+    return env
+
+def run_once(seed=True, analysis=True):
+    """
+    새 프로세스에서 한 번 측정
+
+    Returns:
+        dict: 단계별 소요 시간 (초)
+    """
+    with tempfile.TemporaryDirectory() as directory:
+        code = _MEASURE.replace('ANALYSIS', 'True' if analysis and seed else 'False')
+        output = subprocess.run(
+            [sys.executable, '-c', code], cwd=PROJECT_ROOT, env=_child_env(directory, seed),
+            capture_output=True, text=True, check=True
+        )
+    return json.loads(output.stdout.strip().splitlines()[-1])
+
+def import_profile(top=15):
+    """
+    -X importtime 결과에서 누적 import 시간이 큰 모듈 목록
+
+    Returns:
+        list: (모듈, 누적 시간 ms) 목록
+    """
+    with tempfile.TemporaryDirectory() as directory:
+        output = subprocess.run(
+            [sys.executable, '-X', 'importtime', '-c', 'import src.backend.api.src.main'],
+            cwd=PROJECT_ROOT, env=_child_env(directory, False), capture_output=True, text=True, check=True
+        )
+    modules = []
+    for line in output.stderr.splitlines():
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+        _, cumulative, name = line[len('import time:'):].split('|')
+        modules.append((name.strip(), int(cumulative) / 1000))
+    modules.sort(key=lambda item: item[1], reverse=True)
+    return modules[:top]
+
+def main():
+    parser = argparse.ArgumentParser(description='API 서버 시작 시간 벤치마크')
+    parser.add_argument('--runs', type=int, default=5, help='측정 횟수')
+    parser.add_argument('--no-seed', action='store_true', help='샘플 데이터 저장 없이 측정 (첫 분석 요청 측정 생략)')
+    parser.add_argument('--importtime', type=int, metavar='N', help='누적 import 시간 상위 N개 모듈 출력')
+    parser.add_argument('--output', help='결과 JSON 파일 경로')
+    args = parser.parse_args()
+
+    runs = [run_once(seed=not args.no_seed) for _ in range(args.runs)]
+    metrics = [key for key, value in runs[0].items() if isinstance(value, float)]
+    result = {
+        "runs": args.runs,
+        "median": {key: round(statistics.median(run[key] for run in runs), 4) for key in metrics},
+        "min": {key: round(min(run[key] for run in runs), 4) for key in metrics},
+        "pandas_loaded_at_startup": any(run["pandas_loaded_at_startup"] for run in runs)
+    }
+    if args.importtime:
+        result["slowest_imports_ms"] = import_profile(args.importtime)
+
+    text = json.dumps(result, indent=2, ensure_ascii=False)
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            f.write(text + '\n')
+    print(text)
+
+if __name__ == '__main__':
+    main()
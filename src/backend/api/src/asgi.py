@@ -0,0 +1,286 @@
+"""
+ASGI 서버 진입점
+
+    uvicorn src.backend.api.src.asgi:app --host 0.0.0.0 --port 5000
+
+업스트림 I/O가 대부분인 Health Connect 동기화(POST /api/health_connect/sync)는
+이벤트 루프에서 비동기로 처리하고, 나머지 경로는 Flask 앱(WSGI)을 스레드 풀에서
+실행합니다. 분석 등 CPU 작업은 스레드 풀에서 실행되므로 이벤트 루프를 막지 않습니다.
+
+업스트림을 호출하는 경로는 동기화뿐입니다 (분석 및 데이터 조회 경로는 저장소만 읽음).
+동기화 경로는 Flask를 거치지 않으므로 요청 측정 항목(/metrics)은 직접 기록하고,
+응답 압축(작은 JSON 응답)과 요청 프로파일링(대기 시간 대부분이 await)은 적용하지 않습니다.
+"""
+import asyncio
+import json
+import os
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from tempfile import SpooledTemporaryFile
+
+PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '../../../../'))
+if PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT)
+
+import jwt
+
+# ASGI 모드에는 asgiref가 필요 (pip install asgiref uvicorn aiohttp)
+try:
+    from asgiref.sync import async_to_sync, sync_to_async
+except ImportError as e:
+    raise ImportError("ASGI 모드에는 asgiref가 필요합니다. (pip install asgiref uvicorn aiohttp)") from e
+
+from src.backend.api.src.main import CORS_HEADERS, create_app
+from src.backend.api.src.models.health_store import get_health_store
+from src.backend.api.src.routes.health_connect import parse_sync_request
+from src.backend.api.src.services.health_connect_sync import async_sync_user_data
+from src.backend.api.src.utils.auth import verify_token
+from src.backend.api.src.utils.json_provider import dumps
+from src.backend.api.src.utils.metrics import http_requests_in_flight, observe_request
+from src.data_analysis.src.async_health_connect_client import AsyncHealthConnectClient
+from src.data_analysis.src.health_connect_schema import RecordValidationError
+
+# 비동기로 처리하는 경로 (method, path)
+SYNC_ROUTE = ('POST', '/api/health_connect/sync')
+
+# 요청 본문 최대 크기 (바이트)
+MAX_BODY_BYTES = 64 * 1024
+
+# WSGI 요청 본문을 메모리에 둘 최대 크기 (넘으면 임시 파일 사용)
+WSGI_BODY_SPOOL_BYTES = 64 * 1024
+
+def _build_environ(scope, body):
+    """
+    ASGI HTTP scope와 요청 본문으로 WSGI environ 생성
+    """
+    script_name = scope.get('root_path', '').encode('utf-8').decode('latin-1')
+    path_info = scope['path'].encode('utf-8').decode('latin-1')
+    if script_name and path_info.startswith(script_name):
+        path_info = path_info[len(script_name):]
+    server = scope.get('server') or ('localhost', 80)
+    environ = {
+        'REQUEST_METHOD': scope['method'],
+        'SCRIPT_NAME': script_name,
+        'PATH_INFO': path_info,
+        'QUERY_STRING': scope['query_string'].decode('latin-1'),
+        'SERVER_NAME': server[0],
+        'SERVER_PORT': str(server[1]),
+        'SERVER_PROTOCOL': f"HTTP/{scope.get('http_version', '1.1')}",
+        'wsgi.version': (1, 0),
+        'wsgi.url_scheme': scope.get('scheme', 'http'),
+        'wsgi.input': body,
+        'wsgi.errors': sys.stderr,
+        'wsgi.multithread': True,
+        'wsgi.multiprocess': True,
+        'wsgi.run_once': False
+    }
+    if scope.get('client'):
+        environ['REMOTE_ADDR'] = scope['client'][0]
+    for name, value in scope.get('headers', []):
+        name = name.decode('latin-1').upper().replace('-', '_')
+        if name not in ('CONTENT_LENGTH', 'CONTENT_TYPE'):
+            name = 'HTTP_' + name
+        value = value.decode('latin-1')
+        # 같은 이름의 헤더는 쉼표로 합침
+        environ[name] = environ[name] + ',' + value if name in environ else value
+    return environ
+
+class PooledWsgi:
+    """
+    Flask 앱(WSGI)을 요청마다 이벤트 루프 기본 스레드 풀에서 실행하는 ASGI 어댑터
+
+    asgiref의 WsgiToAsgi는 thread_sensitive=True로 모든 WSGI 요청을 한 스레드에서
+    순서대로 실행하므로, sync_to_async(thread_sensitive=False)로 직접 감쌉니다.
+    응답 본문은 WSGI 앱이 반환하는 조각마다 바로 전송합니다 (스트리밍 응답 유지).
+    """
+
+    def __init__(self, wsgi_app):
+        self.wsgi_app = wsgi_app
+
+    async def __call__(self, scope, receive, send):
+        with SpooledTemporaryFile(max_size=WSGI_BODY_SPOOL_BYTES) as body:
+            while True:
+                message = await receive()
+                if message['type'] == 'http.disconnect':
+                    return
+                body.write(message.get('body', b''))
+                if not message.get('more_body'):
+                    break
+            body.seek(0)
+            await sync_to_async(self._run, thread_sensitive=False)(scope, body, async_to_sync(send))
+
+    def _run(self, scope, body, send):
+        """
+        WSGI 앱 실행 (풀의 스레드에서 호출, send는 동기 함수로 감싼 ASGI send)
+        """
+        response_start = {}
+        started = False
+
+        def start_response(status, headers, exc_info=None):
+            if exc_info and started:
+                raise exc_info[1].with_traceback(exc_info[2])
+            response_start.update({
+                'type': 'http.response.start',
+                'status': int(status.split(' ', 1)[0]),
+                'headers': [(name.lower().encode('latin-1'), value.encode('latin-1')) for name, value in headers]
+            })
+
+        def send_start():
+            nonlocal started
+            if not started:
+                started = True
+                send(response_start)
+
+        result = self.wsgi_app(_build_environ(scope, body), start_response)
+        try:
+            for chunk in result:
+                if chunk:
+                    send_start()
+                    send({'type': 'http.response.body', 'body': chunk, 'more_body': True})
+        finally:
+            if hasattr(result, 'close'):
+                result.close()
+        send_start()
+        send({'type': 'http.response.body'})
+
+class HealthConnectASGI:
+    """
+    Flask 앱을 감싸고 I/O 위주 경로를 비동기로 처리하는 ASGI 앱
+    """
+
+    def __init__(self, wsgi_app, worker_threads=None, max_upstream_concurrency=None, client=None):
+        """
+        HealthConnectASGI 초기화
+
+        Args:
+            wsgi_app (Flask): Flask 앱
+            worker_threads (int): WSGI 요청 및 CPU 작업 스레드 수 (기본값: ASGI_WORKER_THREADS 환경 변수 또는 32)
+            max_upstream_concurrency (int): 최대 동시 업스트림 요청 수 (기본값: HEALTH_CONNECT_MAX_CONCURRENCY 환경 변수 또는 1000)
+            client (AsyncHealthConnectClient): 비동기 클라이언트 (선택, 속도 제한기나 디스크 캐시를 쓸 때 전달)
+        """
+        self.wsgi_app = wsgi_app
+        self.wsgi = PooledWsgi(wsgi_app)
+        self.worker_threads = worker_threads or int(os.environ.get('ASGI_WORKER_THREADS', 32))
+        self.max_upstream_concurrency = max_upstream_concurrency or int(os.environ.get('HEALTH_CONNECT_MAX_CONCURRENCY', 1000))
+        self.executor = None
+        self.client = client
+
+    def _startup(self):
+        """
+        이벤트 루프 안에서 스레드 풀과 비동기 클라이언트 생성
+        """
+        if self.executor is None:
+            self.executor = ThreadPoolExecutor(max_workers=self.worker_threads, thread_name_prefix='asgi-worker')
+            asyncio.get_running_loop().set_default_executor(self.executor)
+            if self.client is None:
+                self.client = AsyncHealthConnectClient(max_concurrency=self.max_upstream_concurrency)
+
+    async def _shutdown(self):
+        if self.client is not None:
+            await self.client.close()
+        if self.executor is not None:
+            self.executor.shutdown(wait=False)
+
+    async def __call__(self, scope, receive, send):
+        if scope['type'] == 'lifespan':
+            await self._lifespan(receive, send)
+            return
+
+        # lifespan을 지원하지 않는 서버에서도 첫 요청에서 초기화
+        self._startup()
+
+        if scope['type'] == 'http' and (scope['method'], scope['path']) == SYNC_ROUTE:
+            await self._handle_sync(scope, receive, send)
+        else:
+            await self.wsgi(scope, receive, send)
+
+    async def _lifespan(self, receive, send):
+        while True:
+            message = await receive()
+            if message['type'] == 'lifespan.startup':
+                self._startup()
+                await send({'type': 'lifespan.startup.complete'})
+            elif message['type'] == 'lifespan.shutdown':
+                await self._shutdown()
+                await send({'type': 'lifespan.shutdown.complete'})
+                return
+
+    async def _handle_sync(self, scope, receive, send):
+        """
+        POST /api/health_connect/sync 비동기 처리 (요청 측정 항목은 Flask 훅과 같은 레이블로 기록)
+        """
+        method, route = SYNC_ROUTE
+        started = time.perf_counter()
+        http_requests_in_flight.inc(method=method, route=route)
+        try:
+            status, payload = await self._sync_response(scope, receive)
+            size = await self._send_json(send, status, payload)
+            observe_request(method, route, status, time.perf_counter() - started, size)
+        finally:
+            http_requests_in_flight.dec(method=method, route=route)
+
+    async def _sync_response(self, scope, receive):
+        """
+        POST /api/health_connect/sync 응답 상태와 본문 (WSGI 구현과 같은 인증, 검증, 응답 형식)
+
+        Returns:
+            tuple: (상태 코드, 응답 dict)
+        """
+        headers = {key.decode('latin-1').lower(): value.decode('latin-1') for key, value in scope['headers']}
+
+        # 인증 (검증된 토큰은 캐시되어 있어 이벤트 루프에서 바로 확인)
+        auth_header = headers.get('authorization', '')
+        token = auth_header[len('Bearer '):].strip() if auth_header.startswith('Bearer ') else ''
+        if not token:
+            return 401, {"success": False, "message": "유효한 인증 토큰이 필요합니다."}
+        try:
+            user = verify_token(token)
+        except jwt.ExpiredSignatureError:
+            return 401, {"success": False, "message": "토큰이 만료되었습니다."}
+        except jwt.InvalidTokenError:
+            return 401, {"success": False, "message": "유효하지 않은 토큰입니다."}
+
+        # 요청 본문
+        body = b''
+        while True:
+            message = await receive()
+            body += message.get('body', b'')
+            if len(body) > MAX_BODY_BYTES:
+                return 413, {"success": False, "message": "요청 본문이 너무 큽니다."}
+            if not message.get('more_body'):
+                break
+        try:
+            data = json.loads(body) if body else {}
+        except ValueError:
+            data = None
+
+        start_date, end_date, error = parse_sync_request(data)
+        if error:
+            return 400, {"success": False, "message": error}
+
+        try:
+            counts = await async_sync_user_data(
+                get_health_store(), user['email'], self.client, start_date, end_date, executor=self.executor
+            )
+        except RecordValidationError as e:
+            return 502, {"success": False, "message": f"업스트림 데이터가 올바르지 않습니다: {e}"}
+        except Exception as e:
+            return 502, {"success": False, "error": str(e)}
+
+        return 200, {"success": True, "stored": counts}
+
+    @staticmethod
+    async def _send_json(send, status, payload):
+        body = dumps(payload).encode('utf-8')
+        headers = [(b'content-type', b'application/json'), (b'content-length', str(len(body)).encode())]
+        headers += [(name.lower().encode(), value.encode()) for name, value in CORS_HEADERS]
+        await send({'type': 'http.response.start', 'status': status, 'headers': headers})
+        await send({'type': 'http.response.body', 'body': body})
+        return len(body)
+
+app = HealthConnectASGI(create_app())
+
+if __name__ == '__main__':
+    import uvicorn
+    uvicorn.run(app, host='0.0.0.0', port=int(os.environ.get('PORT', 5000)))
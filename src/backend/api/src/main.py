@@ -8,61 +8,133 @@ if PROJECT_ROOT not in sys.path:
     sys.path.insert(0, PROJECT_ROOT)
 
 from flask import Flask, jsonify, send_from_directory
-from src.backend.api.src.routes.health_connect import health_connect_bp
+from src.backend.api.src.routes.health_connect import health_connect_bp, seed_sample_data
 from src.backend.api.src.routes.analysis import analysis_bp
-from src.backend.api.src.routes.auth import auth_bp
+from src.backend.api.src.routes.auth import auth_bp, seed_test_user
+from src.backend.api.src.models.user import db
+from src.backend.api.src.utils.compression import init_compression
+from src.backend.api.src.utils.metrics import init_metrics
+from src.backend.api.src.utils.profiler import init_profiler
+from src.backend.api.src.utils.json_provider import FastJSONProvider
 
-# Flask 앱 초기화
-app = Flask(__name__)
+# 인스턴스 디렉토리 (로컬 SQLite 파일 위치)
+INSTANCE_PATH = os.path.abspath(os.path.join(os.path.dirname(__file__), '../instance'))
 
-# 블루프린트 등록
-app.register_blueprint(health_connect_bp, url_prefix='/api/health_connect')
-app.register_blueprint(analysis_bp, url_prefix='/api/analysis')
-app.register_blueprint(auth_bp, url_prefix='/api/auth')
+# CORS 설정 (ASGI 모드의 비동기 경로도 같은 헤더 사용)
+CORS_HEADERS = (
+    ('Access-Control-Allow-Origin', '*'),
+    ('Access-Control-Allow-Headers', 'Content-Type,Authorization,If-None-Match'),
+    ('Access-Control-Expose-Headers', 'ETag,Content-Encoding'),
+    ('Access-Control-Allow-Methods', 'GET,PUT,POST,DELETE,OPTIONS')
+)
 
-# 데이터베이스 설정 (필요시 주석 해제)
-# app.config['SQLALCHEMY_DATABASE_URI'] = f"mysql+pymysql://{os.getenv('DB_USERNAME', 'root')}:{os.getenv('DB_PASSWORD', 'password')}@{os.getenv('DB_HOST', 'localhost')}:{os.getenv('DB_PORT', '3306')}/{os.getenv('DB_NAME', 'mydb')}"
-# app.config['SQLALCHEMY_TRACK_MODIFICATIONS'] = False
+def _database_uri(instance_path):
+    """
+    사용자 데이터베이스 URI (DATABASE_URL > DB_HOST(MySQL) > 로컬 SQLite 순서로 사용)
+    """
+    if os.getenv('DATABASE_URL'):
+        return os.getenv('DATABASE_URL')
+    if os.getenv('DB_HOST'):
+        return f"mysql+pymysql://{os.getenv('DB_USERNAME', 'root')}:{os.getenv('DB_PASSWORD', 'password')}@{os.getenv('DB_HOST', 'localhost')}:{os.getenv('DB_PORT', '3306')}/{os.getenv('DB_NAME', 'mydb')}"
+    os.makedirs(instance_path, exist_ok=True)
+    return f"sqlite:///{os.path.join(instance_path, 'users.db')}"
 
-# CORS 설정
-@app.after_request
-def after_request(response):
-    response.headers.add('Access-Control-Allow-Origin', '*')
-    response.headers.add('Access-Control-Allow-Headers', 'Content-Type,Authorization')
-    response.headers.add('Access-Control-Allow-Methods', 'GET,PUT,POST,DELETE,OPTIONS')
-    return response
-
-# 루트 경로
-@app.route('/')
-def index():
-    return jsonify({
-        "name": "수면 데이터 분석 API",
-        "version": "1.0.0",
-        "status": "running"
-    })
-
-# 정적 파일 제공 (프론트엔드 배포용)
-@app.route('/<path:path>')
-def serve_static(path):
-    return send_from_directory('static', path)
-
-# 에러 핸들러
-@app.errorhandler(404)
-def not_found(error):
-    return jsonify({
-        "success": False,
-        "error": 404,
-        "message": "리소스를 찾을 수 없습니다."
-    }), 404
-
-@app.errorhandler(500)
-def server_error(error):
-    return jsonify({
-        "success": False,
-        "error": 500,
-        "message": "서버 내부 오류가 발생했습니다."
-    }), 500
+def create_app(config=None, seed=None):
+    """
+    Flask 앱 생성
+    
+    분석 모듈(pandas 등)과 무거운 전역 객체는 첫 요청에서 생성되므로
+    앱 생성은 라우트 등록과 데이터베이스 준비만 수행합니다.
+    
+    Args:
+        config (dict): 추가 설정 (SQLALCHEMY_DATABASE_URI 등, 선택)
+        seed (bool): 테스트 사용자 및 샘플 데이터 저장 여부 (기본값: SEED_SAMPLE_DATA 환경 변수, 기본 저장)
+        
+    Returns:
+        Flask: Flask 앱
+    """
+    app = Flask(__name__, instance_path=INSTANCE_PATH)
+    
+    # 사용자 데이터베이스 설정
+    app.config['SQLALCHEMY_DATABASE_URI'] = _database_uri(app.instance_path)
+    app.config['SQLALCHEMY_TRACK_MODIFICATIONS'] = False
+    if config:
+        app.config.update(config)
+    
+    # 연결 풀 설정 - 워커 프로세스마다 풀이 생기므로 (워커 스레드 수 + 여유분)에 맞춤
+    if not app.config['SQLALCHEMY_DATABASE_URI'].startswith('sqlite'):
+        app.config.setdefault('SQLALCHEMY_ENGINE_OPTIONS', {
+            'pool_size': int(os.getenv('DB_POOL_SIZE', 5)),
+            'max_overflow': int(os.getenv('DB_MAX_OVERFLOW', 5)),
+            'pool_timeout': int(os.getenv('DB_POOL_TIMEOUT', 10)),
+            # 서버의 유휴 연결 종료 전에 재연결하고, 끊긴 연결은 사용 전에 확인
+            'pool_recycle': int(os.getenv('DB_POOL_RECYCLE', 1800)),
+            'pool_pre_ping': True
+        })
+    
+    # JSON 직렬화 (NumPy/pandas 타입 직접 처리), 요청/분석 측정 항목(/metrics) 및 응답 압축
+    app.json = FastJSONProvider(app)
+    init_metrics(app)
+    # 요청 프로파일링 (PROFILE_TOKEN 또는 PROFILE_SAMPLE_RATE가 설정된 경우에만 활성화)
+    init_profiler(app)
+    init_compression(app, min_size=int(os.environ.get('COMPRESS_MIN_SIZE', 1024)))
+    
+    # 블루프린트 등록
+    app.register_blueprint(health_connect_bp, url_prefix='/api/health_connect')
+    app.register_blueprint(analysis_bp, url_prefix='/api/analysis')
+    app.register_blueprint(auth_bp, url_prefix='/api/auth')
+    
+    db.init_app(app)
+    with app.app_context():
+        db.create_all()
+    
+    # 테스트 사용자 및 건강 데이터 샘플 (저장소가 비어 있을 때만 저장)
+    if seed is None:
+        seed = os.environ.get('SEED_SAMPLE_DATA', '1') != '0'
+    if seed:
+        with app.app_context():
+            seed_test_user()
+        seed_sample_data()
+    
+    @app.after_request
+    def after_request(response):
+        for name, value in CORS_HEADERS:
+            response.headers.add(name, value)
+        return response
+    
+    # 루트 경로
+    @app.route('/')
+    def index():
+        return jsonify({
+            "name": "수면 데이터 분석 API",
+            "version": "1.0.0",
+            "status": "running"
+        })
+    
+    # 정적 파일 제공 (프론트엔드 배포용)
+    @app.route('/<path:path>')
+    def serve_static(path):
+        return send_from_directory('static', path)
+    
+    # 에러 핸들러
+    @app.errorhandler(404)
+    def not_found(error):
+        return jsonify({
+            "success": False,
+            "error": 404,
+            "message": "리소스를 찾을 수 없습니다."
+        }), 404
+    
+    @app.errorhandler(500)
+    def server_error(error):
+        return jsonify({
+            "success": False,
+            "error": 500,
+            "message": "서버 내부 오류가 발생했습니다."
+        }), 500
+    
+    return app
 
 # 앱 실행
 if __name__ == '__main__':
-    app.run(host='0.0.0.0', port=5000, debug=True)
+    create_app().run(host='0.0.0.0', port=5000, debug=True)
@@ -0,0 +1,475 @@
+"""
+오래된 수면/활동/스트레스 데이터의 Parquet 보관소
+
+최근 데이터(hot window)는 SQLite 저장소에 두고, 그 이전 데이터는 사용자 버킷과 월로
+파티션한 Parquet 파일로 옮깁니다. 장기 추세, 상관관계, 코호트 분석은 필요한 컬럼과
+날짜 범위만 압축된 컬럼 단위로 읽습니다.
+
+    <root>/<record_type>/user_bucket=<n>/month=<YYYY-MM>/part-0.parquet
+
+보관 작업 (HEALTH_ARCHIVE_HOT_DAYS일 이전 데이터 이동):
+
+    python -m src.backend.api.src.models.health_archive --hot-days 365
+"""
+import argparse
+import itertools
+import json
+import os
+import threading
+import zlib
+from datetime import date, timedelta
+from src.backend.api.src.models.health_store import TABLES, HealthDataStore, get_health_store
+from src.data_analysis.src.health_connect_schema import get_schema
+
+# Parquet 보관소에는 pyarrow가 필요 (pip install pyarrow) - 불러오는 비용이 크므로
+# 보관소를 처음 사용할 때 불러옴 (앱 시작 시간 단축)
+pa = ds = pq = None
+_pyarrow_missing = False
+
+def _load_pyarrow():
+    """
+    pyarrow 모듈 불러오기
+
+    Returns:
+        bool: 사용 가능하면 True
+    """
+    global pa, ds, pq, _pyarrow_missing
+    if pa is None and not _pyarrow_missing:
+        try:
+            import pyarrow
+            import pyarrow.dataset
+            import pyarrow.parquet
+        except ImportError:
+            _pyarrow_missing = True
+            return False
+        pa, ds, pq = pyarrow, pyarrow.dataset, pyarrow.parquet
+    return pa is not None
+
+# 보관 대상 레코드 유형 (피드백은 양이 적어 저장소에 유지)
+ARCHIVE_RECORD_TYPES = ("sleep", "activity", "stress")
+
+# 사용자 버킷 수 기본값 (보관소를 처음 만들 때만 적용)
+DEFAULT_BUCKETS = 64
+
+# 메타데이터 파일 이름 - 버킷 수와 레코드 유형별 보관 기준 날짜(watermark)
+METADATA_FILE = "_archive.json"
+
+# SQLite 컬럼 타입별 Parquet 타입 (날짜/시간은 저장소와 같은 ISO 문자열)
+_ARROW_TYPES = {
+    "TEXT": "string",
+    "INTEGER": "int64",
+    "REAL": "float64"
+}
+
+def _partition_schema():
+    """
+    파티션 디렉터리 필드 스키마 (user_bucket, month)
+    """
+    return pa.schema([("user_bucket", pa.int32()), ("month", pa.string())])
+
+def user_bucket(user_id, buckets):
+    """
+    사용자 식별자의 버킷 번호 (프로세스와 관계없이 같은 값)
+    """
+    return zlib.crc32(user_id.encode("utf-8")) % buckets
+
+def _next_month(month):
+    """
+    다음 달 첫날 (YYYY-MM -> YYYY-MM-DD)
+    """
+    year, number = int(month[:4]), int(month[5:7])
+    return f"{year + number // 12:04d}-{number % 12 + 1:02d}-01"
+
+class HealthArchive:
+    """
+    사용자 버킷/월 파티션 Parquet 보관소
+    """
+
+    def __init__(self, root, buckets=DEFAULT_BUCKETS):
+        """
+        HealthArchive 초기화
+
+        Args:
+            root (str): 보관소 디렉터리
+            buckets (int): 사용자 버킷 수 (기존 보관소는 메타데이터의 값 사용)
+        """
+        if not _load_pyarrow():
+            raise ImportError("Parquet 보관소에는 pyarrow가 필요합니다. (pip install pyarrow)")
+        self.root = root
+        self._lock = threading.Lock()
+        # 메타데이터는 보관 작업(별도 프로세스)이 바꿀 수 있으므로 파일 수정 시각으로 캐시
+        self._metadata = {"buckets": buckets, "watermarks": {}}
+        self._metadata_mtime = None
+        self._datasets = {}
+        self._load_metadata()
+
+    @property
+    def buckets(self):
+        return self._metadata["buckets"]
+
+    def _metadata_path(self):
+        return os.path.join(self.root, METADATA_FILE)
+
+    def _load_metadata(self):
+        """
+        메타데이터 파일이 바뀌었으면 다시 읽음 (데이터셋 캐시도 초기화)
+        """
+        try:
+            mtime = os.stat(self._metadata_path()).st_mtime_ns
+        except FileNotFoundError:
+            return self._metadata
+        with self._lock:
+            if mtime != self._metadata_mtime:
+                with open(self._metadata_path(), encoding="utf-8") as f:
+                    self._metadata = json.load(f)
+                self._metadata_mtime = mtime
+                self._datasets = {}
+        return self._metadata
+
+    def _save_metadata(self):
+        os.makedirs(self.root, exist_ok=True)
+        temp_path = self._metadata_path() + ".tmp"
+        with open(temp_path, "w", encoding="utf-8") as f:
+            json.dump(self._metadata, f)
+        os.replace(temp_path, self._metadata_path())
+
+    def watermark(self, record_type):
+        """
+        레코드 유형의 보관 기준 날짜 (이 날짜 이전 데이터는 보관소에 있음, 없으면 None)
+        """
+        return self._load_metadata()["watermarks"].get(record_type)
+
+    def covers(self, record_type, start_date=None):
+        """
+        조회 범위에 보관된 데이터가 포함될 수 있는지 확인
+
+        Args:
+            record_type (str): 레코드 유형
+            start_date (str): 조회 시작 날짜 (YYYY-MM-DD, 선택)
+
+        Returns:
+            bool: 보관소도 조회해야 하면 True
+        """
+        watermark = self.watermark(record_type)
+        return watermark is not None and (not start_date or start_date < watermark)
+
+    @staticmethod
+    def _arrow_schema(record_type):
+        """
+        파티션 파일의 Arrow 스키마 (user_id, day, 저장소 테이블 컬럼)
+        """
+        fields = [("user_id", pa.string()), ("day", pa.string())]
+        fields += [(column, pa.type_for_alias(_ARROW_TYPES[sql_type]))
+                   for column, sql_type in HealthDataStore._columns(record_type)]
+        return pa.schema(fields)
+
+    def _partition_path(self, record_type, bucket, month):
+        return os.path.join(self.root, record_type, f"user_bucket={bucket}", f"month={month}", "part-0.parquet")
+
+    def write_partition(self, record_type, month, columns, rows):
+        """
+        한 달치 행을 사용자 버킷별 파티션 파일에 기록 (기존 파일과 합치며 같은 사용자/날짜는 새 행 우선)
+
+        Args:
+            record_type (str): 레코드 유형
+            month (str): 월 (YYYY-MM)
+            columns (list): 컬럼 이름 (user_id, day, 테이블 컬럼 순서)
+            rows (list): 행 목록
+        """
+        schema = self._arrow_schema(record_type)
+        rows_by_bucket = {}
+        for row in rows:
+            rows_by_bucket.setdefault(user_bucket(row[0], self.buckets), []).append(row)
+
+        for bucket, bucket_rows in rows_by_bucket.items():
+            path = self._partition_path(record_type, bucket, month)
+            merged = {}
+            if os.path.exists(path):
+                existing = pq.read_table(path, schema=schema).to_pylist()
+                merged = {(row["user_id"], row["day"]): tuple(row[name] for name in columns) for row in existing}
+            merged.update(((row[0], row[1]), tuple(row)) for row in bucket_rows)
+            ordered = [merged[key] for key in sorted(merged)]
+
+            table = pa.Table.from_arrays(
+                [pa.array(values, type=schema.field(name).type) for name, values in zip(columns, zip(*ordered))],
+                schema=schema
+            )
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            temp_path = path + ".tmp"
+            # 사용자/날짜순으로 정렬해 두면 행 그룹 통계로 사용자/날짜 조건을 걸러낼 수 있음
+            pq.write_table(table, temp_path, compression="zstd", row_group_size=64 * 1024)
+            os.replace(temp_path, path)
+
+    def archive_before(self, store, before, record_types=ARCHIVE_RECORD_TYPES):
+        """
+        기준 날짜 이전 데이터를 저장소에서 보관소로 이동 (월 단위 트랜잭션)
+
+        Parquet 파일을 먼저 기록한 뒤 저장소에서 삭제하므로 중간에 실패해도
+        데이터가 사라지지 않습니다 (두 곳에 있는 행은 조회 시 저장소 행 우선).
+
+        Args:
+            store (HealthDataStore): 저장소
+            before (str): 기준 날짜 (YYYY-MM-DD, 미포함)
+            record_types (tuple): 레코드 유형 목록
+
+        Returns:
+            dict: 레코드 유형 -> 이동한 행 수
+        """
+        self._load_metadata()
+        moved = {}
+        for record_type in record_types:
+            moved[record_type] = 0
+            for month in store.months_before(record_type, before):
+                end_date = min(_next_month(month), before)
+                moved[record_type] += store.drain_range(
+                    record_type, f"{month}-01", end_date,
+                    lambda columns, rows, month=month: self.write_partition(record_type, month, columns, rows)
+                )
+                # 옮긴 월까지 기준 날짜를 바로 올려 저장 - 중간에 실패해도 조회가 옮긴 행을 보관소에서 읽고,
+                # 다른 프로세스의 데이터셋 캐시도 새 파티션 파일을 봄
+                self._advance_watermark(record_type, end_date)
+            self._advance_watermark(record_type, before)
+        return moved
+
+    def _advance_watermark(self, record_type, watermark):
+        """
+        레코드 유형의 보관 기준 날짜를 올리고 메타데이터 저장 (기준 날짜는 내려가지 않음)
+        """
+        watermarks = self._metadata["watermarks"]
+        watermarks[record_type] = max(watermarks.get(record_type, watermark), watermark)
+        self._save_metadata()
+
+    def _dataset(self, record_type):
+        """
+        레코드 유형의 Parquet 데이터셋 (파티션 디렉터리 구조로 파티션 필드 인식)
+        """
+        dataset = self._datasets.get(record_type)
+        if dataset is None:
+            dataset = ds.dataset(
+                os.path.join(self.root, record_type),
+                schema=pa.unify_schemas([self._arrow_schema(record_type), _partition_schema()]),
+                format="parquet",
+                partitioning=ds.partitioning(_partition_schema(), flavor="hive")
+            )
+            self._datasets[record_type] = dataset
+        return dataset
+
+    def fetch_many(self, record_type, user_ids, start_date=None, end_date=None, columns=None):
+        """
+        여러 사용자의 보관 데이터를 한 번의 스캔으로 조회 (컬럼 선택 및 조건 푸시다운)
+
+        사용자 버킷과 월 조건으로 읽을 파티션 파일을 고르고, 사용자/날짜 조건은
+        행 그룹 통계로 걸러내며, 요청한 컬럼만 읽습니다.
+
+        Args:
+            record_type (str): 레코드 유형
+            user_ids (list): 사용자 식별자 목록
+            start_date (str): 시작 날짜 (YYYY-MM-DD, 포함, 선택)
+            end_date (str): 종료 날짜 (YYYY-MM-DD, 포함, 선택)
+            columns (list): 스키마 컬럼 이름 목록 (기본값: 전체)
+
+        Returns:
+            dict: 사용자 식별자 -> 컬럼형 데이터 (HealthDataStore.fetch_columns와 같은 형식, 보관 데이터가 있는 사용자만)
+        """
+        self._load_metadata()
+        if not os.path.isdir(os.path.join(self.root, record_type)) or not user_ids:
+            return {}
+
+        names = columns or [spec.column for spec in get_schema(record_type)]
+        # 스키마의 date 컬럼은 파티션 파일의 day 컬럼
+        projection = ["user_id", "day"] + [name for name in names if name != "date"]
+
+        user_ids = list(user_ids)
+        buckets = sorted({user_bucket(user_id, self.buckets) for user_id in user_ids})
+        expression = ds.field("user_bucket").isin(buckets) & ds.field("user_id").isin(user_ids)
+        if start_date:
+            expression &= (ds.field("month") >= start_date[:7]) & (ds.field("day") >= start_date)
+        if end_date:
+            expression &= (ds.field("month") <= end_date[:7]) & (ds.field("day") <= end_date)
+
+        table = self._dataset(record_type).to_table(columns=projection, filter=expression)
+        if table.num_rows == 0:
+            return {}
+        data = table.sort_by([("user_id", "ascending"), ("day", "ascending")]).to_pydict()
+
+        results = {}
+        owners = data["user_id"]
+        index = 0
+        for user_id, group in itertools.groupby(owners):
+            count = sum(1 for _ in group)
+            results[user_id] = {
+                name: data["day" if name == "date" else name][index:index + count] for name in names
+            }
+            index += count
+        return results
+
+    def fetch_columns(self, record_type, user_id, start_date=None, end_date=None, columns=None):
+        """
+        사용자 보관 데이터를 컬럼형으로 조회 (SleepAnalyzer.load_data에 바로 전달 가능)
+
+        Returns:
+            dict: 컬럼 이름 -> 값 리스트
+        """
+        result = self.fetch_many(record_type, [user_id], start_date, end_date, columns).get(user_id)
+        if result is None:
+            names = columns or [spec.column for spec in get_schema(record_type)]
+            result = {name: [] for name in names}
+        return result
+
+def merge_columns(record_type, archived, recent):
+    """
+    보관 데이터와 저장소 데이터를 날짜순으로 합침 (같은 날짜는 저장소 행 우선)
+
+    Args:
+        record_type (str): 레코드 유형
+        archived (dict): 보관소 컬럼형 데이터
+        recent (dict): 저장소 컬럼형 데이터
+
+    Returns:
+        dict: 컬럼 이름 -> 값 리스트
+    """
+    names = list(recent)
+    if not archived or not next(iter(archived.values()), None):
+        return recent
+
+    day_index = names.index(TABLES[record_type][1])
+    rows = {}
+    for columns in (archived, recent):
+        for row in zip(*(columns[name] for name in names)):
+            rows[row[day_index][:10]] = row
+    merged = [rows[day] for day in sorted(rows)]
+    return {name: list(values) for name, values in zip(names, zip(*merged))}
+
+def fetch_history_columns(store, record_type, user_id, start_date=None, end_date=None, archive=None):
+    """
+    저장소와 보관소를 합친 사용자 데이터 조회 (보관소가 조회 범위에 없으면 저장소만 조회)
+
+    Args:
+        store (HealthDataStore): 저장소
+        record_type (str): 레코드 유형
+        user_id (str): 사용자 식별자
+        start_date (str): 시작 날짜 (YYYY-MM-DD, 포함, 선택)
+        end_date (str): 종료 날짜 (YYYY-MM-DD, 포함, 선택)
+        archive (HealthArchive): 보관소 (기본값: 전역 보관소)
+
+    Returns:
+        dict: 컬럼 이름 -> 값 리스트
+    """
+    recent = store.fetch_columns(record_type, user_id, start_date, end_date)
+    archive = archive or get_health_archive()
+    if archive is None or not archive.covers(record_type, start_date):
+        return recent
+    return merge_columns(record_type, archive.fetch_columns(record_type, user_id, start_date, end_date), recent)
+
+def _history_split(store, record_type, start_date, end_date, archive):
+    """
+    조회 범위를 보관 기준 날짜 이전(보관소와 저장소를 합쳐 읽을 구간)과 이후(저장소만)로 나눔
+
+    Returns:
+        tuple: (보관소, 이전 구간 종료 날짜, 이후 구간 시작 날짜), 보관소를 읽지 않아도 되면 None
+    """
+    archive = archive or get_health_archive()
+    if archive is None or not archive.covers(record_type, start_date):
+        return None
+    watermark = archive.watermark(record_type)
+    cold_end = (date.fromisoformat(watermark) - timedelta(days=1)).isoformat()
+    if end_date and end_date < cold_end:
+        cold_end = end_date
+    return archive, cold_end, watermark
+
+def iter_history_rows(store, record_type, user_id, start_date=None, end_date=None, offset=0, batch_size=500, archive=None):
+    """
+    저장소와 보관소를 합친 사용자 행을 날짜순으로 하나씩 반환 (HealthDataStore.iter_rows와 같은 형식)
+
+    보관 기준 날짜 이전 구간만 컬럼형으로 합쳐 읽고 (같은 날짜는 저장소 행 우선),
+    이후 구간은 저장소 커서에서 batch_size개씩 읽습니다.
+
+    Args:
+        store (HealthDataStore): 저장소
+        record_type (str): 레코드 유형
+        user_id (str): 사용자 식별자
+        start_date (str): 시작 날짜 (YYYY-MM-DD, 포함, 선택)
+        end_date (str): 종료 날짜 (YYYY-MM-DD, 포함, 선택)
+        offset (int): 건너뛸 행 수 (내보내기 재개용)
+        batch_size (int): 저장소에서 한 번에 가져올 행 수
+        archive (HealthArchive): 보관소 (기본값: 전역 보관소)
+
+    Yields:
+        tuple: 스키마 컬럼 순서의 값
+    """
+    split = _history_split(store, record_type, start_date, end_date, archive)
+    if split is None:
+        yield from store.iter_rows(record_type, user_id, start_date, end_date, offset, batch_size)
+        return
+    archive, cold_end, hot_start = split
+    cold = fetch_history_columns(store, record_type, user_id, start_date, cold_end, archive)
+    rows = zip(*cold.values())
+    if not end_date or end_date >= hot_start:
+        rows = itertools.chain(rows, store.iter_rows(record_type, user_id, hot_start, end_date, 0, batch_size))
+    yield from itertools.islice(rows, offset, None)
+
+def count_history_range(store, record_type, user_id, start_date=None, end_date=None, archive=None):
+    """
+    저장소와 보관소를 합친 날짜 범위의 행 수 (같은 날짜는 한 번만 셈)
+
+    Returns:
+        int: 행 수
+    """
+    split = _history_split(store, record_type, start_date, end_date, archive)
+    if split is None:
+        return store.count_range(record_type, user_id, start_date, end_date)
+    archive, cold_end, hot_start = split
+    count = len(fetch_history_columns(store, record_type, user_id, start_date, cold_end, archive)["id"])
+    if not end_date or end_date >= hot_start:
+        count += store.count_range(record_type, user_id, hot_start, end_date)
+    return count
+
+# 프로세스 전역 보관소 (첫 사용 시 생성)
+_archive = None
+_archive_lock = threading.Lock()
+
+def get_health_archive():
+    """
+    전역 HealthArchive 조회 (pyarrow가 없으면 None)
+
+    보관소 경로는 HEALTH_ARCHIVE_DIR 환경 변수 또는 저장소 파일과 같은 디렉터리의 archive입니다.
+
+    Returns:
+        HealthArchive: 보관소
+    """
+    global _archive
+    if _archive is None:
+        if not _load_pyarrow():
+            return None
+        with _archive_lock:
+            if _archive is None:
+                root = os.environ.get('HEALTH_ARCHIVE_DIR')
+                if not root:
+                    store_path = get_health_store().path
+                    if store_path == ':memory:':
+                        return None
+                    root = os.path.join(os.path.dirname(os.path.abspath(store_path)), 'archive')
+                _archive = HealthArchive(root, buckets=int(os.environ.get('HEALTH_ARCHIVE_BUCKETS', DEFAULT_BUCKETS)))
+    return _archive
+
+def main():
+    parser = argparse.ArgumentParser(description='오래된 데이터를 Parquet 보관소로 이동')
+    parser.add_argument('--hot-days', type=int, default=int(os.environ.get('HEALTH_ARCHIVE_HOT_DAYS', 365)),
+                        help='저장소에 남길 최근 기간 (일)')
+    parser.add_argument('--types', default=','.join(ARCHIVE_RECORD_TYPES), help='쉼표로 구분한 레코드 유형')
+    args = parser.parse_args()
+
+    archive = get_health_archive()
+    if archive is None:
+        raise SystemExit("Parquet 보관소에는 pyarrow가 필요합니다. (pip install pyarrow)")
+    before = (date.today() - timedelta(days=args.hot_days)).isoformat()
+    record_types = [value for value in args.types.split(',') if value]
+    unknown = [record_type for record_type in record_types if record_type not in ARCHIVE_RECORD_TYPES]
+    if unknown:
+        raise SystemExit(f"보관할 수 없는 레코드 유형입니다: {', '.join(unknown)}")
+
+    moved = archive.archive_before(get_health_store(), before, record_types)
+    print(json.dumps({"before": before, "moved": moved}, ensure_ascii=False))
+
+if __name__ == '__main__':
+    main()
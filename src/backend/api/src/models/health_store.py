@@ -0,0 +1,522 @@
+import os
+import sqlite3
+import threading
+from datetime import date, datetime
+from src.data_analysis.src.health_connect_schema import get_schema, validate_record, to_record
+
+# 기본 데이터베이스 경로 - 실제 배포에서는 HEALTH_DB_PATH 환경 변수로 지정
+DEFAULT_DB_PATH = os.path.abspath(os.path.join(os.path.dirname(__file__), '../../instance/health.db'))
+
+# 레코드 유형별 테이블 이름과 날짜(day) 키를 만들 컬럼
+TABLES = {
+    "sleep": ("sleep_records", "start_time"),
+    "activity": ("activity_records", "date"),
+    "stress": ("stress_records", "date"),
+    "feedback": ("feedback_records", "date")
+}
+
+# 스키마 타입별 SQLite 컬럼 타입
+_SQL_TYPES = {
+    "str": "TEXT",
+    "int": "INTEGER",
+    "float": "REAL",
+    "datetime": "TEXT",
+    "date": "TEXT"
+}
+
+def _to_sql(value):
+    """
+    검증된 값을 SQLite 저장 값으로 변환 (날짜/시간은 ISO 문자열)
+    """
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    return value
+
+class HealthDataStore:
+    """
+    SQLite 기반 수면/활동/스트레스/피드백 시계열 저장소
+
+    각 테이블은 (user_id, day)를 기본 키로 하는 WITHOUT ROWID 테이블입니다.
+    기본 키 B-tree에 모든 컬럼이 함께 저장되므로 사용자별 날짜 범위 조회가
+    추가 테이블 조회 없이 하나의 인덱스 구간 스캔으로 끝납니다 (커버링 인덱스).
+    """
+
+    def __init__(self, path=None):
+        """
+        HealthDataStore 초기화
+
+        Args:
+            path (str): 데이터베이스 파일 경로 (기본값: HEALTH_DB_PATH 환경 변수 또는 DEFAULT_DB_PATH)
+        """
+        self.path = path or os.environ.get('HEALTH_DB_PATH', DEFAULT_DB_PATH)
+        if self.path != ':memory:':
+            os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+        # 스레드별 연결 (sqlite3 연결은 스레드 간 공유하지 않음)
+        self._local = threading.local()
+        # 쓰기 후 호출할 콜백 목록 (인자: user_id)
+        self._write_listeners = []
+        self._create_tables()
+
+    def connect(self):
+        """
+        현재 스레드의 데이터베이스 연결 조회 (없으면 생성)
+
+        Returns:
+            sqlite3.Connection: 데이터베이스 연결
+        """
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=30)
+            # WAL 모드: 읽기와 쓰기가 서로 막지 않음
+            conn.execute('PRAGMA journal_mode=WAL')
+            conn.execute('PRAGMA synchronous=NORMAL')
+            conn.execute('PRAGMA temp_store=MEMORY')
+            self._local.conn = conn
+        return conn
+
+    def close(self):
+        """
+        현재 스레드의 데이터베이스 연결 종료
+        """
+        conn = getattr(self._local, 'conn', None)
+        if conn is not None:
+            conn.close()
+            self._local.conn = None
+
+    def _create_tables(self):
+        """
+        레코드 유형별 테이블 생성
+        """
+        conn = self.connect()
+        with conn:
+            for record_type, (table, _) in TABLES.items():
+                columns = ", ".join(f"{column} {sql_type}" for column, sql_type in self._columns(record_type))
+                conn.execute(
+                    f"CREATE TABLE IF NOT EXISTS {table} ("
+                    f"user_id TEXT NOT NULL, day TEXT NOT NULL, {columns}, "
+                    f"PRIMARY KEY (user_id, day)) WITHOUT ROWID"
+                )
+            # 사용자별 데이터 버전 - 쓰기마다 증가하며 ETag 생성에 사용
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS data_versions ("
+                "user_id TEXT PRIMARY KEY, version INTEGER NOT NULL) WITHOUT ROWID"
+            )
+            # 사용자별로 미리 계산해 둔 분석 결과 (JSON)
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS materialized_analysis ("
+                "user_id TEXT NOT NULL, kind TEXT NOT NULL, version INTEGER NOT NULL, "
+                "computed_on TEXT NOT NULL, result TEXT NOT NULL, "
+                "PRIMARY KEY (user_id, kind)) WITHOUT ROWID"
+            )
+
+    @staticmethod
+    def _columns(record_type):
+        """
+        레코드 유형의 저장 컬럼 목록 ((컬럼 이름, SQL 타입) 튜플, day 키와 중복되는 date 제외)
+        """
+        return [(spec.column, _SQL_TYPES[spec.kind]) for spec in get_schema(record_type) if spec.column != "date"]
+
+    def upsert_rows(self, record_type, user_id, rows):
+        """
+        검증된 행을 한 트랜잭션으로 일괄 저장 (같은 날짜의 기존 행은 교체)
+
+        Args:
+            record_type (str): 레코드 유형 (sleep, activity, stress, feedback)
+            user_id (str): 사용자 식별자
+            rows (list): validate_record가 반환한 스키마 컬럼 순서의 값 튜플 목록
+
+        Returns:
+            int: 저장한 행 수
+        """
+        return self.upsert_batch(record_type, {user_id: rows}).get(user_id, 0)
+
+    def upsert_batch(self, record_type, rows_by_user):
+        """
+        여러 사용자의 검증된 행을 한 트랜잭션으로 일괄 저장
+
+        쓰기 버퍼처럼 여러 요청을 모아 저장할 때 커밋(fsync)을 한 번만 하도록
+        모든 행과 사용자별 버전 증가를 같은 트랜잭션에서 처리합니다.
+
+        Args:
+            record_type (str): 레코드 유형 (sleep, activity, stress, feedback)
+            rows_by_user (dict): 사용자 식별자 -> 검증된 행 목록
+
+        Returns:
+            dict: 사용자 식별자 -> 저장한 행 수
+        """
+        table, day_column = TABLES[record_type]
+        schema = get_schema(record_type)
+        names = [spec.column for spec in schema]
+        day_index = names.index(day_column)
+        stored = [index for index, name in enumerate(names) if name != "date"]
+        columns = [names[index] for index in stored]
+
+        params = []
+        counts = {}
+        for user_id, rows in rows_by_user.items():
+            for row in rows:
+                day = row[day_index]
+                if isinstance(day, datetime):
+                    day = day.date()
+                params.append((user_id, _to_sql(day)) + tuple(_to_sql(row[index]) for index in stored))
+            if rows:
+                counts[user_id] = len(rows)
+
+        placeholders = ", ".join("?" for _ in range(len(columns) + 2))
+        updates = ", ".join(f"{column} = excluded.{column}" for column in columns)
+        sql = (
+            f"INSERT INTO {table} (user_id, day, {', '.join(columns)}) VALUES ({placeholders}) "
+            f"ON CONFLICT (user_id, day) DO UPDATE SET {updates}"
+        )
+
+        conn = self.connect()
+        with conn:
+            conn.executemany(sql, params)
+            for user_id in counts:
+                self._bump_version(conn, user_id)
+        for user_id in counts:
+            self._notify_write(user_id)
+        return counts
+
+    def add_write_listener(self, callback):
+        """
+        데이터 변경 후 호출할 콜백 등록
+
+        Args:
+            callback (callable): 변경된 사용자 식별자를 인자로 받는 함수
+        """
+        self._write_listeners.append(callback)
+
+    def _notify_write(self, user_id):
+        """
+        등록된 콜백에 데이터 변경 알림 (트랜잭션 커밋 후 호출)
+        """
+        for callback in self._write_listeners:
+            callback(user_id)
+
+    def touch(self, user_id):
+        """
+        저장 데이터 외의 입력이 바뀌었을 때 사용자 데이터 버전만 증가
+
+        Args:
+            user_id (str): 사용자 식별자
+        """
+        conn = self.connect()
+        with conn:
+            self._bump_version(conn, user_id)
+        self._notify_write(user_id)
+
+    @staticmethod
+    def _bump_version(conn, user_id):
+        """
+        사용자 데이터 버전 증가 (쓰기 트랜잭션 안에서 호출)
+        """
+        conn.execute(
+            "INSERT INTO data_versions (user_id, version) VALUES (?, 1) "
+            "ON CONFLICT (user_id) DO UPDATE SET version = version + 1",
+            (user_id,)
+        )
+
+    def get_version(self, user_id):
+        """
+        사용자 데이터 버전 조회
+
+        Args:
+            user_id (str): 사용자 식별자
+
+        Returns:
+            int: 데이터 버전 (저장된 데이터가 없으면 0)
+        """
+        row = self.connect().execute("SELECT version FROM data_versions WHERE user_id = ?", (user_id,)).fetchone()
+        return row[0] if row else 0
+
+    def upsert(self, record_type, user_id, records):
+        """
+        원본 레코드를 검증한 뒤 일괄 저장
+
+        Args:
+            record_type (str): 레코드 유형 (sleep, activity, stress, feedback)
+            user_id (str): 사용자 식별자
+            records (list): Health Connect 형식의 레코드 목록
+
+        Returns:
+            int: 저장한 행 수
+        """
+        rows = [validate_record(record, record_type, index) for index, record in enumerate(records)]
+        return self.upsert_rows(record_type, user_id, rows)
+
+    def _select(self, record_type, user_id, start_date=None, end_date=None, after=None, limit=None, with_day=False, offset=0):
+        """
+        사용자별 날짜 범위 조회 커서 (날짜 오름차순, 스키마 컬럼 순서)
+
+        Args:
+            record_type (str): 레코드 유형
+            user_id (str): 사용자 식별자
+            start_date (str): 시작 날짜 (YYYY-MM-DD, 포함, 선택)
+            end_date (str): 종료 날짜 (YYYY-MM-DD, 포함, 선택)
+            after (str): 이 날짜 이후의 행만 조회 (키셋 페이지네이션 커서, 선택)
+            limit (int): 최대 행 수 (선택)
+            with_day (bool): 첫 번째 컬럼으로 day 키를 함께 조회할지 여부
+            offset (int): 건너뛸 행 수 (선택)
+
+        Returns:
+            sqlite3.Cursor: 조회 커서
+        """
+        table, _ = TABLES[record_type]
+        select = ", ".join("day AS date" if spec.column == "date" else spec.column for spec in get_schema(record_type))
+        if with_day:
+            select = "day, " + select
+
+        sql = f"SELECT {select} FROM {table} WHERE user_id = ?"
+        params = [user_id]
+        if start_date:
+            sql += " AND day >= ?"
+            params.append(start_date)
+        if end_date:
+            sql += " AND day <= ?"
+            params.append(end_date)
+        if after:
+            sql += " AND day > ?"
+            params.append(after)
+        sql += " ORDER BY day"
+        if limit is not None or offset:
+            # LIMIT -1: SQLite에서 개수 제한 없음
+            sql += " LIMIT ? OFFSET ?"
+            params.extend([-1 if limit is None else limit, offset])
+
+        return self.connect().execute(sql, params)
+
+    def fetch_columns(self, record_type, user_id, start_date=None, end_date=None):
+        """
+        날짜 범위 조회 결과를 컬럼형으로 반환 (SleepAnalyzer.load_data에 바로 전달 가능)
+
+        Returns:
+            dict: 컬럼 이름 -> 값 리스트
+        """
+        names = [spec.column for spec in get_schema(record_type)]
+        rows = self._select(record_type, user_id, start_date, end_date).fetchall()
+        if not rows:
+            return {name: [] for name in names}
+        return {name: list(values) for name, values in zip(names, zip(*rows))}
+
+    def fetch_records(self, record_type, user_id, start_date=None, end_date=None):
+        """
+        날짜 범위 조회 결과를 API 응답 형식의 레코드로 반환
+
+        Returns:
+            list: 레코드 목록 (수면 단계는 stages 객체로 복원)
+        """
+        cursor = self._select(record_type, user_id, start_date, end_date)
+        return [to_record(row, record_type) for row in cursor]
+
+    def fetch_page(self, record_type, user_id, start_date=None, end_date=None, after=None, limit=100):
+        """
+        키셋 페이지네이션 조회 - 커서(after) 다음 날짜부터 limit개의 레코드 반환
+
+        OFFSET 없이 기본 키 구간 스캔으로 시작 위치를 찾으므로 페이지 위치와
+        관계없이 조회 비용이 일정합니다.
+
+        Args:
+            record_type (str): 레코드 유형
+            user_id (str): 사용자 식별자
+            start_date (str): 시작 날짜 (YYYY-MM-DD, 포함, 선택)
+            end_date (str): 종료 날짜 (YYYY-MM-DD, 포함, 선택)
+            after (str): 이전 페이지의 마지막 날짜 (선택)
+            limit (int): 페이지 크기
+
+        Returns:
+            tuple: (레코드 목록, 다음 페이지가 있으면 마지막 날짜 아니면 None)
+        """
+        # 다음 페이지 존재 여부 확인을 위해 한 행 더 조회
+        rows = self._select(record_type, user_id, start_date, end_date, after, limit + 1, with_day=True).fetchall()
+        has_more = len(rows) > limit
+        rows = rows[:limit]
+        records = [to_record(row[1:], record_type) for row in rows]
+        return records, (rows[-1][0] if has_more else None)
+
+    def iter_rows(self, record_type, user_id, start_date=None, end_date=None, offset=0, batch_size=500):
+        """
+        날짜 범위의 행을 커서에서 batch_size개씩 읽어 하나씩 반환 (메모리 사용량 일정)
+
+        Args:
+            record_type (str): 레코드 유형
+            user_id (str): 사용자 식별자
+            start_date (str): 시작 날짜 (YYYY-MM-DD, 포함, 선택)
+            end_date (str): 종료 날짜 (YYYY-MM-DD, 포함, 선택)
+            offset (int): 건너뛸 행 수 (내보내기 재개용)
+            batch_size (int): 한 번에 가져올 행 수
+
+        Yields:
+            tuple: 스키마 컬럼 순서의 값
+        """
+        cursor = self._select(record_type, user_id, start_date, end_date, offset=offset)
+        try:
+            while True:
+                rows = cursor.fetchmany(batch_size)
+                if not rows:
+                    break
+                yield from rows
+        finally:
+            cursor.close()
+
+    def count_range(self, record_type, user_id, start_date=None, end_date=None):
+        """
+        날짜 범위의 행 수 조회
+
+        Returns:
+            int: 행 수
+        """
+        table, _ = TABLES[record_type]
+        sql = f"SELECT COUNT(*) FROM {table} WHERE user_id = ?"
+        params = [user_id]
+        if start_date:
+            sql += " AND day >= ?"
+            params.append(start_date)
+        if end_date:
+            sql += " AND day <= ?"
+            params.append(end_date)
+        return self.connect().execute(sql, params).fetchone()[0]
+
+    def months_before(self, record_type, before):
+        """
+        기준 날짜 이전 데이터가 있는 월 목록 (모든 사용자)
+
+        Args:
+            record_type (str): 레코드 유형
+            before (str): 기준 날짜 (YYYY-MM-DD, 미포함)
+
+        Returns:
+            list: 월 목록 (YYYY-MM, 오름차순)
+        """
+        table, _ = TABLES[record_type]
+        rows = self.connect().execute(
+            f"SELECT DISTINCT substr(day, 1, 7) FROM {table} WHERE day < ? ORDER BY 1", (before,)
+        ).fetchall()
+        return [row[0] for row in rows]
+
+    def drain_range(self, record_type, start_date, end_date, sink):
+        """
+        날짜 구간의 모든 사용자 행을 sink에 넘긴 뒤 삭제 (보관소 이동용, 한 트랜잭션)
+
+        구간 조회부터 삭제까지 쓰기 잠금을 잡으므로 그 사이 들어온 쓰기가 함께
+        삭제되지 않습니다. sink에서 예외가 발생하면 삭제하지 않습니다.
+        행을 옮긴 사용자의 데이터 버전은 같은 트랜잭션에서 올립니다 (ETag, 미리 계산된 결과 무효화).
+
+        Args:
+            record_type (str): 레코드 유형
+            start_date (str): 시작 날짜 (YYYY-MM-DD, 포함)
+            end_date (str): 종료 날짜 (YYYY-MM-DD, 미포함)
+            sink (callable): (컬럼 이름 목록, 행 목록)을 받는 함수 - 컬럼은 user_id, day, 테이블 컬럼 순서
+
+        Returns:
+            int: 이동한 행 수
+        """
+        table, _ = TABLES[record_type]
+        columns = ["user_id", "day"] + [column for column, _ in self._columns(record_type)]
+        conn = self.connect()
+        with conn:
+            conn.execute("BEGIN IMMEDIATE")
+            rows = conn.execute(
+                f"SELECT {', '.join(columns)} FROM {table} WHERE day >= ? AND day < ? ORDER BY user_id, day",
+                (start_date, end_date)
+            ).fetchall()
+            if rows:
+                sink(columns, rows)
+                conn.execute(f"DELETE FROM {table} WHERE day >= ? AND day < ?", (start_date, end_date))
+            user_ids = sorted({row[0] for row in rows})
+            for user_id in user_ids:
+                self._bump_version(conn, user_id)
+        for user_id in user_ids:
+            self._notify_write(user_id)
+        return len(rows)
+
+    def read_snapshot(self, record_type, reader):
+        """
+        모든 사용자의 행과 데이터 버전을 같은 시점 기준으로 읽기 (한 읽기 트랜잭션)
+
+        Args:
+            record_type (str): 레코드 유형
+            reader (callable): (사용자별 버전 dict, 행 수, 커서)를 받는 함수 -
+                커서는 user_id와 스키마 컬럼 순서의 값을 사용자/날짜순으로 반환
+
+        Returns:
+            reader의 반환값
+        """
+        table, _ = TABLES[record_type]
+        select = ", ".join("day AS date" if spec.column == "date" else spec.column for spec in get_schema(record_type))
+        conn = self.connect()
+        # WAL 모드에서는 읽기 트랜잭션의 첫 조회 시점 스냅숏이 트랜잭션 끝까지 유지됨
+        conn.execute("BEGIN")
+        try:
+            versions = dict(conn.execute("SELECT user_id, version FROM data_versions").fetchall())
+            count = conn.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]
+            cursor = conn.execute(f"SELECT user_id, {select} FROM {table} ORDER BY user_id, day")
+            try:
+                return reader(versions, count, cursor)
+            finally:
+                cursor.close()
+        finally:
+            conn.rollback()
+
+    def get_materialized(self, user_id, kind):
+        """
+        미리 계산된 분석 결과 조회
+
+        Args:
+            user_id (str): 사용자 식별자
+            kind (str): 분석 종류
+
+        Returns:
+            tuple: (데이터 버전, 계산 날짜, 결과 JSON 문자열), 없으면 None
+        """
+        return self.connect().execute(
+            "SELECT version, computed_on, result FROM materialized_analysis WHERE user_id = ? AND kind = ?",
+            (user_id, kind)
+        ).fetchone()
+
+    def put_materialized(self, user_id, kind, version, computed_on, result):
+        """
+        분석 결과 저장 (더 최신 버전의 결과가 이미 있으면 덮어쓰지 않음)
+
+        Args:
+            user_id (str): 사용자 식별자
+            kind (str): 분석 종류
+            version (int): 계산에 사용한 데이터 버전
+            computed_on (str): 계산 날짜 (YYYY-MM-DD)
+            result (str): 결과 JSON 문자열
+        """
+        conn = self.connect()
+        with conn:
+            conn.execute(
+                "INSERT INTO materialized_analysis (user_id, kind, version, computed_on, result) "
+                "VALUES (?, ?, ?, ?, ?) "
+                "ON CONFLICT (user_id, kind) DO UPDATE SET "
+                "version = excluded.version, computed_on = excluded.computed_on, result = excluded.result "
+                "WHERE excluded.version >= materialized_analysis.version",
+                (user_id, kind, version, computed_on, result)
+            )
+
+    def count(self, record_type, user_id):
+        """
+        사용자의 저장된 레코드 수 조회
+        """
+        table, _ = TABLES[record_type]
+        return self.connect().execute(f"SELECT COUNT(*) FROM {table} WHERE user_id = ?", (user_id,)).fetchone()[0]
+
+# 프로세스 전역 저장소 (첫 사용 시 생성)
+_store = None
+_store_lock = threading.Lock()
+
+def get_health_store():
+    """
+    전역 HealthDataStore 조회 (없으면 생성)
+
+    Returns:
+        HealthDataStore: 저장소
+    """
+    global _store
+    if _store is None:
+        with _store_lock:
+            if _store is None:
+                _store = HealthDataStore()
+    return _store
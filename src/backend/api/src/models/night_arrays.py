@@ -0,0 +1,274 @@
+"""
+사용자별 수면 지표의 메모리 매핑 NumPy 배열
+
+저장소의 수면 데이터를 지표별 .npy 파일(전체 사용자를 사용자/날짜순으로 이어 붙인
+1차원 배열)과 사용자별 오프셋 인덱스로 기록합니다. 워커 프로세스는 파일을
+메모리 매핑해 JSON 파싱이나 복사 없이 사용자 구간을 잘라 쓰고, 같은 파일의
+페이지 캐시는 모든 워커가 공유합니다.
+
+    <root>/CURRENT                  현재 세대 이름
+    <root>/<세대>/users.npy         사용자 식별자 (UTF-8 바이트, 정렬)
+    <root>/<세대>/offsets.npy       사용자별 시작 위치 (사용자 수 + 1)
+    <root>/<세대>/versions.npy      기록 시점의 사용자 데이터 버전
+    <root>/<세대>/<지표>.npy        start_time, end_time, duration, efficiency, stages_*
+
+데이터가 바뀐 사용자(버전 불일치)는 다시 기록하기 전까지 저장소에서 조회합니다.
+동기화 배치 후 다시 기록합니다:
+
+    python -m src.backend.api.src.models.night_arrays
+"""
+import json
+import os
+import shutil
+import threading
+import time
+import numpy as np
+from src.backend.api.src.models.health_store import get_health_store
+from src.data_analysis.src.health_connect_schema import get_schema
+
+# 스키마 값 타입별 배열 dtype (문자열 컬럼 id는 제외)
+_DTYPES = {
+    "datetime": "datetime64[s]",
+    "int": np.int64,
+    "float": np.float64
+}
+
+# 메모리 매핑하는 수면 지표 컬럼
+NIGHT_COLUMNS = tuple(spec.column for spec in get_schema("sleep") if spec.kind in _DTYPES)
+
+# 현재 세대 이름을 기록하는 파일
+CURRENT_FILE = "CURRENT"
+
+# 기록 시 한 번에 읽는 행 수
+_BATCH_SIZE = 10000
+
+class NightArrays:
+    """
+    한 세대의 메모리 매핑 배열 (읽기 전용)
+    """
+
+    def __init__(self, path):
+        """
+        NightArrays 초기화
+
+        Args:
+            path (str): 세대 디렉터리
+        """
+        self.path = path
+        self.users = np.load(os.path.join(path, "users.npy"), mmap_mode="r")
+        self.offsets = np.load(os.path.join(path, "offsets.npy"), mmap_mode="r")
+        self.versions = np.load(os.path.join(path, "versions.npy"), mmap_mode="r")
+        self.columns = {
+            column: np.load(os.path.join(path, f"{column}.npy"), mmap_mode="r")
+            for column in NIGHT_COLUMNS
+        }
+
+    def _position(self, user_id):
+        """
+        사용자 인덱스 위치 (없으면 None)
+        """
+        key = user_id.encode("utf-8")
+        position = int(np.searchsorted(self.users, key))
+        if position < len(self.users) and self.users[position] == key:
+            return position
+        return None
+
+    def fetch(self, user_id, version, start_date=None, end_date=None):
+        """
+        사용자 수면 지표 조회 (메모리 매핑 배열의 구간 뷰, 복사 없음)
+
+        Args:
+            user_id (str): 사용자 식별자
+            version (int): 저장소의 현재 사용자 데이터 버전
+            start_date (str): 시작 날짜 (YYYY-MM-DD, 포함, 선택)
+            end_date (str): 종료 날짜 (YYYY-MM-DD, 포함, 선택)
+
+        Returns:
+            dict: 컬럼 이름 -> 배열 뷰 (SleepAnalyzer.load_data에 바로 전달 가능),
+                기록 후 데이터가 바뀌었거나 사용자가 없으면 None
+        """
+        position = self._position(user_id)
+        if position is None:
+            # 수면 데이터가 없는 사용자도 버전이 0이면 빈 결과가 최신
+            return {column: values[:0] for column, values in self.columns.items()} if version == 0 else None
+        if int(self.versions[position]) != version:
+            return None
+
+        start, end = int(self.offsets[position]), int(self.offsets[position + 1])
+        # 시작 시각은 사용자 구간 안에서 정렬되어 있으므로 날짜 범위는 이진 탐색
+        start_times = self.columns["start_time"][start:end]
+        if start_date:
+            start += int(np.searchsorted(start_times, np.datetime64(start_date, "s")))
+        if end_date:
+            next_day = np.datetime64(end_date, "D") + np.timedelta64(1, "D")
+            end = int(self.offsets[position]) + int(np.searchsorted(start_times, next_day.astype("datetime64[s]")))
+        end = max(start, end)
+        return {column: values[start:end] for column, values in self.columns.items()}
+
+class NightArrayStore:
+    """
+    세대별 메모리 매핑 배열 관리자 (기록 및 현재 세대 조회)
+    """
+
+    def __init__(self, root):
+        """
+        NightArrayStore 초기화
+
+        Args:
+            root (str): 배열 파일 디렉터리
+        """
+        self.root = root
+        self._lock = threading.Lock()
+        self._current = None
+        self._current_mtime = None
+
+    def _current_path(self):
+        return os.path.join(self.root, CURRENT_FILE)
+
+    def current(self):
+        """
+        현재 세대 배열 (다른 프로세스가 새 세대를 기록했으면 다시 매핑, 없으면 None)
+
+        Returns:
+            NightArrays: 현재 세대
+        """
+        try:
+            mtime = os.stat(self._current_path()).st_mtime_ns
+        except FileNotFoundError:
+            return None
+        if mtime != self._current_mtime:
+            with self._lock:
+                if mtime != self._current_mtime:
+                    with open(self._current_path(), encoding="utf-8") as f:
+                        generation = f.read().strip()
+                    self._current = NightArrays(os.path.join(self.root, generation))
+                    self._current_mtime = mtime
+        return self._current
+
+    def build(self, store):
+        """
+        저장소의 전체 수면 데이터를 새 세대로 기록한 뒤 현재 세대로 전환
+
+        이전 세대는 한 세대만 남기고 삭제합니다 (이미 매핑한 프로세스는 계속 읽을 수 있음).
+
+        Args:
+            store (HealthDataStore): 저장소
+
+        Returns:
+            dict: 세대 이름, 사용자 수, 행 수
+        """
+        generation = f"{int(time.time() * 1000)}-{os.getpid()}"
+        path = os.path.join(self.root, generation)
+        os.makedirs(path)
+        try:
+            users, rows = store.read_snapshot("sleep", lambda versions, count, cursor: self._write(path, versions, count, cursor))
+        except Exception:
+            shutil.rmtree(path, ignore_errors=True)
+            raise
+
+        temp_path = self._current_path() + ".tmp"
+        with open(temp_path, "w", encoding="utf-8") as f:
+            f.write(generation)
+        os.replace(temp_path, self._current_path())
+        self._remove_old_generations(keep=2)
+        return {"generation": generation, "users": users, "rows": rows}
+
+    @staticmethod
+    def _write(path, versions, count, cursor):
+        """
+        커서의 행을 지표별 .npy 파일과 사용자 인덱스로 기록
+
+        Returns:
+            tuple: (사용자 수, 행 수)
+        """
+        names = [spec.column for spec in get_schema("sleep")]
+        positions = [names.index(column) + 1 for column in NIGHT_COLUMNS]
+        schema_kinds = {spec.column: spec.kind for spec in get_schema("sleep")}
+        arrays = {
+            column: np.lib.format.open_memmap(
+                os.path.join(path, f"{column}.npy"), mode="w+", dtype=_DTYPES[schema_kinds[column]], shape=(count,)
+            )
+            for column in NIGHT_COLUMNS
+        }
+
+        users, offsets = [], []
+        index = 0
+        while True:
+            rows = cursor.fetchmany(_BATCH_SIZE)
+            if not rows:
+                break
+            for offset, row in enumerate(rows):
+                if not users or users[-1] != row[0]:
+                    users.append(row[0])
+                    offsets.append(index + offset)
+            for column, position in zip(NIGHT_COLUMNS, positions):
+                # ISO 문자열은 datetime64로 변환되고, 실수 컬럼의 누락값(None)은 NaN
+                values = np.array([row[position] for row in rows], dtype=arrays[column].dtype)
+                arrays[column][index:index + len(rows)] = values
+            index += len(rows)
+
+        for array in arrays.values():
+            array.flush()
+        offsets.append(index)
+        np.save(os.path.join(path, "users.npy"), np.array([user.encode("utf-8") for user in users], dtype=bytes))
+        np.save(os.path.join(path, "offsets.npy"), np.array(offsets, dtype=np.int64))
+        np.save(os.path.join(path, "versions.npy"), np.array([versions.get(user, 0) for user in users], dtype=np.int64))
+        return len(users), index
+
+    def _remove_old_generations(self, keep):
+        """
+        오래된 세대 디렉터리 삭제 (최근 keep개 유지)
+        """
+        generations = sorted(
+            (name for name in os.listdir(self.root) if os.path.isdir(os.path.join(self.root, name))),
+            key=lambda name: int(name.split("-")[0])
+        )
+        for name in generations[:-keep]:
+            shutil.rmtree(os.path.join(self.root, name), ignore_errors=True)
+
+def fetch_night_columns(store, user_id, start_date=None, end_date=None):
+    """
+    최신 메모리 매핑 배열에서 사용자 수면 지표 조회
+
+    Args:
+        store (HealthDataStore): 저장소 (현재 데이터 버전 확인용)
+        user_id (str): 사용자 식별자
+        start_date (str): 시작 날짜 (YYYY-MM-DD, 포함, 선택)
+        end_date (str): 종료 날짜 (YYYY-MM-DD, 포함, 선택)
+
+    Returns:
+        dict: 컬럼 이름 -> 배열 뷰, 배열이 없거나 최신이 아니면 None
+    """
+    arrays = get_night_array_store().current()
+    if arrays is None:
+        return None
+    return arrays.fetch(user_id, store.get_version(user_id), start_date, end_date)
+
+# 프로세스 전역 배열 관리자 (첫 사용 시 생성)
+_night_store = None
+_night_store_lock = threading.Lock()
+
+def get_night_array_store():
+    """
+    전역 NightArrayStore 조회 (없으면 생성)
+
+    배열 경로는 NIGHT_ARRAYS_DIR 환경 변수 또는 저장소 파일과 같은 디렉터리의 nights입니다.
+
+    Returns:
+        NightArrayStore: 배열 관리자
+    """
+    global _night_store
+    if _night_store is None:
+        with _night_store_lock:
+            if _night_store is None:
+                root = os.environ.get('NIGHT_ARRAYS_DIR')
+                if not root:
+                    root = os.path.join(os.path.dirname(os.path.abspath(get_health_store().path)), 'nights')
+                _night_store = NightArrayStore(root)
+    return _night_store
+
+def main():
+    print(json.dumps(get_night_array_store().build(get_health_store()), ensure_ascii=False))
+
+if __name__ == '__main__':
+    main()
@@ -1,11 +1,17 @@
 from flask_sqlalchemy import SQLAlchemy
+from sqlalchemy import bindparam, select
 
 db = SQLAlchemy()
 
 class User(db.Model):
+    __tablename__ = 'users'
+
     id = db.Column(db.Integer, primary_key=True)
-    username = db.Column(db.String(80), unique=True, nullable=False)
-    email = db.Column(db.String(120), unique=True, nullable=False)
+    username = db.Column(db.String(120), unique=True, nullable=False)
+    # 로그인 조회 경로 - 고유 인덱스
+    email = db.Column(db.String(120), unique=True, index=True, nullable=False)
+    name = db.Column(db.String(80), nullable=False, default='')
+    password_hash = db.Column(db.String(255))
 
     def __repr__(self):
         return f'<User {self.username}>'
@@ -14,5 +20,57 @@ class User(db.Model):
         return {
             'id': self.id,
             'username': self.username,
-            'email': self.email
+            'email': self.email,
+            'name': self.name
         }
+
+# 로그인 조회 구문 - 필요한 컬럼만 조회하고, 한 번 만든 구문을 재사용해 컴파일 캐시를 활용
+_CREDENTIALS_BY_EMAIL = (
+    select(User.email, User.name, User.password_hash)
+    .where(User.email == bindparam('email'))
+)
+
+def find_credentials(email):
+    """
+    이메일로 로그인 정보 조회
+
+    Args:
+        email (str): 사용자 이메일
+
+    Returns:
+        Row: (email, name, password_hash), 없으면 None
+    """
+    return db.session.execute(_CREDENTIALS_BY_EMAIL, {'email': email}).first()
+
+def create_user(email, password_hash, name):
+    """
+    사용자 생성 (이메일 중복 시 sqlalchemy.exc.IntegrityError 발생)
+
+    Args:
+        email (str): 사용자 이메일
+        password_hash (str): 비밀번호 해시
+        name (str): 사용자 이름
+
+    Returns:
+        User: 생성된 사용자
+    """
+    user = User(username=email, email=email, name=name, password_hash=password_hash)
+    db.session.add(user)
+    try:
+        db.session.commit()
+    except Exception:
+        db.session.rollback()
+        raise
+    return user
+
+def seed_default_user(email, hash_password, name):
+    """
+    기본 사용자가 없으면 생성 (비밀번호 해시는 생성할 때만 계산)
+
+    Args:
+        email (str): 사용자 이메일
+        hash_password (callable): 비밀번호 해시를 반환하는 함수
+        name (str): 사용자 이름
+    """
+    if find_credentials(email) is None:
+        create_user(email, hash_password(), name)
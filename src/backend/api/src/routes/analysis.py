@@ -1,63 +1,262 @@
-from flask import Blueprint, jsonify, request
-from datetime import datetime, timedelta
+from flask import Blueprint, current_app, jsonify, request, url_for
+from datetime import date, datetime, timedelta
 import sys
 import os
+import threading
 # sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../../../../data_analysis/src')))
-from src.data_analysis.src.health_connect_interface import HealthConnectInterface
+from src.backend.api.src.models.health_archive import fetch_history_columns, get_health_archive, merge_columns
+from src.backend.api.src.models.health_store import get_health_store
+from src.backend.api.src.models.night_arrays import fetch_night_columns
+from src.backend.api.src.services.analysis_materializer import AnalysisMaterializer
+from src.backend.api.src.services.feedback_writer import get_feedback_writer
+from src.backend.api.src.services.job_queue import JobQueue, QueueFullError
+from src.backend.api.src.utils.arrow_format import arrow_available, arrow_unavailable_response, table_response, wants_arrow
+from src.backend.api.src.utils.auth import is_admin, login_required
+from src.backend.api.src.utils.current_user import current_user_id
+from src.backend.api.src.utils.http_cache import conditional_get
+from src.backend.api.src.utils.json_provider import dumps
 
 # Blueprint 정의
 analysis_bp = Blueprint('analysis', __name__)
 
-# Health Connect 인터페이스 초기화
-health_interface = HealthConnectInterface()
-
-# 샘플 데이터 - 실제 구현에서는 데이터베이스에서 가져옴
-sample_feedback_data = [
-    {
-        "date": (datetime.now() - timedelta(days=1)).date().isoformat(),
-        "sleep_satisfaction": 4,
-        "morning_condition": 4,
-        "notes": "잘 잤음"
-    },
-    {
-        "date": (datetime.now() - timedelta(days=2)).date().isoformat(),
-        "sleep_satisfaction": 3,
-        "morning_condition": 3,
-        "notes": "평범했음"
-    },
-    {
-        "date": (datetime.now() - timedelta(days=3)).date().isoformat(),
-        "sleep_satisfaction": 5,
-        "morning_condition": 4,
-        "notes": "매우 잘 잤음"
+# Health Connect 인터페이스 및 종합 분석 구체화 관리자 - pandas 등 분석 모듈을 불러오는
+# 비용이 크므로 첫 분석 요청 시 생성 (앱 시작 시간 단축)
+_health_interface = None
+_comprehensive_materializer = None
+_lazy_lock = threading.Lock()
+
+def get_health_interface():
+    """
+    전역 HealthConnectInterface 조회 (없으면 분석 모듈을 불러와 생성)
+    
+    Returns:
+        HealthConnectInterface: 분석 인터페이스
+    """
+    global _health_interface
+    if _health_interface is None:
+        with _lazy_lock:
+            if _health_interface is None:
+                from src.data_analysis.src.health_connect_interface import HealthConnectInterface
+                _health_interface = HealthConnectInterface()
+    return _health_interface
+
+# 오래 걸리는 분석을 위한 백그라운드 작업 큐
+job_queue = JobQueue(
+    max_workers=int(os.environ.get('ANALYSIS_JOB_WORKERS', 2)),
+    max_pending=int(os.environ.get('ANALYSIS_JOB_QUEUE_SIZE', 100))
+)
+
+# 코호트 분석 한 번에 요청할 수 있는 최대 사용자 수
+MAX_COHORT_USERS = 10000
+
+def fetch_sleep_columns(store, user_id, start_date=None, end_date=None):
+    """
+    사용자 수면 데이터 조회 (컬럼형)
+    
+    보관소 범위가 아니면 최신 메모리 매핑 배열을 우선 사용하고 (파싱/복사 없음),
+    배열이 없거나 이후 데이터가 바뀐 경우 저장소(및 보관소)에서 조회합니다.
+    
+    Args:
+        store (HealthDataStore): 저장소
+        user_id (str): 사용자 식별자
+        start_date (str): 시작 날짜 (YYYY-MM-DD, 선택)
+        end_date (str): 종료 날짜 (YYYY-MM-DD, 선택)
+        
+    Returns:
+        dict: 컬럼 이름 -> 값 리스트 또는 배열
+    """
+    archive = get_health_archive()
+    if archive is None or not archive.covers('sleep', start_date):
+        columns = fetch_night_columns(store, user_id, start_date, end_date)
+        if columns is not None:
+            return columns
+    return fetch_history_columns(store, 'sleep', user_id, start_date, end_date)
+
+def compute_comprehensive_analysis(user_id, start_date=None, end_date=None):
+    """
+    사용자 종합 분석 계산
+    
+    Args:
+        user_id (str): 사용자 식별자
+        start_date (str): 시작 날짜 (YYYY-MM-DD, 선택)
+        end_date (str): 종료 날짜 (YYYY-MM-DD, 선택)
+        
+    Returns:
+        dict: 종합 분석 결과
+    """
+    store = get_health_store()
+    return get_health_interface().process_data(
+        sleep_data=fetch_sleep_columns(store, user_id, start_date, end_date),
+        activity_data=fetch_history_columns(store, 'activity', user_id, start_date, end_date),
+        stress_data=fetch_history_columns(store, 'stress', user_id, start_date, end_date),
+        feedback_data=get_feedback_writer().fetch_columns(user_id, start_date, end_date)
+    )
+
+def compute_cohort_analysis(user_ids, start_date=None, end_date=None):
+    """
+    여러 사용자의 수면 요약 및 코호트 평균 계산
+    
+    Args:
+        user_ids (list): 사용자 식별자 목록
+        start_date (str): 시작 날짜 (YYYY-MM-DD, 선택)
+        end_date (str): 종료 날짜 (YYYY-MM-DD, 선택)
+        
+    Returns:
+        dict: 사용자별 요약 및 코호트 평균
+    """
+    store = get_health_store()
+    health_interface = get_health_interface()
+    users = {}
+    
+    # 보관된 기간이 포함되면 전체 사용자의 보관 데이터를 한 번의 스캔으로 조회
+    archive = get_health_archive()
+    archived = {}
+    if archive is not None and archive.covers('sleep', start_date):
+        archived = archive.fetch_many('sleep', user_ids, start_date, end_date)
+    
+    for user_id in user_ids:
+        sleep_data = merge_columns('sleep', archived.get(user_id), store.fetch_columns('sleep', user_id, start_date, end_date))
+        if not sleep_data['id']:
+            continue
+        users[user_id] = {
+            "nights": len(sleep_data['id']),
+            "summary": health_interface.get_sleep_summary(sleep_data),
+            "optimal_sleep": health_interface.get_optimal_sleep_time(sleep_data)
+        }
+    
+    # 데이터가 있는 사용자의 요약 지표 평균
+    cohort = {"users": len(users)}
+    for metric in ("average_duration", "average_efficiency", "average_deep_sleep", "average_rem_sleep"):
+        values = [user["summary"][metric] for user in users.values()]
+        cohort[metric] = sum(values) / len(values) if values else 0
+    
+    return {
+        "cohort": cohort,
+        "users": users
     }
-]
+
+def cohort_rows(result):
+    """
+    코호트 분석 결과를 사용자별 평탄화된 행으로 변환 (Arrow 응답용)
+    
+    Args:
+        result (dict): compute_cohort_analysis 결과
+        
+    Returns:
+        list: 행 dict 목록 (user_id, nights, summary_<지표>, optimal_sleep_<지표>)
+    """
+    rows = []
+    for user_id, user in result["users"].items():
+        row = {"user_id": user_id, "nights": user["nights"]}
+        for section in ("summary", "optimal_sleep"):
+            for key, value in user[section].items():
+                row[f"{section}_{key}"] = value
+        rows.append(row)
+    return rows
+
+def _wants_async():
+    """
+    비동기(202) 처리를 요청했는지 확인 (async=true 파라미터 또는 Prefer: respond-async 헤더)
+    """
+    return (request.args.get('async', '').lower() in ('1', 'true')
+            or 'respond-async' in request.headers.get('Prefer', ''))
+
+def _accepted_job_response(user_id, kind, fn, *args, dedup_key=None):
+    """
+    작업을 큐에 등록하고 202 응답 생성
+    
+    Args:
+        user_id (str): 작업을 요청한 사용자
+        kind (str): 작업 종류
+        fn (callable): 실행할 함수
+        *args: 함수 인자
+        dedup_key (tuple): 중복 제거 키 (dedup=false 파라미터가 있으면 무시)
+        
+    Returns:
+        Response: 202 응답 (큐가 가득 차면 503)
+    """
+    if request.args.get('dedup', '').lower() in ('0', 'false'):
+        dedup_key = None
+    
+    try:
+        job, created = job_queue.submit(user_id, kind, fn, *args, dedup_key=dedup_key)
+    except QueueFullError as e:
+        response = jsonify({
+            "success": False,
+            "error": str(e)
+        })
+        response.headers['Retry-After'] = '5'
+        return response, 503
+    
+    status_url = url_for('analysis.get_job', job_id=job.id)
+    response = jsonify({
+        "success": True,
+        "job": job.to_dict(include_result=False),
+        "deduplicated": not created,
+        "status_url": status_url
+    })
+    response.headers['Location'] = status_url
+    return response, 202
+
+def get_comprehensive_materializer():
+    """
+    종합 분석 결과 구체화 관리자 조회 (없으면 생성) - 데이터나 피드백이 바뀌면 백그라운드에서 재계산
+    
+    생성 전에 바뀐 데이터는 조회 시 버전 비교로 다시 계산됩니다.
+    
+    Returns:
+        AnalysisMaterializer: 구체화 관리자
+    """
+    global _comprehensive_materializer
+    if _comprehensive_materializer is None:
+        with _lazy_lock:
+            if _comprehensive_materializer is None:
+                _comprehensive_materializer = AnalysisMaterializer(get_health_store(), compute_comprehensive_analysis)
+    return _comprehensive_materializer
 
 # 종합 분석 API 엔드포인트
 @analysis_bp.route('/comprehensive', methods=['GET'])
+@login_required
+@conditional_get(include_date=True)
 def get_comprehensive_analysis():
     """
     종합적인 수면 분석 결과를 제공하는 API 엔드포인트
     
+    날짜 범위가 없는 기본 조회는 미리 계산된 결과를 반환합니다.
+    
     Query Parameters:
         start_date (str): 시작 날짜 (YYYY-MM-DD)
         end_date (str): 종료 날짜 (YYYY-MM-DD)
+        async (bool): true이면 202와 작업 ID를 바로 반환
+        dedup (bool): false이면 동일 요청과 작업을 공유하지 않음
     
     Returns:
-        JSON: 종합 분석 결과
+        JSON: 종합 분석 결과 (비동기 요청은 작업 정보)
     """
     try:
-        # 실제 구현에서는 Health Connect API 및 데이터베이스에서 데이터 가져오기
-        # 현재는 샘플 데이터 사용
-        from src.routes.health_connect import sample_sleep_data, sample_activity_data, sample_stress_data
+        user_id = current_user_id()
+        start_date = request.args.get('start_date')
+        end_date = request.args.get('end_date')
         
-        # 데이터 분석 실행
-        analysis_result = health_interface.process_data(
-            sleep_data=sample_sleep_data,
-            activity_data=sample_activity_data,
-            stress_data=sample_stress_data,
-            feedback_data=sample_feedback_data
-        )
+        # 비동기 요청: 작업 ID를 바로 반환 (같은 데이터 버전의 동일 요청은 작업 공유)
+        if _wants_async():
+            version = get_health_store().get_version(user_id)
+            dedup_key = ('comprehensive', user_id, start_date, end_date, version, date.today().isoformat())
+            return _accepted_job_response(
+                user_id, 'comprehensive', compute_comprehensive_analysis,
+                user_id, start_date, end_date, dedup_key=dedup_key
+            )
+        
+        # 기본 조회: 저장된 결과 JSON을 다시 파싱하지 않고 그대로 응답에 포함
+        if not start_date and not end_date:
+            result_json = get_comprehensive_materializer().get(user_id)
+            return current_app.response_class(
+                '{"success": true, "data": ' + result_json + '}',
+                mimetype='application/json'
+            )
+        
+        # 날짜 범위 조회: 요청 시 계산
+        analysis_result = compute_comprehensive_analysis(user_id, start_date, end_date)
         
         return jsonify({
             "success": True,
@@ -71,6 +270,8 @@ def get_comprehensive_analysis():
 
 # 수면 요약 API 엔드포인트
 @analysis_bp.route('/sleep_summary', methods=['GET'])
+@login_required
+@conditional_get(include_date=True)
 def get_sleep_summary():
     """
     수면 데이터 요약 정보를 제공하는 API 엔드포인트
@@ -83,12 +284,13 @@ def get_sleep_summary():
         JSON: 수면 요약 정보
     """
     try:
-        # 실제 구현에서는 Health Connect API에서 데이터 가져오기
-        # 현재는 샘플 데이터 사용
-        from src.routes.health_connect import sample_sleep_data
+        # 저장소에서 사용자 수면 데이터 조회 (컬럼형)
+        sleep_data = fetch_sleep_columns(
+            get_health_store(), current_user_id(), request.args.get('start_date'), request.args.get('end_date')
+        )
         
         # 데이터 분석 실행
-        summary_result = health_interface.get_sleep_summary(sample_sleep_data)
+        summary_result = get_health_interface().get_sleep_summary(sleep_data)
         
         return jsonify({
             "success": True,
@@ -102,6 +304,8 @@ def get_sleep_summary():
 
 # 최적 수면 시간 API 엔드포인트
 @analysis_bp.route('/optimal_sleep', methods=['GET'])
+@login_required
+@conditional_get(include_date=True)
 def get_optimal_sleep():
     """
     최적의 수면 시간 및 패턴을 제공하는 API 엔드포인트
@@ -114,14 +318,17 @@ def get_optimal_sleep():
         JSON: 최적 수면 시간 정보
     """
     try:
-        # 실제 구현에서는 Health Connect API 및 데이터베이스에서 데이터 가져오기
-        # 현재는 샘플 데이터 사용
-        from src.routes.health_connect import sample_sleep_data
+        # 저장소에서 사용자 수면 데이터 및 피드백 조회 (컬럼형)
+        user_id = current_user_id()
+        start_date = request.args.get('start_date')
+        end_date = request.args.get('end_date')
+        sleep_data = fetch_sleep_columns(get_health_store(), user_id, start_date, end_date)
+        feedback_data = get_feedback_writer().fetch_columns(user_id, start_date, end_date)
         
         # 데이터 분석 실행
-        optimal_result = health_interface.get_optimal_sleep_time(
-            sleep_data=sample_sleep_data,
-            feedback_data=sample_feedback_data
+        optimal_result = get_health_interface().get_optimal_sleep_time(
+            sleep_data=sleep_data,
+            feedback_data=feedback_data
         )
         
         return jsonify({
@@ -136,6 +343,8 @@ def get_optimal_sleep():
 
 # 수면 트렌드 API 엔드포인트
 @analysis_bp.route('/trends', methods=['GET'])
+@login_required
+@conditional_get(include_date=True)
 def get_sleep_trends():
     """
     수면 트렌드 분석 결과를 제공하는 API 엔드포인트
@@ -150,13 +359,13 @@ def get_sleep_trends():
         # 분석 기간 파라미터 가져오기
         days = request.args.get('days', default=30, type=int)
         
-        # 실제 구현에서는 Health Connect API에서 데이터 가져오기
-        # 현재는 샘플 데이터 사용
-        from src.routes.health_connect import sample_sleep_data
+        # 저장소에서 비교 구간(이전 기간)까지 포함한 수면 데이터 조회
+        start_date = (datetime.now() - timedelta(days=days * 2)).strftime('%Y-%m-%d')
+        sleep_data = fetch_sleep_columns(get_health_store(), current_user_id(), start_date)
         
         # 데이터 분석 실행
-        trends_result = health_interface.analyze_sleep_trends(
-            sleep_data=sample_sleep_data,
+        trends_result = get_health_interface().analyze_sleep_trends(
+            sleep_data=sleep_data,
             days=days
         )
         
@@ -172,6 +381,8 @@ def get_sleep_trends():
 
 # 상관관계 분석 API 엔드포인트
 @analysis_bp.route('/correlations', methods=['GET'])
+@login_required
+@conditional_get(include_date=True)
 def get_correlations():
     """
     수면과 다른 지표 간의 상관관계 분석 결과를 제공하는 API 엔드포인트
@@ -180,15 +391,15 @@ def get_correlations():
         JSON: 상관관계 분석 결과
     """
     try:
-        # 실제 구현에서는 Health Connect API에서 데이터 가져오기
-        # 현재는 샘플 데이터 사용
-        from src.routes.health_connect import sample_sleep_data, sample_activity_data, sample_stress_data
+        # 저장소에서 사용자 데이터 조회 (컬럼형)
+        store = get_health_store()
+        user_id = current_user_id()
         
         # 데이터 분석 실행
-        correlations_result = health_interface.analyze_correlations(
-            sleep_data=sample_sleep_data,
-            activity_data=sample_activity_data,
-            stress_data=sample_stress_data
+        correlations_result = get_health_interface().analyze_correlations(
+            sleep_data=fetch_sleep_columns(store, user_id),
+            activity_data=fetch_history_columns(store, 'activity', user_id),
+            stress_data=fetch_history_columns(store, 'stress', user_id)
         )
         
         return jsonify({
@@ -200,3 +411,176 @@ def get_correlations():
             "success": False,
             "error": str(e)
         }), 500
+
+# 배치 분석 API 엔드포인트
+@analysis_bp.route('/batch', methods=['GET'])
+@login_required
+@conditional_get(include_date=True)
+def get_analysis_batch():
+    """
+    여러 분석 섹션을 한 번의 요청으로 제공하는 API 엔드포인트
+    
+    섹션마다 개별 엔드포인트와 같은 기간의 데이터를 분석하므로 결과도 같습니다.
+    조회 기간이 같은 섹션끼리는 데이터를 한 번만 조회하고 하나의 분석기에 로드해,
+    정렬된 데이터와 취침/기상 시각 등 중간 계산 결과를 공유합니다.
+    
+    Query Parameters:
+        sections (str): 쉼표로 구분한 섹션 목록 (summary, optimal_sleep, trends, correlations, 기본값: 전체)
+        start_date (str): 시작 날짜 (YYYY-MM-DD, summary와 optimal_sleep에 적용)
+        end_date (str): 종료 날짜 (YYYY-MM-DD, summary와 optimal_sleep에 적용)
+        days (int): 추세 분석 기간 (일, trends는 최근 days*2일의 데이터 사용)
+    
+    Returns:
+        JSON: 섹션 이름 -> 분석 결과
+    """
+    health_interface = get_health_interface()
+    sections = [section.strip() for section in request.args.get('sections', '').split(',') if section.strip()]
+    if not sections:
+        sections = list(health_interface.analyzer_class.SECTIONS)
+    
+    unknown = [section for section in sections if section not in health_interface.analyzer_class.SECTIONS]
+    if unknown:
+        return jsonify({
+            "success": False,
+            "message": f"알 수 없는 분석 섹션입니다: {', '.join(unknown)}"
+        }), 400
+    
+    # 중복 제거 (요청 순서 유지)
+    sections = list(dict.fromkeys(sections))
+    
+    try:
+        store = get_health_store()
+        user_id = current_user_id()
+        start_date = request.args.get('start_date')
+        end_date = request.args.get('end_date')
+        days = request.args.get('days', default=30, type=int)
+        
+        # 섹션별 조회 기간은 개별 엔드포인트와 같게 맞춤 (trends: 최근 days*2일, correlations: 전체 기간)
+        trends_start = (datetime.now() - timedelta(days=days * 2)).strftime('%Y-%m-%d')
+        section_ranges = {
+            'summary': (start_date, end_date),
+            'optimal_sleep': (start_date, end_date),
+            'trends': (trends_start, None),
+            'correlations': (None, None)
+        }
+        
+        # 기간이 같은 섹션끼리 데이터를 한 번만 조회하고 분석기 하나를 공유
+        groups = {}
+        for section in sections:
+            groups.setdefault(section_ranges[section], []).append(section)
+        
+        computed = {}
+        for (range_start, range_end), group in groups.items():
+            needs_correlations = 'correlations' in group
+            computed.update(health_interface.analyze_sections(
+                group,
+                sleep_data=fetch_sleep_columns(store, user_id, range_start, range_end),
+                activity_data=fetch_history_columns(store, 'activity', user_id, range_start, range_end) if needs_correlations else None,
+                stress_data=fetch_history_columns(store, 'stress', user_id, range_start, range_end) if needs_correlations else None,
+                feedback_data=get_feedback_writer().fetch_columns(user_id, range_start, range_end) if 'optimal_sleep' in group else None,
+                days=days
+            ))
+        results = {section: computed[section] for section in sections}
+        
+        return jsonify({
+            "success": True,
+            "data": results
+        })
+    except Exception as e:
+        return jsonify({
+            "success": False,
+            "error": str(e)
+        }), 500
+
+# 코호트 분석 API 엔드포인트
+@analysis_bp.route('/cohort', methods=['POST'])
+@login_required
+def request_cohort_analysis():
+    """
+    여러 사용자의 코호트 분석 작업을 등록하는 API 엔드포인트 (항상 비동기 처리)
+    
+    다른 사용자가 포함된 코호트는 관리자(ADMIN_EMAILS)만 요청할 수 있습니다.
+    
+    Request Body:
+        user_ids (list): 사용자 식별자 목록
+        start_date (str): 시작 날짜 (YYYY-MM-DD, 선택)
+        end_date (str): 종료 날짜 (YYYY-MM-DD, 선택)
+    
+    Returns:
+        JSON: 작업 정보 (202)
+    """
+    data = request.get_json(silent=True) or {}
+    user_ids = data.get('user_ids')
+    
+    if not isinstance(user_ids, list) or not user_ids or not all(isinstance(user_id, str) for user_id in user_ids):
+        return jsonify({
+            "success": False,
+            "message": "user_ids는 사용자 식별자 문자열 목록이어야 합니다."
+        }), 400
+    
+    if len(user_ids) > MAX_COHORT_USERS:
+        return jsonify({
+            "success": False,
+            "message": f"한 번에 최대 {MAX_COHORT_USERS}명까지 분석할 수 있습니다."
+        }), 400
+    
+    user_ids = sorted(set(user_ids))
+    requester = current_user_id()
+    if user_ids != [requester] and not is_admin():
+        return jsonify({
+            "success": False,
+            "message": "다른 사용자의 데이터는 관리자만 분석할 수 있습니다."
+        }), 403
+    
+    start_date = data.get('start_date')
+    end_date = data.get('end_date')
+    
+    # 사용자별 데이터 버전을 키에 포함해 데이터가 바뀌면 새 작업 생성
+    # (작업 조회는 요청한 사용자만 가능하므로 요청자별로 작업을 공유)
+    store = get_health_store()
+    versions = tuple(store.get_version(user_id) for user_id in user_ids)
+    dedup_key = ('cohort', requester, tuple(user_ids), start_date, end_date, versions, date.today().isoformat())
+    
+    return _accepted_job_response(
+        requester, 'cohort', compute_cohort_analysis,
+        user_ids, start_date, end_date, dedup_key=dedup_key
+    )
+
+# 분석 작업 상태 API 엔드포인트
+@analysis_bp.route('/jobs/<job_id>', methods=['GET'])
+@login_required
+def get_job(job_id):
+    """
+    분석 작업 상태 및 결과를 제공하는 API 엔드포인트
+    
+    Path Parameters:
+        job_id (str): 작업 ID
+    
+    Accept: application/vnd.apache.arrow.stream이면 완료된 코호트 결과를 사용자별 한 행의
+    Arrow IPC 스트림으로 반환 (코호트 평균은 스키마 메타데이터 cohort에 JSON으로 포함)
+    
+    Returns:
+        JSON: 작업 상태 (완료된 경우 결과 포함)
+    """
+    job = job_queue.get(job_id)
+    
+    # 다른 사용자의 작업은 존재 여부도 노출하지 않음
+    if job is None or job.user_id != current_user_id():
+        return jsonify({
+            "success": False,
+            "message": "작업을 찾을 수 없습니다."
+        }), 404
+    
+    # 완료된 코호트 결과는 Arrow로도 제공 (진행 중이거나 실패한 작업은 JSON 상태)
+    if job.kind == 'cohort' and job.status == 'succeeded' and wants_arrow():
+        if not arrow_available():
+            return arrow_unavailable_response()
+        return table_response(cohort_rows(job.result), metadata={"cohort": dumps(job.result["cohort"])})
+    
+    response = jsonify({
+        "success": True,
+        "job": job.to_dict()
+    })
+    if not job.finished:
+        response.headers['Retry-After'] = '1'
+    return response
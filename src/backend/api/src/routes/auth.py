@@ -1,22 +1,29 @@
-from flask import Blueprint, jsonify, request
-from werkzeug.security import generate_password_hash, check_password_hash
-import jwt
+from flask import Blueprint, g, jsonify, request
+from sqlalchemy.exc import IntegrityError
+from werkzeug.security import generate_password_hash
 import datetime
-import os
+from src.backend.api.src.models.user import create_user, find_credentials, seed_default_user
+from src.backend.api.src.utils.auth import PasswordPoolBusyError, encode_token, login_required, password_hasher
 
 # Blueprint 정의
 auth_bp = Blueprint('auth', __name__)
 
-# 샘플 사용자 데이터 - 실제 구현에서는 데이터베이스에서 관리
-users = {
-    "test@example.com": {
-        "password": generate_password_hash("password123"),
-        "name": "테스트 사용자"
-    }
-}
+def seed_test_user():
+    """
+    테스트 사용자가 없으면 생성 (앱 컨텍스트 안에서 호출)
+    """
+    seed_default_user("test@example.com", lambda: generate_password_hash("password123"), "테스트 사용자")
 
-# JWT 시크릿 키 - 실제 구현에서는 환경 변수로 관리
-SECRET_KEY = os.environ.get('JWT_SECRET_KEY', 'dev_secret_key')
+def _busy_response(error):
+    """
+    비밀번호 해시 작업 풀이 가득 찬 경우의 503 응답
+    """
+    response = jsonify({
+        "success": False,
+        "message": str(error)
+    })
+    response.headers['Retry-After'] = '1'
+    return response, 503
 
 # 로그인 API 엔드포인트
 @auth_bp.route('/login', methods=['POST'])
@@ -42,21 +49,26 @@ def login():
     email = data.get('email')
     password = data.get('password')
     
-    # 사용자 확인
-    user = users.get(email)
+    # 사용자 확인 (해시 검증은 전용 작업 풀에서 실행)
+    user = find_credentials(email)
     
-    if not user or not check_password_hash(user['password'], password):
+    try:
+        valid = user is not None and user.password_hash is not None and password_hasher.verify(user.password_hash, password)
+    except PasswordPoolBusyError as e:
+        return _busy_response(e)
+    
+    if not valid:
         return jsonify({
             "success": False,
             "message": "이메일 또는 비밀번호가 올바르지 않습니다."
         }), 401
     
     # JWT 토큰 생성
-    token = jwt.encode({
+    token = encode_token({
         'email': email,
-        'name': user['name'],
+        'name': user.name,
         'exp': datetime.datetime.utcnow() + datetime.timedelta(days=1)
-    }, SECRET_KEY, algorithm='HS256')
+    })
     
     return jsonify({
         "success": True,
@@ -64,7 +76,7 @@ def login():
         "token": token,
         "user": {
             "email": email,
-            "name": user['name']
+            "name": user.name
         }
     })
 
@@ -94,18 +106,27 @@ def register():
     password = data.get('password')
     name = data.get('name')
     
-    # 이메일 중복 확인
-    if email in users:
+    # 이메일 중복 확인 (해시 계산 전에 빠르게 거절)
+    if find_credentials(email) is not None:
         return jsonify({
             "success": False,
             "message": "이미 등록된 이메일입니다."
         }), 400
     
-    # 사용자 등록
-    users[email] = {
-        "password": generate_password_hash(password),
-        "name": name
-    }
+    # 사용자 등록 (해시 생성은 전용 작업 풀에서 실행)
+    try:
+        password_hash = password_hasher.hash(password)
+    except PasswordPoolBusyError as e:
+        return _busy_response(e)
+    
+    # 동시에 같은 이메일로 가입한 경우 고유 인덱스가 중복을 막음
+    try:
+        create_user(email, password_hash, name)
+    except IntegrityError:
+        return jsonify({
+            "success": False,
+            "message": "이미 등록된 이메일입니다."
+        }), 400
     
     return jsonify({
         "success": True,
@@ -118,6 +139,7 @@ def register():
 
 # 토큰 검증 API 엔드포인트
 @auth_bp.route('/verify', methods=['GET'])
+@login_required
 def verify_token():
     """
     JWT 토큰 검증 API 엔드포인트
@@ -128,35 +150,11 @@ def verify_token():
     Returns:
         JSON: 토큰 검증 결과
     """
-    auth_header = request.headers.get('Authorization')
-    
-    if not auth_header or not auth_header.startswith('Bearer '):
-        return jsonify({
-            "success": False,
-            "message": "유효한 인증 토큰이 필요합니다."
-        }), 401
-    
-    token = auth_header.split(' ')[1]
-    
-    try:
-        # 토큰 디코딩 및 검증
-        payload = jwt.decode(token, SECRET_KEY, algorithms=['HS256'])
-        
-        return jsonify({
-            "success": True,
-            "message": "유효한 토큰입니다.",
-            "user": {
-                "email": payload['email'],
-                "name": payload['name']
-            }
-        })
-    except jwt.ExpiredSignatureError:
-        return jsonify({
-            "success": False,
-            "message": "토큰이 만료되었습니다."
-        }), 401
-    except jwt.InvalidTokenError:
-        return jsonify({
-            "success": False,
-            "message": "유효하지 않은 토큰입니다."
-        }), 401
+    return jsonify({
+        "success": True,
+        "message": "유효한 토큰입니다.",
+        "user": {
+            "email": g.current_user['email'],
+            "name": g.current_user['name']
+        }
+    })
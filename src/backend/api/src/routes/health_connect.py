@@ -1,102 +1,282 @@
-from flask import Blueprint, jsonify, request
+from flask import Blueprint, current_app, jsonify, request
 from datetime import datetime, timedelta
+import base64
+import binascii
+import csv
+import io
+import itertools
+import json
+from src.backend.api.src.models.health_archive import count_history_range, fetch_history_columns, get_health_archive, iter_history_rows
+from src.backend.api.src.models.health_store import TABLES, get_health_store
+from src.backend.api.src.services.feedback_writer import get_feedback_writer
+from src.backend.api.src.services.health_connect_sync import sync_user_data
+from src.backend.api.src.utils.arrow_format import (
+    ARROW_STREAM_MIMETYPE, arrow_available, arrow_stream_response, arrow_unavailable_response, iter_arrow_stream,
+    record_schema, wants_arrow
+)
+from src.backend.api.src.utils.auth import login_required
+from src.backend.api.src.utils.current_user import DEFAULT_USER_ID, current_user_id
+from src.backend.api.src.utils.http_cache import conditional_get
+from src.backend.api.src.utils.json_provider import dumps
+from src.data_analysis.src.analysis.downsampling import DATE_COLUMNS, RESOLUTIONS, aggregate_buckets, downsample_columns, to_days
+from src.data_analysis.src.health_connect_schema import RecordValidationError, get_schema, record_from_columns, to_record, validate_record
 
 # Blueprint 정의
 health_connect_bp = Blueprint('health_connect', __name__)
 
-# 샘플 데이터 - 실제 구현에서는 Health Connect API와 연동
-sample_sleep_data = [
-    {
-        "id": "sleep_1",
-        "start_time": (datetime.now() - timedelta(days=1)).replace(hour=23, minute=0, second=0).isoformat(),
-        "end_time": datetime.now().replace(hour=7, minute=15, second=0).isoformat(),
-        "duration": 8 * 60 + 15,  # 분 단위
-        "efficiency": 85,
-        "stages": {
-            "deep": 105,  # 분 단위
-            "light": 250,
-            "rem": 80,
-            "awake": 50
-        }
-    },
-    {
-        "id": "sleep_2",
-        "start_time": (datetime.now() - timedelta(days=2)).replace(hour=23, minute=30, second=0).isoformat(),
-        "end_time": (datetime.now() - timedelta(days=1)).replace(hour=6, minute=45, second=0).isoformat(),
-        "duration": 7 * 60 + 15,
-        "efficiency": 82,
-        "stages": {
-            "deep": 95,
-            "light": 230,
-            "rem": 75,
-            "awake": 55
-        }
-    },
-    {
-        "id": "sleep_3",
-        "start_time": (datetime.now() - timedelta(days=3)).replace(hour=22, minute=45, second=0).isoformat(),
-        "end_time": (datetime.now() - timedelta(days=2)).replace(hour=6, minute=30, second=0).isoformat(),
-        "duration": 7 * 60 + 45,
-        "efficiency": 88,
-        "stages": {
-            "deep": 110,
-            "light": 240,
-            "rem": 85,
-            "awake": 40
-        }
-    }
-]
-
-sample_activity_data = [
-    {
-        "id": "activity_1",
-        "date": (datetime.now() - timedelta(days=1)).date().isoformat(),
-        "steps": 8750,
-        "active_minutes": 45,
-        "calories": 320
-    },
-    {
-        "id": "activity_2",
-        "date": (datetime.now() - timedelta(days=2)).date().isoformat(),
-        "steps": 10200,
-        "active_minutes": 60,
-        "calories": 380
-    },
-    {
-        "id": "activity_3",
-        "date": (datetime.now() - timedelta(days=3)).date().isoformat(),
-        "steps": 7500,
-        "active_minutes": 35,
-        "calories": 280
-    }
-]
-
-sample_stress_data = [
-    {
-        "id": "stress_1",
-        "date": (datetime.now() - timedelta(days=1)).date().isoformat(),
-        "average_score": 45,
-        "max_score": 75,
-        "min_score": 20
-    },
-    {
-        "id": "stress_2",
-        "date": (datetime.now() - timedelta(days=2)).date().isoformat(),
-        "average_score": 52,
-        "max_score": 80,
-        "min_score": 25
-    },
-    {
-        "id": "stress_3",
-        "date": (datetime.now() - timedelta(days=3)).date().isoformat(),
-        "average_score": 38,
-        "max_score": 65,
-        "min_score": 15
-    }
-]
+# 페이지 크기 기본값 및 최대값
+DEFAULT_PAGE_LIMIT = 366
+MAX_PAGE_LIMIT = 1000
+
+# 일괄 업로드 설정 - 배치당 행 수, 한 줄 최대 크기, 응답에 포함할 최대 오류 수
+BULK_BATCH_SIZE = 500
+BULK_MAX_LINE_BYTES = 64 * 1024
+BULK_MAX_REPORTED_ERRORS = 100
+
+# 내보내기 형식별 MIME 타입 및 한 번에 전송할 행 수
+EXPORT_MIMETYPES = {
+    'ndjson': 'application/x-ndjson',
+    'csv': 'text/csv',
+    'arrow': ARROW_STREAM_MIMETYPE
+}
+EXPORT_CHUNK_ROWS = 500
+
+# Arrow 응답의 레코드 배치당 행 수
+ARROW_BATCH_ROWS = 8192
+
+def seed_sample_data(store=None, user_id=DEFAULT_USER_ID, days=30):
+    """
+    저장소가 비어 있으면 기본 사용자의 샘플 데이터 저장 (개발 및 데모용)
+    
+    Args:
+        store (HealthDataStore): 저장소 (기본값: 전역 저장소)
+        user_id (str): 샘플 데이터를 저장할 사용자
+        days (int): 샘플 데이터 기간 (일)
+    """
+    store = store or get_health_store()
+    if store.count('sleep', user_id) > 0:
+        return
+    
+    # 샘플 생성기는 저장소가 비어 있을 때만 필요하므로 여기서 불러옴
+    from src.data_analysis.src.health_connect_client import HealthConnectClient
+    client = HealthConnectClient(use_sample_data=True)
+    start_date = (datetime.now() - timedelta(days=days)).strftime('%Y-%m-%d')
+    end_date = (datetime.now() - timedelta(days=1)).strftime('%Y-%m-%d')
+    store.upsert('sleep', user_id, client.get_sleep_data(start_date, end_date))
+    store.upsert('activity', user_id, client.get_activity_data(start_date, end_date))
+    store.upsert('stress', user_id, client.get_stress_data(start_date, end_date))
+    store.upsert('feedback', user_id, [
+        {"date": (datetime.now() - timedelta(days=1)).date().isoformat(), "sleep_satisfaction": 4, "morning_condition": 4, "notes": "잘 잤음"},
+        {"date": (datetime.now() - timedelta(days=2)).date().isoformat(), "sleep_satisfaction": 3, "morning_condition": 3, "notes": "평범했음"},
+        {"date": (datetime.now() - timedelta(days=3)).date().isoformat(), "sleep_satisfaction": 5, "morning_condition": 4, "notes": "매우 잘 잤음"}
+    ])
+
+def _encode_cursor(record_type, day):
+    """
+    다음 페이지 커서 생성 (레코드 유형과 마지막 날짜를 담은 불투명 토큰)
+    """
+    return base64.urlsafe_b64encode(f"{record_type}:{day}".encode('utf-8')).decode('ascii').rstrip('=')
+
+def _decode_cursor(record_type, token):
+    """
+    다음 페이지 커서 해석
+    
+    Returns:
+        str: 이전 페이지의 마지막 날짜, 잘못된 커서이면 None
+    """
+    try:
+        padded = token + '=' * (-len(token) % 4)
+        kind, day = base64.urlsafe_b64decode(padded.encode('ascii')).decode('utf-8').split(':', 1)
+        datetime.strptime(day, '%Y-%m-%d')
+    except (ValueError, binascii.Error, UnicodeError):
+        return None
+    return day if kind == record_type else None
+
+def _parse_date_param(name):
+    """
+    날짜 쿼리 파라미터 검증 (YYYY-MM-DD)
+    
+    Returns:
+        str: 날짜 문자열 (없으면 None)
+    """
+    value = request.args.get(name)
+    if value:
+        datetime.strptime(value, '%Y-%m-%d')
+    return value or None
+
+def _paged_records_response(record_type):
+    """
+    날짜 범위 필터와 커서 페이지네이션을 적용한 레코드 목록 응답
+    
+    Args:
+        record_type (str): 레코드 유형 (sleep, activity, stress)
+        
+    Returns:
+        Response: JSON 응답 (data, next)
+    """
+    try:
+        start_date = _parse_date_param('start_date')
+        end_date = _parse_date_param('end_date')
+    except ValueError:
+        return jsonify({
+            "success": False,
+            "message": "날짜는 YYYY-MM-DD 형식이어야 합니다."
+        }), 400
+    
+    # Arrow 요청은 페이지 없이 날짜 범위 전체를 레코드 배치로 스트리밍
+    if wants_arrow():
+        return _arrow_records_response(record_type, start_date, end_date)
+    
+    # 차트용 다운샘플링 요청은 페이지 없이 전체 구간을 줄여서 반환
+    if request.args.get('resolution') or request.args.get('max_points'):
+        return _downsampled_response(record_type, start_date, end_date)
+    
+    limit = request.args.get('limit') or DEFAULT_PAGE_LIMIT
+    try:
+        limit = int(limit)
+    except ValueError:
+        limit = 0
+    if limit < 1:
+        return jsonify({
+            "success": False,
+            "message": "limit은 1 이상의 정수여야 합니다."
+        }), 400
+    limit = min(limit, MAX_PAGE_LIMIT)
+    
+    after = None
+    token = request.args.get('next')
+    if token:
+        after = _decode_cursor(record_type, token)
+        if after is None:
+            return jsonify({
+                "success": False,
+                "message": "유효하지 않은 페이지 커서입니다."
+            }), 400
+    
+    store = get_health_store()
+    user_id = current_user_id()
+    page_start = start_date
+    if after:
+        following = (datetime.strptime(after, '%Y-%m-%d') + timedelta(days=1)).strftime('%Y-%m-%d')
+        page_start = max(start_date or following, following)
+    
+    # 보관된 구간이 포함되면 보관소와 합친 행에서 페이지를 만듦 (그 외에는 저장소 키셋 조회)
+    archive = get_health_archive()
+    if archive is not None and archive.covers(record_type, page_start):
+        day_index = [spec.column for spec in get_schema(record_type)].index(TABLES[record_type][1])
+        rows = list(itertools.islice(iter_history_rows(store, record_type, user_id, page_start, end_date), limit + 1))
+        data = [to_record(row, record_type) for row in rows[:limit]]
+        last_day = rows[limit - 1][day_index][:10] if len(rows) > limit else None
+    else:
+        data, last_day = store.fetch_page(record_type, user_id, start_date, end_date, after, limit)
+    
+    return jsonify({
+        "success": True,
+        "data": data,
+        "next": _encode_cursor(record_type, last_day) if last_day else None
+    })
+
+def _row_batches(store, record_type, user_id, start_date, end_date, offset=0, batch_size=ARROW_BATCH_ROWS):
+    """
+    저장소(및 보관소)의 행을 batch_size개씩 묶어 반환하는 생성기
+    """
+    rows = iter_history_rows(store, record_type, user_id, start_date, end_date, offset, batch_size)
+    while True:
+        batch = list(itertools.islice(rows, batch_size))
+        if not batch:
+            break
+        yield batch
+
+def _arrow_records_response(record_type, start_date, end_date):
+    """
+    날짜 범위의 레코드를 Arrow IPC 스트림으로 응답
+    
+    저장소 커서에서 ARROW_BATCH_ROWS개씩 읽어 바로 레코드 배치로 변환하므로
+    레코드 dict나 JSON을 만들지 않고, 메모리 사용량이 일정합니다.
+    
+    Args:
+        record_type (str): 레코드 유형 (sleep, activity, stress)
+        start_date (str): 시작 날짜 (YYYY-MM-DD, 선택)
+        end_date (str): 종료 날짜 (YYYY-MM-DD, 선택)
+        
+    Returns:
+        Response: Arrow IPC 스트리밍 응답 (스키마 컬럼 순서, 수면 단계는 stages_<단계> 컬럼)
+    """
+    if request.args.get('resolution') or request.args.get('max_points'):
+        return jsonify({
+            "success": False,
+            "message": "다운샘플링 응답은 JSON으로만 제공합니다."
+        }), 406
+    if not arrow_available():
+        return arrow_unavailable_response()
+    
+    batches = _row_batches(get_health_store(), record_type, current_user_id(), start_date, end_date)
+    return arrow_stream_response(record_schema(record_type), batches)
+
+def _downsampled_response(record_type, start_date, end_date):
+    """
+    차트용으로 줄인 시계열 응답
+    
+    resolution(day/week/month)은 구간별 평균/최소/최대를, max_points는 LTTB로
+    선택한 원본 레코드를 반환합니다.
+    
+    Args:
+        record_type (str): 레코드 유형 (sleep, activity, stress)
+        start_date (str): 시작 날짜 (YYYY-MM-DD, 선택)
+        end_date (str): 종료 날짜 (YYYY-MM-DD, 선택)
+        
+    Returns:
+        Response: JSON 응답 (data, source_points)
+    """
+    resolution = request.args.get('resolution')
+    max_points = request.args.get('max_points')
+    
+    if resolution and max_points:
+        return jsonify({
+            "success": False,
+            "message": "resolution과 max_points는 함께 사용할 수 없습니다."
+        }), 400
+    if resolution and resolution not in RESOLUTIONS:
+        return jsonify({
+            "success": False,
+            "message": f"resolution은 {', '.join(RESOLUTIONS)} 중 하나여야 합니다."
+        }), 400
+    if max_points:
+        try:
+            max_points = int(max_points)
+        except ValueError:
+            max_points = 0
+        if not 3 <= max_points <= MAX_PAGE_LIMIT:
+            return jsonify({
+                "success": False,
+                "message": f"max_points는 3 이상 {MAX_PAGE_LIMIT} 이하의 정수여야 합니다."
+            }), 400
+    
+    schema = get_schema(record_type)
+    columns = fetch_history_columns(get_health_store(), record_type, current_user_id(), start_date, end_date)
+    source_points = len(columns['id'])
+    
+    if resolution:
+        numeric = {spec.column: columns[spec.column] for spec in schema if spec.kind in ('int', 'float')}
+        data = aggregate_buckets(to_days(columns[DATE_COLUMNS[record_type]]), numeric, resolution)
+    else:
+        indices = downsample_columns(record_type, columns, max_points) if source_points else []
+        values = [columns[spec.column] for spec in schema]
+        data = [to_record(tuple(column[index] for column in values), record_type) for index in indices]
+    
+    return jsonify({
+        "success": True,
+        "data": data,
+        "resolution": resolution,
+        "max_points": max_points or None,
+        "source_points": source_points,
+        "next": None
+    })
 
 # 수면 데이터 API 엔드포인트
 @health_connect_bp.route('/sleep', methods=['GET'])
+@login_required
+@conditional_get()
 def get_sleep_data():
     """
     수면 데이터를 가져오는 API 엔드포인트
@@ -104,19 +284,22 @@ def get_sleep_data():
     Query Parameters:
         start_date (str): 시작 날짜 (YYYY-MM-DD)
         end_date (str): 종료 날짜 (YYYY-MM-DD)
+        limit (int): 페이지 크기 (기본값 366, 최대 1000)
+        next (str): 이전 응답의 다음 페이지 커서
+        resolution (str): day, week, month 구간별 평균/최소/최대 집계 (페이지 없음)
+        max_points (int): LTTB로 줄일 최대 점 수 (페이지 없음)
+    
+    Accept: application/vnd.apache.arrow.stream이면 날짜 범위 전체를 Arrow IPC 스트림으로 반환 (페이지 없음)
     
     Returns:
-        JSON: 수면 데이터 목록
+        JSON: 수면 데이터 목록 및 다음 페이지 커서
     """
-    # 실제 구현에서는 Health Connect API를 통해 데이터 가져오기
-    # 현재는 샘플 데이터 반환
-    return jsonify({
-        "success": True,
-        "data": sample_sleep_data
-    })
+    return _paged_records_response('sleep')
 
 # 활동 데이터 API 엔드포인트
 @health_connect_bp.route('/activity', methods=['GET'])
+@login_required
+@conditional_get()
 def get_activity_data():
     """
     활동 데이터를 가져오는 API 엔드포인트
@@ -124,19 +307,22 @@ def get_activity_data():
     Query Parameters:
         start_date (str): 시작 날짜 (YYYY-MM-DD)
         end_date (str): 종료 날짜 (YYYY-MM-DD)
+        limit (int): 페이지 크기 (기본값 366, 최대 1000)
+        next (str): 이전 응답의 다음 페이지 커서
+        resolution (str): day, week, month 구간별 평균/최소/최대 집계 (페이지 없음)
+        max_points (int): LTTB로 줄일 최대 점 수 (페이지 없음)
+    
+    Accept: application/vnd.apache.arrow.stream이면 날짜 범위 전체를 Arrow IPC 스트림으로 반환 (페이지 없음)
     
     Returns:
-        JSON: 활동 데이터 목록
+        JSON: 활동 데이터 목록 및 다음 페이지 커서
     """
-    # 실제 구현에서는 Health Connect API를 통해 데이터 가져오기
-    # 현재는 샘플 데이터 반환
-    return jsonify({
-        "success": True,
-        "data": sample_activity_data
-    })
+    return _paged_records_response('activity')
 
 # 스트레스 데이터 API 엔드포인트
 @health_connect_bp.route('/stress', methods=['GET'])
+@login_required
+@conditional_get()
 def get_stress_data():
     """
     스트레스 데이터를 가져오는 API 엔드포인트
@@ -144,19 +330,340 @@ def get_stress_data():
     Query Parameters:
         start_date (str): 시작 날짜 (YYYY-MM-DD)
         end_date (str): 종료 날짜 (YYYY-MM-DD)
+        limit (int): 페이지 크기 (기본값 366, 최대 1000)
+        next (str): 이전 응답의 다음 페이지 커서
+        resolution (str): day, week, month 구간별 평균/최소/최대 집계 (페이지 없음)
+        max_points (int): LTTB로 줄일 최대 점 수 (페이지 없음)
+    
+    Accept: application/vnd.apache.arrow.stream이면 날짜 범위 전체를 Arrow IPC 스트림으로 반환 (페이지 없음)
+    
+    Returns:
+        JSON: 스트레스 데이터 목록 및 다음 페이지 커서
+    """
+    return _paged_records_response('stress')
+
+def _iter_ndjson_lines(stream):
+    """
+    요청 본문 스트림에서 NDJSON 줄을 하나씩 읽기 (본문 전체를 메모리에 올리지 않음)
+    
+    Args:
+        stream: 요청 본문 스트림
+        
+    Yields:
+        tuple: (줄 번호, 레코드 또는 None, 오류 메시지 또는 None)
+    """
+    line_number = 0
+    while True:
+        line = stream.readline(BULK_MAX_LINE_BYTES + 1)
+        if not line:
+            break
+        line_number += 1
+        
+        # 너무 긴 줄은 나머지를 버리고 오류 처리
+        if len(line) > BULK_MAX_LINE_BYTES:
+            while line and not line.endswith(b'\n'):
+                line = stream.readline(BULK_MAX_LINE_BYTES)
+            yield line_number, None, f"한 줄은 {BULK_MAX_LINE_BYTES}바이트를 넘을 수 없습니다."
+            continue
+        
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            yield line_number, json.loads(line), None
+        except ValueError as e:
+            yield line_number, None, f"JSON 디코딩 실패: {e}"
+
+def _iter_csv_rows(stream, record_type):
+    """
+    요청 본문 스트림에서 CSV 행을 하나씩 읽기 (첫 줄은 컬럼 이름, 예: stages_deep)
+    
+    Args:
+        stream: 요청 본문 스트림
+        record_type (str): 레코드 유형
+        
+    Yields:
+        tuple: (줄 번호, 레코드 또는 None, 오류 메시지 또는 None)
+    """
+    def lines():
+        # 줄 단위로 디코딩해 잘못된 UTF-8이 있는 줄 앞까지는 정상 처리
+        for line in iter(stream.readline, b''):
+            yield line.decode('utf-8')
+    
+    reader = csv.DictReader(lines())
+    while True:
+        # 잘못된 UTF-8이나 너무 긴 필드 이후로는 행 경계를 알 수 없으므로 오류로 보고하고 중단
+        try:
+            row = next(reader)
+        except StopIteration:
+            break
+        except UnicodeDecodeError:
+            yield reader.line_num + 1, None, "UTF-8로 디코딩할 수 없습니다. 이후 행은 처리하지 않았습니다."
+            break
+        except csv.Error as e:
+            yield reader.line_num + 1, None, f"CSV 파싱 실패: {e}. 이후 행은 처리하지 않았습니다."
+            break
+        try:
+            yield reader.line_num, record_from_columns(row, record_type), None
+        except RecordValidationError as e:
+            yield reader.line_num, None, e.message if e.field is None else f"{e.field}: {e.message}"
+
+# 일괄 업로드 API 엔드포인트
+@health_connect_bp.route('/<any(sleep, activity, stress):record_type>/bulk', methods=['POST'])
+@login_required
+def bulk_upload(record_type):
+    """
+    수면/활동/스트레스 레코드를 스트리밍으로 일괄 저장하는 API 엔드포인트
+    
+    본문을 한 줄씩 읽어 검증하고, BULK_BATCH_SIZE개씩 하나의 트랜잭션으로
+    저장합니다. 잘못된 행은 건너뛰고 줄 번호와 함께 보고합니다.
+    
+    Path Parameters:
+        record_type (str): 레코드 유형 (sleep, activity, stress)
+    
+    Request Body:
+        application/x-ndjson: 한 줄에 레코드 하나인 JSON
+        text/csv: 첫 줄이 컬럼 이름인 CSV (수면 단계는 stages_deep 등 평탄화된 컬럼)
+    
+    Returns:
+        JSON: 저장 및 거부 건수, 행별 오류
+    """
+    store = get_health_store()
+    user_id = current_user_id()
+    
+    if request.mimetype == 'text/csv':
+        rows = _iter_csv_rows(request.stream, record_type)
+    else:
+        rows = _iter_ndjson_lines(request.stream)
+    
+    batch = []
+    accepted = 0
+    rejected = 0
+    batches = 0
+    errors = []
+    
+    for line_number, record, error in rows:
+        if error is None:
+            try:
+                batch.append(validate_record(record, record_type))
+            except RecordValidationError as e:
+                error = e.message if e.field is None else f"{e.field}: {e.message}"
+        
+        if error is not None:
+            rejected += 1
+            if len(errors) < BULK_MAX_REPORTED_ERRORS:
+                errors.append({"line": line_number, "message": error})
+            continue
+        
+        if len(batch) >= BULK_BATCH_SIZE:
+            accepted += store.upsert_rows(record_type, user_id, batch)
+            batches += 1
+            batch = []
+    
+    if batch:
+        accepted += store.upsert_rows(record_type, user_id, batch)
+        batches += 1
+    
+    return jsonify({
+        "success": rejected == 0,
+        "accepted": accepted,
+        "rejected": rejected,
+        "batches": batches,
+        "errors": errors,
+        "errors_truncated": rejected > len(errors)
+    })
+
+def _export_ndjson(store, user_id, record_types, start_date, end_date, offset):
+    """
+    NDJSON 내보내기 생성기 - 한 줄에 {"type": 유형, ...레코드}
+    
+    offset은 유형 순서대로 이어 붙인 전체 줄 기준이며, 앞선 유형의 행 수를
+    세어 건너뛸 유형은 조회하지 않습니다.
+    """
+    for record_type in record_types:
+        if offset:
+            count = count_history_range(store, record_type, user_id, start_date, end_date)
+            if offset >= count:
+                offset -= count
+                continue
+        
+        lines = []
+        for row in iter_history_rows(store, record_type, user_id, start_date, end_date, offset, EXPORT_CHUNK_ROWS):
+            record = to_record(row, record_type)
+            record['type'] = record_type
+            lines.append(dumps(record))
+            if len(lines) >= EXPORT_CHUNK_ROWS:
+                yield '\n'.join(lines) + '\n'
+                lines = []
+        if lines:
+            yield '\n'.join(lines) + '\n'
+        offset = 0
+
+def _export_csv(store, user_id, record_type, start_date, end_date, offset):
+    """
+    CSV 내보내기 생성기 - 첫 줄은 평탄화된 컬럼 이름 (offset은 데이터 행 기준)
+    """
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow([spec.column for spec in get_schema(record_type)])
+    
+    rows = 0
+    for row in iter_history_rows(store, record_type, user_id, start_date, end_date, offset, EXPORT_CHUNK_ROWS):
+        writer.writerow(row)
+        rows += 1
+        if rows % EXPORT_CHUNK_ROWS == 0:
+            yield buffer.getvalue()
+            buffer.seek(0)
+            buffer.truncate()
+    yield buffer.getvalue()
+
+# 전체 기록 내보내기 API 엔드포인트
+@health_connect_bp.route('/export', methods=['GET'])
+@login_required
+def export_history():
+    """
+    사용자의 전체 기록을 스트리밍으로 내보내는 API 엔드포인트
+    
+    저장소 커서에서 일정 개수씩 읽어 바로 전송하므로 기록 크기와 관계없이
+    메모리 사용량이 일정합니다. (보관소로 옮긴 구간은 보관소에서 함께 읽음) 중단된 경우 받은 행 수를 offset으로 전달해
+    이어서 받을 수 있습니다.
+    
+    Query Parameters:
+        format (str): ndjson (기본값), csv 또는 arrow (Arrow IPC 스트림)
+        types (str): 쉼표로 구분한 레코드 유형 (기본값: 전체, csv/arrow는 한 유형만)
+        start_date (str): 시작 날짜 (YYYY-MM-DD)
+        end_date (str): 종료 날짜 (YYYY-MM-DD)
+        offset (int): 건너뛸 행 수 (재개용)
     
     Returns:
-        JSON: 스트레스 데이터 목록
+        스트리밍 응답 (NDJSON, CSV 또는 Arrow IPC)
     """
-    # 실제 구현에서는 Health Connect API를 통해 데이터 가져오기
-    # 현재는 샘플 데이터 반환
+    export_format = request.args.get('format', 'ndjson')
+    record_types = [value for value in request.args.get('types', ','.join(TABLES)).split(',') if value]
+    offset = request.args.get('offset', default=0, type=int)
+    
+    try:
+        start_date = _parse_date_param('start_date')
+        end_date = _parse_date_param('end_date')
+    except ValueError:
+        return jsonify({
+            "success": False,
+            "message": "날짜는 YYYY-MM-DD 형식이어야 합니다."
+        }), 400
+    
+    if export_format not in EXPORT_MIMETYPES:
+        return jsonify({
+            "success": False,
+            "message": f"지원하지 않는 형식입니다: {export_format}"
+        }), 400
+    
+    unknown = [record_type for record_type in record_types if record_type not in TABLES]
+    if not record_types or unknown:
+        return jsonify({
+            "success": False,
+            "message": f"지원하지 않는 레코드 유형입니다: {', '.join(unknown)}"
+        }), 400
+    
+    if export_format in ('csv', 'arrow') and len(record_types) != 1:
+        return jsonify({
+            "success": False,
+            "message": f"{export_format.upper()} 내보내기는 한 번에 한 가지 유형만 지원합니다."
+        }), 400
+    
+    if export_format == 'arrow' and not arrow_available():
+        return arrow_unavailable_response()
+    
+    if offset < 0:
+        return jsonify({
+            "success": False,
+            "message": "offset은 0 이상이어야 합니다."
+        }), 400
+    
+    store = get_health_store()
+    user_id = current_user_id()
+    
+    if export_format == 'csv':
+        body = _export_csv(store, user_id, record_types[0], start_date, end_date, offset)
+    elif export_format == 'arrow':
+        body = iter_arrow_stream(
+            record_schema(record_types[0]), _row_batches(store, record_types[0], user_id, start_date, end_date, offset)
+        )
+    else:
+        body = _export_ndjson(store, user_id, record_types, start_date, end_date, offset)
+    
+    response = current_app.response_class(body, mimetype=EXPORT_MIMETYPES[export_format])
+    response.headers['Content-Disposition'] = f'attachment; filename="health_export.{export_format}"'
+    response.headers['Cache-Control'] = 'no-store'
+    return response
+
+def parse_sync_request(data):
+    """
+    동기화 요청 본문 검증 (WSGI/ASGI 모드 공용)
+    
+    Args:
+        data (dict): 요청 본문
+        
+    Returns:
+        tuple: (시작 날짜, 종료 날짜, 오류 메시지 또는 None)
+    """
+    if not isinstance(data, dict):
+        data = {}
+    dates = []
+    for name in ('start_date', 'end_date'):
+        value = data.get(name)
+        if value is not None:
+            try:
+                datetime.strptime(value, '%Y-%m-%d')
+            except (TypeError, ValueError):
+                return None, None, f"{name}는 YYYY-MM-DD 형식이어야 합니다."
+        dates.append(value)
+    return dates[0], dates[1], None
+
+# Health Connect 데이터 동기화 API 엔드포인트
+@health_connect_bp.route('/sync', methods=['POST'])
+@login_required
+def sync_from_health_connect():
+    """
+    Health Connect 업스트림에서 데이터를 가져와 저장하는 API 엔드포인트
+    
+    ASGI 모드(src/backend/api/src/asgi.py)에서는 같은 경로를 비동기 구현이 처리합니다.
+    
+    Request Body:
+        start_date (str): 시작 날짜 (YYYY-MM-DD, 기본값: 30일 전)
+        end_date (str): 종료 날짜 (YYYY-MM-DD, 기본값: 오늘)
+    
+    Returns:
+        JSON: 레코드 유형별 저장 건수
+    """
+    start_date, end_date, error = parse_sync_request(request.get_json(silent=True))
+    if error:
+        return jsonify({
+            "success": False,
+            "message": error
+        }), 400
+    
+    try:
+        counts = sync_user_data(get_health_store(), current_user_id(), start_date, end_date)
+    except RecordValidationError as e:
+        return jsonify({
+            "success": False,
+            "message": f"업스트림 데이터가 올바르지 않습니다: {e}"
+        }), 502
+    except Exception as e:
+        # 업스트림 요청 실패 - ASGI 모드와 같은 502 응답
+        return jsonify({
+            "success": False,
+            "error": str(e)
+        }), 502
+    
     return jsonify({
         "success": True,
-        "data": sample_stress_data
+        "stored": counts
     })
 
 # Health Connect 연결 상태 확인 API 엔드포인트
 @health_connect_bp.route('/status', methods=['GET'])
+@login_required
 def get_connection_status():
     """
     Health Connect 연결 상태를 확인하는 API 엔드포인트
@@ -179,6 +686,7 @@ def get_connection_status():
 
 # 사용자 피드백 저장 API 엔드포인트
 @health_connect_bp.route('/feedback', methods=['POST'])
+@login_required
 def save_user_feedback():
     """
     사용자 피드백을 저장하는 API 엔드포인트
@@ -190,15 +698,27 @@ def save_user_feedback():
         notes (str): 특이사항
     
     Returns:
-        JSON: 저장 결과
+        JSON: 검증된 피드백 (202 - 저장은 쓰기 지연 버퍼에서 주기적으로 처리)
     """
-    # 요청 데이터 가져오기
-    data = request.json
+    data = request.get_json(silent=True)
+    if not isinstance(data, dict):
+        return jsonify({
+            "success": False,
+            "message": "요청 본문은 JSON 객체여야 합니다."
+        }), 400
+    
+    # 쓰기 지연 버퍼에 추가 - 주기적으로 모아서 한 트랜잭션으로 저장되며,
+    # 저장되면 데이터 버전이 올라가 분석 결과가 다시 계산됨
+    try:
+        feedback = get_feedback_writer().submit(current_user_id(), data)
+    except RecordValidationError as e:
+        return jsonify({
+            "success": False,
+            "message": str(e)
+        }), 400
     
-    # 실제 구현에서는 데이터베이스에 저장
-    # 현재는 성공 응답만 반환
     return jsonify({
         "success": True,
-        "message": "피드백이 성공적으로 저장되었습니다.",
-        "data": data
-    })
+        "message": "피드백이 접수되었습니다.",
+        "data": feedback
+    }), 202
@@ -1,39 +1,62 @@
-from flask import Blueprint, jsonify, request
-from src.models.user import User, db
+from flask import Blueprint, g, jsonify, request
+from src.backend.api.src.models.user import User, db
+from src.backend.api.src.utils.auth import is_admin, login_required
 
+# 사용자 관리 API - main.py에 등록되어 있지 않음 (가입은 /api/auth/register 사용)
+# 등록하더라도 목록은 관리자만, 개별 사용자는 본인 또는 관리자만 접근할 수 있음
 user_bp = Blueprint('user', __name__)
 
+def _forbidden():
+    return jsonify({
+        "success": False,
+        "message": "본인 또는 관리자만 접근할 수 있습니다."
+    }), 403
+
+def _can_access(user):
+    """
+    현재 요청의 사용자가 대상 사용자에 접근할 수 있는지 확인 (본인 또는 관리자)
+    """
+    return is_admin() or g.current_user.get('email') == user.email
+
 @user_bp.route('/users', methods=['GET'])
+@login_required
 def get_users():
-    users = User.query.all()
+    if not is_admin():
+        return _forbidden()
+    users = db.session.execute(db.select(User).order_by(User.id)).scalars()
     return jsonify([user.to_dict() for user in users])
 
-@user_bp.route('/users', methods=['POST'])
-def create_user():
-    
-    data = request.json
-    user = User(username=data['username'], email=data['email'])
-    db.session.add(user)
-    db.session.commit()
-    return jsonify(user.to_dict()), 201
-
 @user_bp.route('/users/<int:user_id>', methods=['GET'])
+@login_required
 def get_user(user_id):
-    user = User.query.get_or_404(user_id)
+    user = db.get_or_404(User, user_id)
+    if not _can_access(user):
+        return _forbidden()
     return jsonify(user.to_dict())
 
 @user_bp.route('/users/<int:user_id>', methods=['PUT'])
+@login_required
 def update_user(user_id):
-    user = User.query.get_or_404(user_id)
-    data = request.json
-    user.username = data.get('username', user.username)
-    user.email = data.get('email', user.email)
+    user = db.get_or_404(User, user_id)
+    if not _can_access(user):
+        return _forbidden()
+    data = request.get_json(silent=True) or {}
+    # 건강 데이터는 이메일을 사용자 식별자로 저장하므로 이메일(및 같은 값인 username)은 변경 불가
+    if data.get('email', user.email) != user.email or data.get('username', user.username) != user.username:
+        return jsonify({
+            "success": False,
+            "message": "이메일은 변경할 수 없습니다."
+        }), 400
+    user.name = data.get('name', user.name)
     db.session.commit()
     return jsonify(user.to_dict())
 
 @user_bp.route('/users/<int:user_id>', methods=['DELETE'])
+@login_required
 def delete_user(user_id):
-    user = User.query.get_or_404(user_id)
+    user = db.get_or_404(User, user_id)
+    if not _can_access(user):
+        return _forbidden()
     db.session.delete(user)
     db.session.commit()
     return '', 204
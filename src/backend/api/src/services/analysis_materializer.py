@@ -0,0 +1,126 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date
+from src.backend.api.src.utils.json_provider import dumps
+
+class AnalysisMaterializer:
+    """
+    사용자별 분석 결과 구체화(materialization) 관리자
+
+    분석 결과를 계산에 사용한 데이터 버전과 함께 저장소에 보관하고,
+    데이터가 바뀌면 백그라운드 스레드에서 다시 계산합니다. 조회는 버전이
+    일치하는 한 저장된 JSON을 그대로 반환하는 키 조회로 끝납니다.
+
+    재계산은 마지막 변경 후 refresh_delay 동안 변경이 없을 때 한 번 실행하므로
+    일괄 업로드나 동기화의 여러 배치 저장이 재계산 한 번으로 합쳐집니다.
+    변경이 계속 들어와도 첫 변경 후 max_refresh_delay 안에는 재계산합니다.
+    """
+
+    def __init__(self, store, compute, kind="comprehensive", max_workers=1, refresh_delay=2.0, max_refresh_delay=30.0):
+        """
+        AnalysisMaterializer 초기화
+
+        Args:
+            store (HealthDataStore): 데이터 및 결과 저장소
+            compute (callable): user_id를 받아 분석 결과 dict를 반환하는 함수
+            kind (str): 분석 종류 (저장소 키)
+            max_workers (int): 백그라운드 재계산 스레드 수
+            refresh_delay (float): 마지막 변경 후 재계산까지 기다리는 시간 (초)
+            max_refresh_delay (float): 첫 변경 후 재계산까지 최대 대기 시간 (초)
+        """
+        self.store = store
+        self.compute = compute
+        self.kind = kind
+        self.refresh_delay = refresh_delay
+        self.max_refresh_delay = max_refresh_delay
+        self.executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix=f"materialize-{kind}")
+        # 재계산을 기다리는 사용자 -> (첫 변경 시각, 마지막 변경 시각)
+        self._pending = {}
+        self._condition = threading.Condition()
+        self._thread = None
+
+        # 데이터가 바뀌면 백그라운드 재계산 예약
+        store.add_write_listener(self.invalidate)
+
+    def get(self, user_id):
+        """
+        사용자 분석 결과 조회 (최신 결과가 없으면 즉시 계산 후 저장)
+
+        Args:
+            user_id (str): 사용자 식별자
+
+        Returns:
+            str: 분석 결과 JSON 문자열
+        """
+        version = self.store.get_version(user_id)
+        row = self.store.get_materialized(user_id, self.kind)
+
+        # 추세 분석은 오늘 날짜 기준이므로 날짜가 바뀌어도 다시 계산
+        if row and row[0] == version and row[1] == date.today().isoformat():
+            return row[2]
+        return self.refresh(user_id)
+
+    def refresh(self, user_id):
+        """
+        사용자 분석 결과 계산 및 저장
+
+        Args:
+            user_id (str): 사용자 식별자
+
+        Returns:
+            str: 분석 결과 JSON 문자열
+        """
+        # 버전을 먼저 읽어 두면 계산 중 데이터가 바뀐 경우 다음 조회에서 다시 계산됨
+        version = self.store.get_version(user_id)
+        result = dumps(self.compute(user_id))
+        self.store.put_materialized(user_id, self.kind, version, date.today().isoformat(), result)
+        return result
+
+    def invalidate(self, user_id):
+        """
+        사용자 분석 결과 백그라운드 재계산 예약 (이미 예약되어 있으면 재계산 시각을 미룸)
+
+        Args:
+            user_id (str): 사용자 식별자
+        """
+        now = time.monotonic()
+        with self._condition:
+            first_changed, _ = self._pending.get(user_id, (now, now))
+            self._pending[user_id] = (first_changed, now)
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name=f"materialize-{self.kind}-scheduler", daemon=True)
+                self._thread.start()
+            self._condition.notify()
+
+    def _due(self, first_changed, last_changed):
+        """
+        재계산 실행 시각 (마지막 변경 후 refresh_delay, 첫 변경 후 max_refresh_delay 중 빠른 시각)
+        """
+        return min(last_changed + self.refresh_delay, first_changed + self.max_refresh_delay)
+
+    def _run(self):
+        """
+        재계산 예약 루프 - 실행 시각이 된 사용자의 재계산을 스레드 풀에 넘김
+        """
+        while True:
+            with self._condition:
+                now = time.monotonic()
+                due = [user_id for user_id, changed in self._pending.items() if self._due(*changed) <= now]
+                for user_id in due:
+                    del self._pending[user_id]
+                if not due:
+                    timeout = min((self._due(*changed) for changed in self._pending.values()), default=None)
+                    self._condition.wait(None if timeout is None else timeout - now)
+                    continue
+            for user_id in due:
+                self.executor.submit(self._refresh_pending, user_id)
+
+    def _refresh_pending(self, user_id):
+        """
+        예약된 재계산 실행 (예약 해제 후 계산하므로 계산 중 들어온 변경은 다시 예약됨)
+        """
+        try:
+            self.refresh(user_id)
+        except Exception as e:
+            print(f"분석 결과 재계산 오류 ({user_id}): {e}")
@@ -0,0 +1,309 @@
+import atexit
+import json
+import os
+import threading
+from datetime import date
+from src.backend.api.src.models.health_store import get_health_store
+from src.data_analysis.src.health_connect_schema import RecordValidationError, to_record, validate_record
+
+class FeedbackWriter:
+    """
+    사용자 피드백 쓰기 지연(write-behind) 버퍼
+
+    요청마다 트랜잭션을 커밋하지 않고 제출된 피드백을 메모리에 모았다가
+    flush_interval마다 (또는 max_batch개가 모이면) 한 트랜잭션으로 저장합니다.
+    아침 체크인처럼 제출이 몰려도 커밋(fsync)은 주기당 한 번입니다.
+    같은 사용자의 같은 날짜 피드백은 버퍼 안에서 마지막 제출로 합쳐집니다.
+
+    종료 시 남은 피드백을 저장하고, 저장에 실패하면 spill 파일(NDJSON)에 기록해
+    다음 시작 시 다시 저장합니다. 종료 후 제출된 피드백은 버퍼를 거치지 않고 바로 저장합니다.
+    """
+
+    def __init__(self, store, flush_interval=1.0, max_batch=500, spill_path=None):
+        """
+        FeedbackWriter 초기화
+
+        Args:
+            store (HealthDataStore): 저장소
+            flush_interval (float): 저장 주기 (초)
+            max_batch (int): 주기 전이라도 저장을 시작할 버퍼 크기
+            spill_path (str): 종료 시 저장하지 못한 피드백을 기록할 파일 경로 (선택)
+        """
+        self.store = store
+        self.flush_interval = flush_interval
+        self.max_batch = max_batch
+        self.spill_path = spill_path
+        # (user_id, 날짜) -> 검증된 행
+        self._buffer = {}
+        self._lock = threading.Lock()
+        # 저장은 한 번에 하나씩 (백그라운드 저장과 종료 시 저장이 겹치지 않도록)
+        self._flush_lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._closed = False
+        self._thread = None
+        # 사용자별 버퍼 제출 횟수 (아직 저장되지 않은 피드백을 ETag에 반영하는 데 사용)
+        self._submissions = {}
+        # 복구한 뒤 아직 저장하지 못한 spill 파일 (다음 저장 성공 시 삭제)
+        self._recovered_spill = None
+
+        # 복구 실패로 피드백 저장과 분석 경로가 모두 막히지 않도록 오류는 기록만 함
+        try:
+            self.recover()
+        except Exception as e:
+            print(f"피드백 spill 파일 복구 오류, 파일을 남겨두고 시작합니다: {e}")
+
+    def submit(self, user_id, record):
+        """
+        피드백 검증 후 버퍼에 추가
+
+        Args:
+            user_id (str): 사용자 식별자
+            record (dict): 피드백 (date, sleep_satisfaction, morning_condition, notes)
+
+        Returns:
+            dict: 검증된 피드백
+
+        Raises:
+            RecordValidationError: 피드백 형식이 올바르지 않은 경우
+        """
+        row = validate_record(record, 'feedback')
+        with self._lock:
+            closed = self._closed
+            if not closed:
+                self._buffer[(user_id, row[0])] = row
+                self._submissions[user_id] = self._submissions.get(user_id, 0) + 1
+                full = len(self._buffer) >= self.max_batch
+                self._start_thread()
+        if closed:
+            # 종료 후에는 저장 스레드와 종료 시 저장이 없으므로 바로 저장
+            self.store.upsert_rows('feedback', user_id, [row])
+        elif full:
+            self._wakeup.set()
+        return _to_json(to_record(row, 'feedback'))
+
+    def _start_thread(self):
+        """
+        백그라운드 저장 스레드 시작 (lock을 잡은 상태에서 호출, 이미 시작했으면 무시)
+        """
+        if self._thread is None and not self._closed:
+            self._thread = threading.Thread(target=self._run, name='feedback-writer', daemon=True)
+            self._thread.start()
+
+    def pending_rows(self, user_id, start_date=None, end_date=None):
+        """
+        아직 저장되지 않은 사용자 피드백 조회
+
+        Returns:
+            dict: 날짜 (YYYY-MM-DD) -> 검증된 행
+        """
+        with self._lock:
+            rows = [row for (owner, _), row in self._buffer.items() if owner == user_id]
+        pending = {}
+        for row in rows:
+            day = row[0].isoformat()
+            if (not start_date or day >= start_date) and (not end_date or day <= end_date):
+                pending[day] = row
+        return pending
+
+    def pending_tag(self, user_id):
+        """
+        사용자의 저장되지 않은 피드백 상태 표시 (조건부 요청의 ETag에 데이터 버전과 함께 사용)
+
+        버퍼의 피드백은 저장되기 전까지 데이터 버전을 올리지 않으므로, 버퍼에 피드백이 있는 동안
+        제출마다 바뀌는 값을 반환합니다. 버퍼는 프로세스마다 따로 있으므로 프로세스 ID를 포함합니다.
+
+        Returns:
+            str: 버퍼에 사용자 피드백이 있으면 표시 문자열, 없으면 None
+        """
+        with self._lock:
+            if not any(owner == user_id for owner, _ in self._buffer):
+                return None
+            return f"{os.getpid()}-{self._submissions[user_id]}"
+
+    def fetch_columns(self, user_id, start_date=None, end_date=None):
+        """
+        저장된 피드백과 버퍼의 피드백을 합쳐 컬럼형으로 조회 (버퍼가 우선)
+
+        Args:
+            user_id (str): 사용자 식별자
+            start_date (str): 시작 날짜 (YYYY-MM-DD, 포함, 선택)
+            end_date (str): 종료 날짜 (YYYY-MM-DD, 포함, 선택)
+
+        Returns:
+            dict: 컬럼 이름 -> 값 리스트 (SleepAnalyzer.load_data에 바로 전달 가능)
+        """
+        columns = self.store.fetch_columns('feedback', user_id, start_date, end_date)
+        pending = self.pending_rows(user_id, start_date, end_date)
+        if not pending:
+            return columns
+
+        names = list(columns)
+        rows = {row[0]: row for row in zip(*columns.values())}
+        for day, row in pending.items():
+            rows[day] = (day,) + tuple(row[1:])
+        merged = [rows[day] for day in sorted(rows)]
+        return {name: list(values) for name, values in zip(names, zip(*merged))}
+
+    def flush(self):
+        """
+        버퍼의 피드백을 한 트랜잭션으로 저장
+
+        저장에 실패하면 피드백을 버퍼로 되돌립니다 (그 사이 들어온 같은 날짜의 새 제출이 우선).
+
+        Returns:
+            int: 저장한 행 수
+        """
+        with self._flush_lock:
+            with self._lock:
+                batch, self._buffer = self._buffer, {}
+            if not batch:
+                return 0
+
+            rows_by_user = {}
+            for (user_id, _), row in batch.items():
+                rows_by_user.setdefault(user_id, []).append(row)
+            try:
+                counts = self.store.upsert_batch('feedback', rows_by_user)
+            except Exception:
+                with self._lock:
+                    for key, row in batch.items():
+                        self._buffer.setdefault(key, row)
+                raise
+            # 복구한 피드백이 이번 배치로 저장되었으므로 spill 파일 삭제
+            if self._recovered_spill:
+                if os.path.exists(self._recovered_spill):
+                    os.remove(self._recovered_spill)
+                self._recovered_spill = None
+            return sum(counts.values())
+
+    def _run(self):
+        """
+        백그라운드 저장 루프
+        """
+        while not self._closed:
+            self._wakeup.wait(self.flush_interval)
+            self._wakeup.clear()
+            try:
+                self.flush()
+            except Exception as e:
+                print(f"피드백 저장 오류: {e}")
+
+    def close(self):
+        """
+        백그라운드 저장 중지 후 남은 피드백 저장 (실패하면 spill 파일에 기록)
+        """
+        with self._lock:
+            self._closed = True
+            thread = self._thread
+        self._wakeup.set()
+        if thread is not None:
+            thread.join(timeout=max(5.0, self.flush_interval * 2))
+        try:
+            self.flush()
+        except Exception as e:
+            print(f"종료 시 피드백 저장 오류, spill 파일에 기록합니다: {e}")
+            self._spill()
+
+    def _spill(self):
+        """
+        버퍼의 피드백을 spill 파일에 추가 기록 (fsync까지 완료)
+        """
+        with self._lock:
+            batch, self._buffer = self._buffer, {}
+        if not batch or not self.spill_path:
+            return
+        with open(self.spill_path, 'a', encoding='utf-8') as f:
+            for (user_id, _), row in batch.items():
+                line = {"user_id": user_id, "record": _to_json(to_record(row, 'feedback'))}
+                f.write(json.dumps(line, ensure_ascii=False) + '\n')
+            f.flush()
+            os.fsync(f.fileno())
+
+    def recover(self):
+        """
+        이전 종료 시 spill 파일에 기록된 피드백을 저장한 뒤 파일 삭제
+
+        읽을 수 없는 줄은 건너뛰고, 그런 줄이 있으면 파일을 <spill 파일>.corrupt로 옮겨
+        확인할 수 있게 남깁니다. 저장에 실패하면 파일을 그대로 두고 피드백은 버퍼에 남아
+        백그라운드 저장에서 다시 시도합니다 (저장되면 파일 삭제).
+
+        Returns:
+            int: 저장한 행 수
+        """
+        if not self.spill_path or not os.path.exists(self.spill_path):
+            return 0
+
+        corrupt = 0
+        with open(self.spill_path, encoding='utf-8', errors='replace') as f:
+            for line_number, line in enumerate(f, 1):
+                if not line.strip():
+                    continue
+                try:
+                    entry = json.loads(line)
+                    user_id = entry["user_id"]
+                    row = validate_record(entry["record"], 'feedback')
+                except (ValueError, KeyError, TypeError, RecordValidationError) as e:
+                    corrupt += 1
+                    print(f"피드백 spill 파일 {line_number}번째 줄을 건너뜁니다: {e}")
+                    continue
+                # 나중에 기록된 줄이 우선 (같은 날짜를 여러 번 기록한 경우)
+                with self._lock:
+                    self._buffer[(user_id, row[0])] = row
+
+        if corrupt:
+            # 읽은 피드백은 버퍼에 있으므로 파일은 옮겨 두고 다시 복구하지 않음
+            os.replace(self.spill_path, self.spill_path + '.corrupt')
+        else:
+            self._recovered_spill = self.spill_path
+
+        try:
+            return self.flush()
+        except Exception:
+            with self._lock:
+                self._start_thread()
+            raise
+
+def _to_json(record):
+    """
+    레코드의 날짜 값을 ISO 문자열로 변환
+    """
+    return {key: value.isoformat() if isinstance(value, date) else value for key, value in record.items()}
+
+# 프로세스 전역 피드백 버퍼 (첫 사용 시 생성)
+_writer = None
+_writer_lock = threading.Lock()
+
+def pending_feedback_tag(user_id):
+    """
+    전역 피드백 버퍼의 저장되지 않은 피드백 상태 표시 (버퍼를 만들기 전이면 None)
+    """
+    return _writer.pending_tag(user_id) if _writer is not None else None
+
+def get_feedback_writer():
+    """
+    전역 FeedbackWriter 조회 (없으면 생성, 프로세스 종료 시 남은 피드백 저장)
+
+    환경 변수:
+        FEEDBACK_FLUSH_INTERVAL: 저장 주기 (초, 기본값 1)
+        FEEDBACK_MAX_BATCH: 주기 전 저장을 시작할 버퍼 크기 (기본값 500)
+        FEEDBACK_SPILL_PATH: spill 파일 경로 (기본값: 저장소 파일과 같은 디렉터리의 feedback-spill.ndjson)
+
+    Returns:
+        FeedbackWriter: 피드백 버퍼
+    """
+    global _writer
+    if _writer is None:
+        with _writer_lock:
+            if _writer is None:
+                store = get_health_store()
+                spill_path = os.environ.get('FEEDBACK_SPILL_PATH')
+                if not spill_path and store.path != ':memory:':
+                    spill_path = os.path.join(os.path.dirname(os.path.abspath(store.path)), 'feedback-spill.ndjson')
+                _writer = FeedbackWriter(
+                    store,
+                    flush_interval=float(os.environ.get('FEEDBACK_FLUSH_INTERVAL', 1.0)),
+                    max_batch=int(os.environ.get('FEEDBACK_MAX_BATCH', 500)),
+                    spill_path=spill_path
+                )
+                atexit.register(_writer.close)
+    return _writer
@@ -0,0 +1,114 @@
+import asyncio
+import threading
+from datetime import datetime, timedelta
+
+# 동기화 대상 레코드 유형
+SYNC_RECORD_TYPES = ("sleep", "activity", "stress")
+
+# 동기화 기본 기간 (일)
+DEFAULT_SYNC_DAYS = 30
+
+def sync_range(start_date=None, end_date=None):
+    """
+    동기화 기간 기본값 적용
+
+    Args:
+        start_date (str): 시작 날짜 (YYYY-MM-DD, 기본값: 30일 전)
+        end_date (str): 종료 날짜 (YYYY-MM-DD, 기본값: 오늘)
+
+    Returns:
+        tuple: (시작 날짜, 종료 날짜)
+    """
+    if not start_date:
+        start_date = (datetime.now() - timedelta(days=DEFAULT_SYNC_DAYS)).strftime('%Y-%m-%d')
+    if not end_date:
+        end_date = datetime.now().strftime('%Y-%m-%d')
+    return start_date, end_date
+
+def store_records(store, user_id, records_by_type):
+    """
+    가져온 레코드를 유형별로 검증 후 저장
+
+    Args:
+        store (HealthDataStore): 저장소
+        user_id (str): 사용자 식별자
+        records_by_type (dict): 레코드 유형 -> 레코드 목록
+
+    Returns:
+        dict: 레코드 유형 -> 저장한 행 수
+    """
+    return {
+        record_type: store.upsert(record_type, user_id, records)
+        for record_type, records in records_by_type.items()
+    }
+
+def sync_user_data(store, user_id, start_date=None, end_date=None, client=None):
+    """
+    Health Connect에서 사용자 데이터를 가져와 저장 (WSGI 모드, 요청 스레드에서 순차 실행)
+
+    Args:
+        store (HealthDataStore): 저장소
+        user_id (str): 사용자 식별자
+        start_date (str): 시작 날짜 (YYYY-MM-DD, 선택)
+        end_date (str): 종료 날짜 (YYYY-MM-DD, 선택)
+        client (HealthConnectClient): 클라이언트 (기본값: 전역 클라이언트)
+
+    Returns:
+        dict: 레코드 유형 -> 저장한 행 수
+
+    Raises:
+        Exception: 업스트림 요청 실패 (재시도 후)
+    """
+    client = client or get_health_connect_client()
+    start_date, end_date = sync_range(start_date, end_date)
+    # 업스트림 오류는 빈 목록으로 바꾸지 않고 그대로 전달 (ASGI 모드와 같이 502 응답)
+    return store_records(store, user_id, {
+        record_type: client.fetch_records(record_type, start_date, end_date)
+        for record_type in SYNC_RECORD_TYPES
+    })
+
+async def async_sync_user_data(store, user_id, client, start_date=None, end_date=None, executor=None):
+    """
+    Health Connect에서 사용자 데이터를 비동기로 가져와 저장 (ASGI 모드)
+
+    업스트림 요청은 이벤트 루프에서 동시에 기다리고, 검증 및 저장(CPU/디스크 작업)은
+    executor에서 실행해 이벤트 루프를 막지 않습니다.
+
+    Args:
+        store (HealthDataStore): 저장소
+        user_id (str): 사용자 식별자
+        client (AsyncHealthConnectClient): 비동기 클라이언트
+        start_date (str): 시작 날짜 (YYYY-MM-DD, 선택)
+        end_date (str): 종료 날짜 (YYYY-MM-DD, 선택)
+        executor (Executor): 저장 작업 실행기 (기본값: 이벤트 루프 기본 실행기)
+
+    Returns:
+        dict: 레코드 유형 -> 저장한 행 수
+    """
+    start_date, end_date = sync_range(start_date, end_date)
+    results = await asyncio.gather(*(
+        client.fetch_records(record_type, start_date, end_date) for record_type in SYNC_RECORD_TYPES
+    ))
+    records_by_type = dict(zip(SYNC_RECORD_TYPES, results))
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(executor, store_records, store, user_id, records_by_type)
+
+# 프로세스 전역 클라이언트 (첫 사용 시 생성, 연결 재사용)
+_client = None
+_client_lock = threading.Lock()
+
+def get_health_connect_client():
+    """
+    전역 HealthConnectClient 조회 (없으면 생성)
+
+    Returns:
+        HealthConnectClient: 클라이언트
+    """
+    global _client
+    if _client is None:
+        with _client_lock:
+            if _client is None:
+                # requests 등 클라이언트 의존성은 첫 동기화 요청 시 불러옴
+                from src.data_analysis.src.health_connect_client import HealthConnectClient
+                _client = HealthConnectClient()
+    return _client
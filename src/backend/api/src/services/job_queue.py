@@ -0,0 +1,172 @@
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+
+class QueueFullError(RuntimeError):
+    """
+    작업 큐가 가득 차 새 작업을 받을 수 없을 때 발생하는 오류
+    """
+
+class Job:
+    """
+    백그라운드 분석 작업
+    """
+
+    def __init__(self, user_id, kind, dedup_key=None):
+        """
+        Job 초기화
+
+        Args:
+            user_id (str): 작업을 요청한 사용자
+            kind (str): 작업 종류 (comprehensive, cohort 등)
+            dedup_key (tuple): 중복 제거 키 (선택)
+        """
+        self.id = uuid.uuid4().hex
+        self.user_id = user_id
+        self.kind = kind
+        self.dedup_key = dedup_key
+        self.status = "queued"
+        self.result = None
+        self.error = None
+        self.created_at = time.time()
+        self.started_at = None
+        self.finished_at = None
+
+    @property
+    def finished(self):
+        """
+        작업 완료 여부 (성공 또는 실패)
+        """
+        return self.status in ("succeeded", "failed")
+
+    def to_dict(self, include_result=True):
+        """
+        작업 상태를 응답용 dict로 변환
+
+        Args:
+            include_result (bool): 결과를 포함할지 여부
+
+        Returns:
+            dict: 작업 상태
+        """
+        data = {
+            "id": self.id,
+            "kind": self.kind,
+            "status": self.status,
+            "created_at": self.created_at,
+            "started_at": self.started_at,
+            "finished_at": self.finished_at
+        }
+        if include_result and self.status == "succeeded":
+            data["result"] = self.result
+        if self.status == "failed":
+            data["error"] = self.error
+        return data
+
+class JobQueue:
+    """
+    프로세스 내 분석 작업 큐
+
+    대기 및 실행 중인 작업 수를 max_pending으로 제한하고, 작업은 스레드 풀에서
+    실행합니다. 같은 dedup_key의 작업이 진행 중이거나 결과가 보관 중이면
+    새 작업을 만들지 않고 기존 작업을 공유합니다.
+    """
+
+    def __init__(self, max_workers=2, max_pending=100, result_ttl=10 * 60):
+        """
+        JobQueue 초기화
+
+        Args:
+            max_workers (int): 작업 실행 스레드 수
+            max_pending (int): 대기 및 실행 중인 작업의 최대 수
+            result_ttl (int): 완료된 작업 결과 보관 시간 (초)
+        """
+        self.max_pending = max_pending
+        self.result_ttl = result_ttl
+        self.executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="analysis-job")
+        self.jobs = {}
+        self.dedup_index = {}
+        self.active = 0
+        self.lock = threading.Lock()
+
+    def submit(self, user_id, kind, fn, *args, dedup_key=None, **kwargs):
+        """
+        작업 등록
+
+        Args:
+            user_id (str): 작업을 요청한 사용자
+            kind (str): 작업 종류
+            fn (callable): 실행할 함수
+            *args: 함수 인자
+            dedup_key (tuple): 중복 제거 키 (None이면 중복 제거하지 않음)
+            **kwargs: 함수 키워드 인자
+
+        Returns:
+            tuple: (Job, 새로 만든 작업인지 여부)
+        """
+        with self.lock:
+            self._prune()
+
+            if dedup_key is not None:
+                existing = self.jobs.get(self.dedup_index.get(dedup_key))
+                if existing is not None and existing.status != "failed":
+                    return existing, False
+
+            if self.active >= self.max_pending:
+                raise QueueFullError("분석 작업 큐가 가득 찼습니다.")
+
+            job = Job(user_id, kind, dedup_key)
+            self.jobs[job.id] = job
+            if dedup_key is not None:
+                self.dedup_index[dedup_key] = job.id
+            self.active += 1
+
+        self.executor.submit(self._run, job, fn, args, kwargs)
+        return job, True
+
+    def get(self, job_id):
+        """
+        작업 조회
+
+        Args:
+            job_id (str): 작업 ID
+
+        Returns:
+            Job: 작업 (없거나 보관 기간이 지났으면 None)
+        """
+        with self.lock:
+            self._prune()
+            return self.jobs.get(job_id)
+
+    def _run(self, job, fn, args, kwargs):
+        """
+        작업 실행 (작업 스레드에서 호출)
+
+        완료 상태와 완료 시각은 lock 안에서 함께 기록해, _prune이 완료 시각 없이
+        완료된 작업을 보지 않도록 합니다.
+        """
+        job.status = "running"
+        job.started_at = time.time()
+        result, error = None, None
+        try:
+            result = fn(*args, **kwargs)
+        except Exception as e:
+            error = str(e)
+        with self.lock:
+            job.result = result
+            job.error = error
+            job.finished_at = time.time()
+            job.status = "failed" if error is not None else "succeeded"
+            self.active -= 1
+
+    def _prune(self):
+        """
+        보관 기간이 지난 완료 작업 삭제 (lock을 잡은 상태에서 호출)
+        """
+        cutoff = time.time() - self.result_ttl
+        expired = [job for job in self.jobs.values() if job.finished and job.finished_at < cutoff]
+        for job in expired:
+            del self.jobs[job.id]
+            if job.dedup_key is not None and self.dedup_index.get(job.dedup_key) == job.id:
+                del self.dedup_index[job.dedup_key]
@@ -0,0 +1,158 @@
+import io
+from flask import current_app, jsonify, request
+from src.data_analysis.src.health_connect_schema import get_schema
+
+# Arrow IPC 스트림 MIME 타입
+ARROW_STREAM_MIMETYPE = 'application/vnd.apache.arrow.stream'
+
+# Arrow 응답에는 pyarrow가 필요 (pip install pyarrow) - 불러오는 비용이 크므로
+# 첫 Arrow 요청 시 불러옴 (앱 시작 시간 단축)
+_pyarrow = None
+_pyarrow_missing = False
+
+def _load_pyarrow():
+    """
+    pyarrow 모듈 불러오기
+
+    Returns:
+        module: pyarrow 모듈, 설치되어 있지 않으면 None
+    """
+    global _pyarrow, _pyarrow_missing
+    if _pyarrow is None and not _pyarrow_missing:
+        try:
+            import pyarrow
+            import pyarrow.ipc
+        except ImportError:
+            _pyarrow_missing = True
+            return None
+        _pyarrow = pyarrow
+    return _pyarrow
+
+def arrow_available():
+    """
+    Arrow 응답 사용 가능 여부 (pyarrow 설치 여부)
+    """
+    return _load_pyarrow() is not None
+
+def wants_arrow():
+    """
+    Accept 헤더가 JSON보다 Arrow IPC 스트림을 우선하는지 확인 (동일하면 JSON)
+
+    Returns:
+        bool: Arrow 응답을 요청했으면 True
+    """
+    return request.accept_mimetypes.best_match(['application/json', ARROW_STREAM_MIMETYPE]) == ARROW_STREAM_MIMETYPE
+
+def arrow_unavailable_response():
+    """
+    pyarrow가 없어 Arrow 응답을 만들 수 없을 때의 응답 (406)
+    """
+    return jsonify({
+        "success": False,
+        "message": "Arrow 응답을 사용할 수 없습니다. (pyarrow 미설치) Accept: application/json으로 요청하세요."
+    }), 406
+
+def record_schema(record_type):
+    """
+    레코드 유형의 Arrow 스키마 (스키마 컬럼 순서, 수면 단계는 stages_<단계> 컬럼)
+
+    Args:
+        record_type (str): 레코드 유형
+
+    Returns:
+        pyarrow.Schema: Arrow 스키마
+    """
+    pa = _load_pyarrow()
+    types = {
+        "str": pa.string(),
+        "int": pa.int64(),
+        "float": pa.float64(),
+        "datetime": pa.timestamp("s"),
+        "date": pa.date32()
+    }
+    return pa.schema([(spec.column, types[spec.kind]) for spec in get_schema(record_type)])
+
+def _record_batch(schema, rows):
+    """
+    저장소 행(스키마 컬럼 순서)으로 레코드 배치 생성
+
+    날짜/시간은 저장소의 ISO 문자열을 Arrow에서 바로 변환합니다. 시각은 소수 초가 있는
+    값("2020-01-01T23:10:00.5")도 있으므로 마이크로초 단위로 읽은 뒤 초 단위로 버림합니다.
+    """
+    pa = _load_pyarrow()
+    arrays = []
+    for index, field in enumerate(schema):
+        values = [row[index] for row in rows]
+        if pa.types.is_timestamp(field.type):
+            parsed = pa.array(values, type=pa.string()).cast(pa.timestamp("us"))
+            arrays.append(parsed.cast(field.type, safe=False))
+        elif pa.types.is_date(field.type):
+            arrays.append(pa.array(values, type=pa.string()).cast(field.type))
+        else:
+            arrays.append(pa.array(values, type=field.type))
+    return pa.RecordBatch.from_arrays(arrays, schema=schema)
+
+def iter_arrow_stream(schema, row_batches):
+    """
+    행 배치마다 Arrow 레코드 배치를 만들어 IPC 스트림 조각으로 반환
+
+    Args:
+        schema (pyarrow.Schema): Arrow 스키마
+        row_batches: 행 목록의 이터러블
+
+    Yields:
+        bytes: IPC 스트림 조각 (스키마 메시지, 레코드 배치, 끝 표시)
+    """
+    pa = _load_pyarrow()
+    buffer = io.BytesIO()
+
+    def drain():
+        data = buffer.getvalue()
+        buffer.seek(0)
+        buffer.truncate()
+        return data
+
+    with pa.ipc.new_stream(buffer, schema) as writer:
+        yield drain()
+        for rows in row_batches:
+            if rows:
+                writer.write_batch(_record_batch(schema, rows))
+                yield drain()
+    yield drain()
+
+def arrow_stream_response(schema, row_batches):
+    """
+    Arrow IPC 스트리밍 응답
+
+    Args:
+        schema (pyarrow.Schema): Arrow 스키마
+        row_batches: 행 목록의 이터러블 (배치 하나가 레코드 배치 하나)
+
+    Returns:
+        Response: 스트리밍 응답
+    """
+    response = current_app.response_class(iter_arrow_stream(schema, row_batches), mimetype=ARROW_STREAM_MIMETYPE)
+    response.vary.add('Accept')
+    return response
+
+def table_response(rows, metadata=None):
+    """
+    dict 목록(한 행 = 한 dict)을 Arrow IPC 스트림으로 응답 (타입은 값에서 추론)
+
+    Args:
+        rows (list): 행 dict 목록
+        metadata (dict): 스키마 메타데이터 (선택)
+
+    Returns:
+        Response: Arrow IPC 응답
+    """
+    pa = _load_pyarrow()
+    table = pa.Table.from_pylist(rows)
+    if metadata:
+        table = table.replace_schema_metadata(metadata)
+    sink = pa.BufferOutputStream()
+    with pa.ipc.new_stream(sink, table.schema) as writer:
+        writer.write_table(table)
+    response = current_app.response_class(sink.getvalue().to_pybytes(), mimetype=ARROW_STREAM_MIMETYPE)
+    response.vary.add('Accept')
+    return response
@@ -0,0 +1,242 @@
+import os
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeoutError
+from functools import wraps
+from flask import g, jsonify, request
+from werkzeug.security import generate_password_hash, check_password_hash
+import jwt
+
+# JWT 시크릿 키 - 환경 변수로 관리
+SECRET_KEY = os.environ.get('JWT_SECRET_KEY', 'dev_secret_key')
+JWT_ALGORITHM = 'HS256'
+
+# 관리자 이메일 목록 (쉼표로 구분) - 다른 사용자의 데이터에 접근하는 경로에 필요
+ADMIN_EMAILS = frozenset(
+    email.strip().lower() for email in os.environ.get('ADMIN_EMAILS', '').split(',') if email.strip()
+)
+
+class PasswordPoolBusyError(Exception):
+    """
+    비밀번호 해시 작업 풀이 가득 찬 경우 발생하는 오류
+    """
+    pass
+
+class VerifiedTokenCache:
+    """
+    서명 검증을 마친 JWT 페이로드의 LRU + TTL 캐시
+    같은 토큰으로 반복되는 요청은 서명 검증 없이 캐시된 페이로드를 사용합니다.
+    항목은 TTL과 토큰 자체의 만료 시각(exp) 중 빠른 시점에 만료됩니다.
+    """
+
+    def __init__(self, max_size=10000, ttl=300):
+        """
+        VerifiedTokenCache 초기화
+
+        Args:
+            max_size (int): 최대 항목 수
+            ttl (int): 항목 유효 시간 (초)
+        """
+        self.max_size = max_size
+        self.ttl = ttl
+        self.entries = OrderedDict()
+        self.lock = threading.Lock()
+
+    def get(self, token):
+        """
+        캐시된 페이로드 조회
+
+        Returns:
+            dict: 페이로드, 없거나 만료되었으면 None
+        """
+        with self.lock:
+            entry = self.entries.get(token)
+            if entry is None:
+                return None
+            payload, expires_at = entry
+            if expires_at <= time.time():
+                del self.entries[token]
+                return None
+            self.entries.move_to_end(token)
+            return payload
+
+    def set(self, token, payload):
+        """
+        검증된 페이로드 저장 (가장 오래 사용하지 않은 항목부터 제거)
+        """
+        expires_at = time.time() + self.ttl
+        if 'exp' in payload:
+            expires_at = min(expires_at, float(payload['exp']))
+        with self.lock:
+            self.entries[token] = (payload, expires_at)
+            self.entries.move_to_end(token)
+            while len(self.entries) > self.max_size:
+                self.entries.popitem(last=False)
+
+    def clear(self):
+        """
+        모든 항목 삭제
+        """
+        with self.lock:
+            self.entries.clear()
+
+token_cache = VerifiedTokenCache(
+    max_size=int(os.environ.get('AUTH_TOKEN_CACHE_SIZE', 10000)),
+    ttl=int(os.environ.get('AUTH_TOKEN_CACHE_TTL', 300))
+)
+
+def encode_token(payload):
+    """
+    JWT 토큰 생성
+
+    Args:
+        payload (dict): 토큰 페이로드
+
+    Returns:
+        str: JWT 토큰
+    """
+    return jwt.encode(payload, SECRET_KEY, algorithm=JWT_ALGORITHM)
+
+def verify_token(token):
+    """
+    JWT 토큰 검증 (검증 결과 캐시 사용)
+
+    Args:
+        token (str): JWT 토큰
+
+    Returns:
+        dict: 토큰 페이로드
+
+    Raises:
+        jwt.ExpiredSignatureError: 토큰이 만료된 경우
+        jwt.InvalidTokenError: 토큰이 유효하지 않은 경우
+    """
+    payload = token_cache.get(token)
+    if payload is None:
+        payload = jwt.decode(token, SECRET_KEY, algorithms=[JWT_ALGORITHM])
+        token_cache.set(token, payload)
+    return payload
+
+def bearer_token():
+    """
+    Authorization 헤더에서 Bearer 토큰 추출
+
+    Returns:
+        str: 토큰, 없으면 None
+    """
+    auth_header = request.headers.get('Authorization', '')
+    if not auth_header.startswith('Bearer '):
+        return None
+    return auth_header[len('Bearer '):].strip() or None
+
+def is_admin():
+    """
+    현재 요청의 사용자가 관리자인지 확인 (login_required 이후에 호출)
+
+    Returns:
+        bool: g.current_user의 이메일이 ADMIN_EMAILS에 있으면 True
+    """
+    user = g.get('current_user')
+    return bool(user) and str(user.get('email', '')).lower() in ADMIN_EMAILS
+
+def login_required(view):
+    """
+    JWT 인증 데코레이터
+
+    유효한 Bearer 토큰이 없으면 401을 반환하고, 있으면 페이로드를
+    g.current_user에 저장한 뒤 뷰 함수를 실행합니다.
+    """
+    @wraps(view)
+    def wrapper(*args, **kwargs):
+        token = bearer_token()
+        if token is None:
+            return jsonify({
+                "success": False,
+                "message": "유효한 인증 토큰이 필요합니다."
+            }), 401
+
+        try:
+            g.current_user = verify_token(token)
+        except jwt.ExpiredSignatureError:
+            return jsonify({
+                "success": False,
+                "message": "토큰이 만료되었습니다."
+            }), 401
+        except jwt.InvalidTokenError:
+            return jsonify({
+                "success": False,
+                "message": "유효하지 않은 토큰입니다."
+            }), 401
+
+        return view(*args, **kwargs)
+    return wrapper
+
+class PasswordHasher:
+    """
+    비밀번호 해시 생성/검증 전용 작업 풀
+
+    해시 계산은 CPU를 많이 쓰므로 동시에 실행되는 작업 수를 max_workers로 제한하고,
+    대기 작업이 max_pending을 넘으면 기다리지 않고 PasswordPoolBusyError를 발생시킵니다.
+    로그인 요청이 몰려도 데이터 엔드포인트가 사용할 CPU와 요청 스레드가 남습니다.
+    """
+
+    def __init__(self, max_workers=2, max_pending=16, timeout=10):
+        """
+        PasswordHasher 초기화
+
+        Args:
+            max_workers (int): 동시에 실행할 해시 작업 수
+            max_pending (int): 실행 중인 작업을 포함한 최대 대기 작업 수
+            timeout (float): 작업 결과 대기 최대 시간 (초)
+        """
+        self.executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='password-hash')
+        self.slots = threading.BoundedSemaphore(max(max_pending, max_workers))
+        self.timeout = timeout
+
+    def _run(self, fn, *args):
+        """
+        작업 풀에서 함수 실행 후 결과 반환
+        """
+        if not self.slots.acquire(blocking=False):
+            raise PasswordPoolBusyError("로그인 요청이 많습니다. 잠시 후 다시 시도해주세요.")
+        try:
+            future = self.executor.submit(fn, *args)
+        except BaseException:
+            self.slots.release()
+            raise
+        future.add_done_callback(lambda _: self.slots.release())
+        try:
+            return future.result(timeout=self.timeout)
+        except FutureTimeoutError:
+            raise PasswordPoolBusyError("비밀번호 확인이 지연되고 있습니다. 잠시 후 다시 시도해주세요.")
+
+    def hash(self, password):
+        """
+        비밀번호 해시 생성
+
+        Args:
+            password (str): 비밀번호
+
+        Returns:
+            str: 비밀번호 해시
+        """
+        return self._run(generate_password_hash, password)
+
+    def verify(self, password_hash, password):
+        """
+        비밀번호 해시 검증
+
+        Args:
+            password_hash (str): 저장된 비밀번호 해시
+            password (str): 입력된 비밀번호
+
+        Returns:
+            bool: 일치 여부
+        """
+        return self._run(check_password_hash, password_hash, password)
+
+password_hasher = PasswordHasher(
+    max_workers=int(os.environ.get('AUTH_HASH_WORKERS', 2)),
+    max_pending=int(os.environ.get('AUTH_HASH_QUEUE_SIZE', 16))
+)
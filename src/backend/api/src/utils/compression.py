@@ -0,0 +1,82 @@
+import gzip
+from flask import request
+
+# brotli가 설치되어 있으면 br 인코딩도 지원 (pip install brotli)
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+# 압축 대상 MIME 타입
+COMPRESSIBLE_MIMETYPES = {
+    'application/json',
+    'application/x-ndjson',
+    'application/javascript',
+    'image/svg+xml',
+    'text/csv',
+    'text/html',
+    'text/plain',
+    'text/css'
+}
+
+# 압축된 표현에 붙이는 ETag 접미사 (인코딩마다 다른 표현이므로 강한 ETag를 구분)
+ETAG_SUFFIXES = {
+    'br': '-br',
+    'gzip': '-gzip'
+}
+
+def _choose_encoding():
+    """
+    Accept-Encoding 헤더에 따라 응답 인코딩 선택 (br 우선)
+    
+    Returns:
+        str: 'br', 'gzip' 또는 None
+    """
+    accept = request.accept_encodings
+    if brotli is not None and accept.quality('br') > 0:
+        return 'br'
+    if accept.quality('gzip') > 0:
+        return 'gzip'
+    return None
+
+def init_compression(app, min_size=1024, gzip_level=6, brotli_quality=5):
+    """
+    응답 압축 설정 - 크기가 min_size 이상인 텍스트/JSON 응답을 br 또는 gzip으로 압축
+    
+    스트리밍 응답과 이미 인코딩된 응답은 압축하지 않습니다.
+    
+    Args:
+        app (Flask): Flask 앱
+        min_size (int): 압축할 최소 응답 크기 (바이트)
+        gzip_level (int): gzip 압축 레벨 (1-9)
+        brotli_quality (int): brotli 압축 품질 (0-11)
+    """
+    @app.after_request
+    def compress_response(response):
+        if (response.status_code != 200 or response.direct_passthrough or response.is_streamed
+                or 'Content-Encoding' in response.headers
+                or response.mimetype not in COMPRESSIBLE_MIMETYPES):
+            return response
+        
+        response.vary.add('Accept-Encoding')
+        
+        body = response.get_data()
+        if len(body) < min_size:
+            return response
+        
+        encoding = _choose_encoding()
+        if encoding is None:
+            return response
+        
+        if encoding == 'br':
+            compressed = brotli.compress(body, quality=brotli_quality)
+        else:
+            compressed = gzip.compress(body, compresslevel=gzip_level)
+        
+        response.set_data(compressed)
+        response.headers['Content-Encoding'] = encoding
+        
+        etag, weak = response.get_etag()
+        if etag and not weak:
+            response.set_etag(etag + ETAG_SUFFIXES[encoding])
+        return response
@@ -0,0 +1,22 @@
+from flask import g
+
+# 기본 사용자 - 샘플 데이터 소유자 (테스트 사용자 및 샘플 데이터 저장에 사용)
+DEFAULT_USER_ID = "test@example.com"
+
+def current_user_id():
+    """
+    현재 요청의 사용자 식별자 조회 (login_required가 검증한 토큰의 이메일)
+
+    인증되지 않은 요청에서는 다른 사용자(기본 사용자)의 데이터가 노출되지 않도록
+    기본값 없이 오류를 발생시킵니다.
+
+    Returns:
+        str: 사용자 식별자
+
+    Raises:
+        RuntimeError: login_required를 거치지 않은 요청에서 호출한 경우
+    """
+    user = g.get('current_user')
+    if not user or not user.get('email'):
+        raise RuntimeError("인증된 사용자가 없습니다. (login_required가 필요한 경로)")
+    return user['email']
@@ -0,0 +1,76 @@
+import hashlib
+from datetime import date
+from functools import wraps
+from flask import make_response, request
+from src.backend.api.src.models.health_store import get_health_store
+from src.backend.api.src.services.feedback_writer import pending_feedback_tag
+from src.backend.api.src.utils.arrow_format import wants_arrow
+from src.backend.api.src.utils.compression import ETAG_SUFFIXES
+from src.backend.api.src.utils.current_user import current_user_id
+
+# 조건부 요청 응답의 캐시 정책 - 브라우저는 저장하되 매번 ETag로 재검증
+CACHE_CONTROL = "private, no-cache"
+
+def make_etag(user_id, version, include_date=False):
+    """
+    요청 경로, 쿼리 파라미터, 사용자 데이터 버전, 응답 표현(JSON/Arrow)으로 강한 ETag 생성
+    
+    Args:
+        user_id (str): 사용자 식별자
+        version (int 또는 str): 사용자 데이터 버전 (저장되지 않은 피드백이 있으면 그 표시 포함)
+        include_date (bool): 오늘 날짜를 포함할지 여부 (현재 날짜 기준으로 계산되는 분석 결과용)
+        
+    Returns:
+        str: ETag 값 (따옴표 제외)
+    """
+    query = "&".join(f"{key}={value}" for key, value in sorted(request.args.items(multi=True)))
+    parts = [request.path, query, user_id, str(version)]
+    if include_date:
+        parts.append(date.today().isoformat())
+    # Accept에 따라 같은 URL이 다른 표현을 반환하므로 표현별로 ETag 구분
+    if wants_arrow():
+        parts.append("arrow")
+    return hashlib.sha256("\x1f".join(parts).encode("utf-8")).hexdigest()[:32]
+
+def conditional_get(include_date=False):
+    """
+    ETag 기반 조건부 GET 데코레이터
+    
+    If-None-Match가 현재 ETag와 일치하면 뷰 함수(데이터 조회 및 분석)를
+    실행하지 않고 바로 304를 반환합니다.
+    
+    Args:
+        include_date (bool): ETag에 오늘 날짜를 포함할지 여부
+    """
+    def decorator(view):
+        @wraps(view)
+        def wrapper(*args, **kwargs):
+            user_id = current_user_id()
+            version = get_health_store().get_version(user_id)
+            # 버퍼에만 있는 피드백도 응답(최적 수면 분석 등)에 반영되므로 ETag에 포함
+            pending = pending_feedback_tag(user_id)
+            if pending:
+                version = f"{version}+{pending}"
+            etag = make_etag(user_id, version, include_date)
+            
+            # 압축된 표현의 ETag(접미사 포함)도 같은 데이터로 간주
+            matched = next(
+                (tag for tag in [etag] + [etag + suffix for suffix in ETAG_SUFFIXES.values()]
+                 if request.if_none_match.contains(tag)),
+                None
+            )
+            
+            if matched:
+                etag = matched
+                response = make_response("", 304)
+            else:
+                response = make_response(view(*args, **kwargs))
+                if response.status_code != 200:
+                    return response
+            
+            response.set_etag(etag)
+            response.headers["Cache-Control"] = CACHE_CONTROL
+            response.vary.add("Accept")
+            return response
+        return wrapper
+    return decorator
@@ -0,0 +1,141 @@
+import json
+import math
+from flask.json.provider import DefaultJSONProvider
+import numpy as np
+
+# orjson 사용 (pip install orjson, 필수 패키지) - 없으면 표준 json 모듈로 동작 (느림)
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+def _default(obj):
+    """
+    기본 JSON 인코더가 처리하지 못하는 NumPy/pandas 값 변환
+    
+    Args:
+        obj: 변환할 값
+        
+    Returns:
+        JSON으로 직렬화 가능한 값
+    """
+    if isinstance(obj, np.bool_):
+        return bool(obj)
+    if isinstance(obj, np.integer):
+        return int(obj)
+    if isinstance(obj, np.floating):
+        value = float(obj)
+        return value if math.isfinite(value) else None
+    if isinstance(obj, np.datetime64):
+        return None if np.isnat(obj) else str(obj)
+    if isinstance(obj, np.ndarray):
+        return _finite_list(obj)
+    # pandas Timestamp / datetime / date
+    if hasattr(obj, 'isoformat'):
+        # NaT는 isoformat이 있지만 'NaT' 문자열을 반환하므로 null로 변환
+        return None if obj != obj else obj.isoformat()
+    # pandas Series / Index
+    if hasattr(obj, 'tolist'):
+        return _finite_list(obj)
+    # pandas NA
+    if obj.__class__.__name__ == 'NAType':
+        return None
+    raise TypeError(f"JSON으로 직렬화할 수 없는 타입입니다: {type(obj).__name__}")
+
+def _finite_list(obj):
+    """
+    배열/Series를 리스트로 변환 (실수형이면 NaN/Infinity -> null)
+    """
+    values = obj.tolist()
+    dtype = getattr(obj, 'dtype', None)
+    if dtype is not None and dtype.kind in 'fO':
+        return _sanitize(values)
+    return values
+
+def _sanitize(obj):
+    """
+    표준 json 모듈용 NaN/Infinity -> null 변환 (orjson과 같은 결과를 내기 위함)
+    """
+    if isinstance(obj, float):
+        return obj if math.isfinite(obj) else None
+    if isinstance(obj, dict):
+        return {key: _sanitize(value) for key, value in obj.items()}
+    if isinstance(obj, (list, tuple)):
+        return [_sanitize(value) for value in obj]
+    return obj
+
+def _json_dumps(obj, **kwargs):
+    """
+    표준 json 모듈 직렬화 (orjson이 없을 때)
+
+    보통은 그대로 직렬화하고, NaN/Infinity가 있어 실패한 경우에만 null로 바꾼 사본을 직렬화합니다.
+    """
+    kwargs.setdefault('default', _default)
+    try:
+        return json.dumps(obj, allow_nan=False, **kwargs)
+    except ValueError as e:
+        if 'Out of range float' not in str(e):
+            raise
+    return json.dumps(_sanitize(obj), **kwargs)
+
+def dumps(obj, sort_keys=False):
+    """
+    Flask 앱 밖(백그라운드 작업 등)에서 사용할 JSON 직렬화
+
+    Args:
+        obj: 직렬화할 객체
+        sort_keys (bool): 키 정렬 여부
+
+    Returns:
+        str: JSON 문자열 (NaN/Infinity는 null)
+    """
+    if orjson is not None:
+        options = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+        if sort_keys:
+            options |= orjson.OPT_SORT_KEYS
+        return orjson.dumps(obj, default=_default, option=options).decode('utf-8')
+    return _json_dumps(obj, ensure_ascii=False, sort_keys=sort_keys)
+
+class FastJSONProvider(DefaultJSONProvider):
+    """
+    NumPy/pandas 타입을 직접 처리하는 JSON 제공자
+    orjson이 있으면 응답 본문을 bytes로 바로 만들어 문자열 변환 단계를 생략합니다.
+    NaN과 Infinity는 유효한 JSON이 되도록 null로 직렬화됩니다.
+    """
+
+    def _orjson_options(self):
+        """
+        현재 설정에 맞는 orjson 옵션
+        """
+        options = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+        if self.sort_keys:
+            options |= orjson.OPT_SORT_KEYS
+        return options
+
+    def dumps(self, obj, **kwargs):
+        """
+        객체를 JSON 문자열로 직렬화
+        """
+        if orjson is not None and not kwargs:
+            return orjson.dumps(obj, default=_default, option=self._orjson_options()).decode('utf-8')
+        kwargs.setdefault('ensure_ascii', self.ensure_ascii)
+        kwargs.setdefault('sort_keys', self.sort_keys)
+        return _json_dumps(obj, **kwargs)
+
+    def loads(self, s, **kwargs):
+        """
+        JSON 문자열 역직렬화
+        """
+        if orjson is not None and not kwargs:
+            return orjson.loads(s)
+        return json.loads(s, **kwargs)
+
+    def response(self, *args, **kwargs):
+        """
+        JSON 응답 생성 (jsonify에서 사용, orjson이 없으면 Flask 기본 방식)
+        """
+        if orjson is None:
+            return super().response(*args, **kwargs)
+        obj = self._prepare_response_obj(args, kwargs)
+        body = orjson.dumps(obj, default=_default, option=self._orjson_options())
+        return self._app.response_class(body, mimetype=self.mimetype)
@@ -0,0 +1,294 @@
+import bisect
+import hmac
+import os
+import threading
+import time
+from flask import Response, g, request
+from src.data_analysis.src import instrumentation
+
+# 기본 히스토그램 구간 (초)
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+# 응답 크기 구간 (바이트)
+SIZE_BUCKETS = (256, 1024, 4096, 16384, 65536, 262144, 1048576, 4194304)
+
+def _escape(value):
+    """
+    레이블 값 이스케이프 (Prometheus 텍스트 형식)
+    """
+    return str(value).replace('\\', '\\\\').replace('\n', '\\n').replace('"', '\\"')
+
+def _format_labels(names, values, extra=None):
+    """
+    레이블 문자열 생성 ({name="value",...})
+    """
+    pairs = [f'{name}="{_escape(value)}"' for name, value in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return '{' + ','.join(pairs) + '}' if pairs else ''
+
+def _format_value(value):
+    """
+    숫자 값 출력 형식 (정수는 소수점 없이)
+    """
+    if value == float('inf'):
+        return '+Inf'
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+class _Metric:
+    """
+    레이블별 값을 보관하는 측정 항목 기본 클래스
+    """
+    type_name = None
+
+    def __init__(self, name, documentation, labelnames=()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self.values = {}
+        self.lock = threading.Lock()
+
+    def _key(self, labels):
+        return tuple(str(labels.get(name, '')) for name in self.labelnames)
+
+    def render(self):
+        """
+        Prometheus 텍스트 형식으로 출력
+
+        Returns:
+            list: 출력 줄 목록
+        """
+        lines = [f'# HELP {self.name} {self.documentation}', f'# TYPE {self.name} {self.type_name}']
+        with self.lock:
+            items = sorted(self.values.items())
+        for key, value in items:
+            lines.extend(self._render_value(key, value))
+        return lines
+
+    def _render_value(self, key, value):
+        return [f'{self.name}{_format_labels(self.labelnames, key)} {_format_value(value)}']
+
+class Counter(_Metric):
+    """
+    증가만 하는 카운터
+    """
+    type_name = 'counter'
+
+    def inc(self, value=1, **labels):
+        key = self._key(labels)
+        with self.lock:
+            self.values[key] = self.values.get(key, 0) + value
+
+class Gauge(_Metric):
+    """
+    증가/감소하는 현재 값
+    """
+    type_name = 'gauge'
+
+    def inc(self, value=1, **labels):
+        key = self._key(labels)
+        with self.lock:
+            self.values[key] = self.values.get(key, 0) + value
+
+    def dec(self, value=1, **labels):
+        self.inc(-value, **labels)
+
+    def set(self, value, **labels):
+        key = self._key(labels)
+        with self.lock:
+            self.values[key] = value
+
+class Histogram(_Metric):
+    """
+    누적 구간 히스토그램 (구간별 개수, 합계, 전체 개수)
+    """
+    type_name = 'histogram'
+
+    def __init__(self, name, documentation, labelnames=(), buckets=LATENCY_BUCKETS):
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets))
+
+    def observe(self, value, **labels):
+        key = self._key(labels)
+        index = bisect.bisect_left(self.buckets, value)
+        with self.lock:
+            state = self.values.get(key)
+            if state is None:
+                # [구간별 개수..., +Inf 개수], 합계
+                state = self.values[key] = [[0] * (len(self.buckets) + 1), 0.0]
+            state[0][index] += 1
+            state[1] += value
+
+    def _render_value(self, key, value):
+        counts, total = value
+        lines = []
+        cumulative = 0
+        for bound, bucket_count in zip(self.buckets + (float('inf'),), counts):
+            cumulative += bucket_count
+            le = 'le="' + _format_value(bound) + '"'
+            lines.append(f'{self.name}_bucket{_format_labels(self.labelnames, key, le)} {cumulative}')
+        labels = _format_labels(self.labelnames, key)
+        lines.append(f'{self.name}_sum{labels} {_format_value(total)}')
+        lines.append(f'{self.name}_count{labels} {cumulative}')
+        return lines
+
+class MetricsRegistry:
+    """
+    측정 항목 모음
+    """
+
+    def __init__(self):
+        self.metrics = []
+        self.lock = threading.Lock()
+
+    def register(self, metric):
+        with self.lock:
+            self.metrics.append(metric)
+        return metric
+
+    def render(self):
+        """
+        전체 측정 항목을 Prometheus 텍스트 형식으로 출력
+
+        Returns:
+            str: 노출 형식 문자열
+        """
+        with self.lock:
+            metrics = list(self.metrics)
+        lines = []
+        for metric in metrics:
+            lines.extend(metric.render())
+        return '\n'.join(lines) + '\n'
+
+registry = MetricsRegistry()
+
+# HTTP 요청 측정 항목 (route: URL 규칙, 블루프린트 경로 포함)
+http_request_duration = registry.register(Histogram(
+    'http_request_duration_seconds', 'HTTP 요청 처리 시간',
+    ('method', 'route', 'status')
+))
+http_requests_in_flight = registry.register(Gauge(
+    'http_requests_in_flight', '처리 중인 HTTP 요청 수', ('method', 'route')
+))
+http_response_size = registry.register(Histogram(
+    'http_response_size_bytes', 'HTTP 응답 본문 크기 (압축 후, 스트리밍 응답 제외)',
+    ('method', 'route'), buckets=SIZE_BUCKETS
+))
+
+# 분석 및 Health Connect 클라이언트 측정 항목
+analyzer_stage_duration = registry.register(Histogram(
+    'sleep_analyzer_stage_duration_seconds', 'SleepAnalyzer 단계별 실행 시간', ('stage',)
+))
+health_connect_fetch_duration = registry.register(Histogram(
+    'health_connect_fetch_duration_seconds', 'Health Connect 응답 조회 시간 (재시도 포함)', ('record_type',)
+))
+health_connect_retries = registry.register(Counter(
+    'health_connect_retries_total', 'Health Connect 요청 재시도 횟수', ('reason',)
+))
+health_connect_cache_hits = registry.register(Counter(
+    'health_connect_cache_hits_total', 'Health Connect 디스크 캐시 적중 횟수', ('record_type',)
+))
+health_connect_limiter_rate = registry.register(Gauge(
+    'health_connect_limiter_rate', 'AdaptiveRateLimiter 현재 초당 요청 한도'
+))
+health_connect_limiter_concurrency = registry.register(Gauge(
+    'health_connect_limiter_concurrency', 'AdaptiveRateLimiter 현재 동시 요청 한도'
+))
+health_connect_limiter_backoffs = registry.register(Counter(
+    'health_connect_limiter_backoffs_total', 'AdaptiveRateLimiter 한도 감소 횟수', ('reason',)
+))
+health_connect_limiter_wait = registry.register(Histogram(
+    'health_connect_limiter_wait_seconds', 'AdaptiveRateLimiter 슬롯 및 토큰 대기 시간'
+))
+
+# data_analysis 측정 이벤트 이름 -> 측정 항목
+_INSTRUMENTATION_METRICS = {
+    'sleep_analyzer_stage': analyzer_stage_duration,
+    'health_connect_fetch': health_connect_fetch_duration,
+    'health_connect_retries': health_connect_retries,
+    'health_connect_cache_hits': health_connect_cache_hits,
+    'health_connect_limiter_rate': health_connect_limiter_rate,
+    'health_connect_limiter_concurrency': health_connect_limiter_concurrency,
+    'health_connect_limiter_backoffs': health_connect_limiter_backoffs,
+    'health_connect_limiter_wait': health_connect_limiter_wait
+}
+
+def _record_instrumentation(kind, name, value, labels):
+    """
+    data_analysis 측정 이벤트를 측정 항목에 기록
+    """
+    metric = _INSTRUMENTATION_METRICS.get(name)
+    if metric is None:
+        return
+    if kind == 'timing':
+        metric.observe(value, **labels)
+    elif kind == 'gauge':
+        metric.set(value, **labels)
+    else:
+        metric.inc(value, **labels)
+
+def observe_request(method, route, status, duration, size=None):
+    """
+    HTTP 요청 하나의 처리 시간과 응답 크기 기록 (Flask 훅과 ASGI 비동기 경로 공용)
+
+    Args:
+        method (str): HTTP 메서드
+        route (str): route 레이블 (URL 규칙)
+        status (int): 응답 상태 코드
+        duration (float): 처리 시간 (초)
+        size (int): 응답 본문 크기 (바이트, 스트리밍 응답은 None)
+    """
+    http_request_duration.observe(duration, method=method, route=route, status=status)
+    if size is not None:
+        http_response_size.observe(size, method=method, route=route)
+
+def _route_label():
+    """
+    요청의 route 레이블 (URL 규칙, 매칭되지 않은 요청은 하나로 묶음)
+    """
+    return request.url_rule.rule if request.url_rule is not None else 'unmatched'
+
+def init_metrics(app, path='/metrics'):
+    """
+    요청 측정 훅과 /metrics 엔드포인트 등록
+
+    압축 후 응답 크기를 측정하려면 init_compression보다 먼저 호출해야 합니다
+    (after_request 훅은 등록 역순으로 실행).
+
+    METRICS_TOKEN 환경 변수가 설정되어 있으면 /metrics는 같은 Bearer 토큰을 요구합니다.
+
+    Args:
+        app (Flask): Flask 앱
+        path (str): 측정 항목 노출 경로
+    """
+    instrumentation.add_observer(_record_instrumentation)
+    token = os.environ.get('METRICS_TOKEN')
+
+    @app.before_request
+    def _start_request_metrics():
+        g._metrics_started = time.perf_counter()
+        g._metrics_route = _route_label()
+        http_requests_in_flight.inc(method=request.method, route=g._metrics_route)
+
+    @app.after_request
+    def _record_request_metrics(response):
+        started = g.pop('_metrics_started', None)
+        if started is None:
+            return response
+        size = response.content_length if not response.is_streamed else None
+        observe_request(request.method, g._metrics_route, response.status_code, time.perf_counter() - started, size)
+        return response
+
+    @app.teardown_request
+    def _finish_request_metrics(exc):
+        route = g.pop('_metrics_route', None)
+        if route is not None:
+            http_requests_in_flight.dec(method=request.method, route=route)
+
+    def metrics_endpoint():
+        if token and not hmac.compare_digest(request.headers.get('Authorization', ''), f'Bearer {token}'):
+            return Response('unauthorized\n', status=401, mimetype='text/plain')
+        return Response(registry.render(), mimetype='text/plain; version=0.0.4')
+
+    app.add_url_rule(path, 'metrics', metrics_endpoint, methods=['GET'])
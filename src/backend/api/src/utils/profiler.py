@@ -0,0 +1,169 @@
+import cProfile
+import hmac
+import os
+import random
+import re
+import sys
+import threading
+import time
+import uuid
+from collections import Counter
+from flask import g, request
+
+# 프로파일링 요청 헤더 (값은 PROFILE_TOKEN과 같아야 함)
+PROFILE_HEADER = 'X-Profile'
+# 프로파일러 종류 선택 헤더 (cprofile 또는 sample)
+PROFILE_MODE_HEADER = 'X-Profile-Mode'
+
+class StackSampler:
+    """
+    대상 스레드의 호출 스택을 주기적으로 수집하는 샘플링 프로파일러
+    결과는 flamegraph.pl, speedscope 등에서 바로 읽을 수 있는 collapsed stack 형식입니다.
+    """
+
+    def __init__(self, thread_id, interval=0.005):
+        """
+        StackSampler 초기화
+
+        Args:
+            thread_id (int): 샘플링할 스레드 ID
+            interval (float): 샘플링 간격 (초)
+        """
+        self.thread_id = thread_id
+        self.interval = interval
+        self.stacks = Counter()
+        self.stopped = threading.Event()
+        self.thread = threading.Thread(target=self._run, name='stack-sampler', daemon=True)
+
+    def start(self):
+        self.thread.start()
+
+    def stop(self):
+        self.stopped.set()
+        self.thread.join()
+
+    def _run(self):
+        while not self.stopped.wait(self.interval):
+            frame = sys._current_frames().get(self.thread_id)
+            if frame is None:
+                continue
+            stack = []
+            while frame is not None:
+                code = frame.f_code
+                stack.append(f'{code.co_name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})')
+                frame = frame.f_back
+            self.stacks[';'.join(reversed(stack))] += 1
+
+    def dump(self, path):
+        """
+        collapsed stack 형식으로 저장 (한 줄에 "호출;스택 샘플수")
+        """
+        with open(path, 'w', encoding='utf-8') as f:
+            for stack, samples in self.stacks.most_common():
+                f.write(f'{stack} {samples}\n')
+
+class _CProfileSession:
+    """
+    cProfile 세션 (pstats 파일로 저장)
+    """
+
+    def __init__(self):
+        self.profile = cProfile.Profile()
+
+    def start(self):
+        self.profile.enable()
+
+    def stop(self):
+        self.profile.disable()
+
+    def dump(self, path):
+        self.profile.dump_stats(path)
+
+def _route_slug():
+    """
+    파일 이름에 사용할 route 이름 (예: api_analysis_comprehensive)
+    """
+    rule = request.url_rule.rule if request.url_rule is not None else 'unmatched'
+    return re.sub(r'[^A-Za-z0-9]+', '_', rule).strip('_') or 'root'
+
+def init_profiler(app, output_dir=None, token=None, sample_rate=None, mode=None, interval=None):
+    """
+    요청 단위 프로파일링 훅 등록
+
+    다음 중 하나에 해당하는 요청을 프로파일링해 route별 디렉토리에 저장합니다.
+    - PROFILE_TOKEN이 설정되어 있고 X-Profile 헤더 값이 일치하는 요청 (관리자용)
+    - PROFILE_SAMPLE_RATE 비율로 무작위 선택된 요청
+
+    토큰과 샘플링 비율이 모두 없으면 훅을 등록하지 않으므로 비활성 시 오버헤드가 없습니다.
+    cProfile은 한 번에 하나의 요청만 측정하며, 이미 측정 중이면 해당 요청은 건너뜁니다.
+
+    Args:
+        app (Flask): Flask 앱
+        output_dir (str): 결과 저장 디렉토리 (기본값: PROFILE_DIR 환경 변수 또는 instance/profiles)
+        token (str): 관리자 헤더 토큰 (기본값: PROFILE_TOKEN 환경 변수)
+        sample_rate (float): 무작위 프로파일링 비율 0~1 (기본값: PROFILE_SAMPLE_RATE 환경 변수)
+        mode (str): 기본 프로파일러 cprofile 또는 sample (기본값: PROFILE_MODE 환경 변수, cprofile)
+        interval (float): 샘플링 프로파일러 간격 (초, 기본값: PROFILE_SAMPLE_INTERVAL 환경 변수)
+    """
+    token = token or os.environ.get('PROFILE_TOKEN')
+    sample_rate = float(sample_rate if sample_rate is not None else os.environ.get('PROFILE_SAMPLE_RATE', 0))
+    if not token and sample_rate <= 0:
+        return
+
+    output_dir = output_dir or os.environ.get('PROFILE_DIR', os.path.join(app.instance_path, 'profiles'))
+    default_mode = mode or os.environ.get('PROFILE_MODE', 'cprofile')
+    interval = float(interval or os.environ.get('PROFILE_SAMPLE_INTERVAL', 0.005))
+    cprofile_lock = threading.Lock()
+
+    def _requested_mode():
+        header = request.headers.get(PROFILE_HEADER)
+        if token and header and hmac.compare_digest(header, token):
+            return request.headers.get(PROFILE_MODE_HEADER, default_mode)
+        if sample_rate > 0 and random.random() < sample_rate:
+            return default_mode
+        return None
+
+    @app.before_request
+    def _start_profile():
+        mode = _requested_mode()
+        if mode is None:
+            return
+
+        # 디렉터리 생성 실패가 cProfile 잠금을 잡은 채로 남지 않도록 잠금 전에 생성
+        directory = os.path.join(output_dir, _route_slug())
+        os.makedirs(directory, exist_ok=True)
+
+        if mode == 'sample':
+            session = StackSampler(threading.get_ident(), interval)
+            extension = 'collapsed'
+        else:
+            if not cprofile_lock.acquire(blocking=False):
+                return
+            session = _CProfileSession()
+            extension = 'pstats'
+
+        g._profile = (session, mode)
+        g._profile_path = os.path.join(
+            directory, f'{time.strftime("%Y%m%d-%H%M%S")}-{os.getpid()}-{uuid.uuid4().hex[:8]}.{extension}'
+        )
+        session.start()
+
+    @app.after_request
+    def _add_profile_header(response):
+        path = g.get('_profile_path')
+        if path and request.headers.get(PROFILE_HEADER):
+            response.headers['X-Profile-Output'] = os.path.relpath(path, output_dir)
+        return response
+
+    @app.teardown_request
+    def _finish_profile(exc):
+        profile = g.pop('_profile', None)
+        if profile is None:
+            return
+        session, mode = profile
+        try:
+            session.stop()
+            session.dump(g.pop('_profile_path'))
+        finally:
+            if mode != 'sample':
+                cprofile_lock.release()
@@ -0,0 +1,58 @@
+"""
+Arrow IPC 응답 테스트
+
+    python -m pytest src/backend/api/tests
+"""
+import io
+import json
+from datetime import datetime
+
+import pytest
+
+pa = pytest.importorskip("pyarrow")
+
+from src.backend.api.src.models import health_store
+from src.backend.api.src.utils.arrow_format import ARROW_STREAM_MIMETYPE, iter_arrow_stream, record_schema
+
+def _read_stream(chunks):
+    return pa.ipc.open_stream(io.BytesIO(b"".join(chunks))).read_all()
+
+def test_fractional_seconds_are_truncated():
+    schema = record_schema("sleep")
+    rows = [
+        ("a", "2020-01-01T23:10:00.500000", "2020-01-02T07:00:00", 470, 0.9, 0.2, 0.5, 0.2, 0.1),
+        ("b", "2020-01-02T23:00:00", "2020-01-03T07:00:00.25", 480, 0.8, 0.2, 0.5, 0.2, 0.1)
+    ]
+    table = _read_stream(iter_arrow_stream(schema, [rows]))
+    assert table.column("start_time").to_pylist() == [datetime(2020, 1, 1, 23, 10), datetime(2020, 1, 2, 23, 0)]
+    assert table.column("end_time").to_pylist() == [datetime(2020, 1, 2, 7, 0), datetime(2020, 1, 3, 7, 0)]
+
+def test_arrow_export_after_fractional_bulk_upload(tmp_path, monkeypatch):
+    monkeypatch.setenv("HEALTH_DB_PATH", str(tmp_path / "health.db"))
+    monkeypatch.setattr(health_store, "_store", None)
+    from src.backend.api.src.main import create_app
+
+    app = create_app({"SQLALCHEMY_DATABASE_URI": f"sqlite:///{tmp_path / 'users.db'}", "TESTING": True}, seed=False)
+    client = app.test_client()
+    credentials = {"email": "arrow@example.com", "password": "arrow-password", "name": "arrow"}
+    client.post("/api/auth/register", json=credentials)
+    token = client.post("/api/auth/login", json=credentials).get_json()["token"]
+    headers = {"Authorization": f"Bearer {token}"}
+
+    record = {
+        "id": "frac", "start_time": "2020-01-01T23:10:00.5", "end_time": "2020-01-02T07:00:00",
+        "duration": 470, "efficiency": 0.9, "stages": {"deep": 0.2, "light": 0.5, "rem": 0.2, "awake": 0.1}
+    }
+    response = client.post(
+        "/api/health_connect/sleep/bulk", data=json.dumps(record) + "\n",
+        content_type="application/x-ndjson", headers=headers
+    )
+    assert response.status_code == 200 and response.get_json()["accepted"] == 1
+
+    response = client.get(
+        "/api/health_connect/sleep?start_date=2020-01-01&end_date=2020-01-31",
+        headers=dict(headers, Accept=ARROW_STREAM_MIMETYPE)
+    )
+    assert response.status_code == 200
+    table = _read_stream([response.get_data()])
+    assert table.column("start_time").to_pylist() == [datetime(2020, 1, 1, 23, 10)]
@@ -0,0 +1,304 @@
+"""
+분석 엔진(SleepAnalyzer) 벤치마크
+
+생성한 데이터셋으로 load_data, 분석 메서드별, 종합 분석의 실행 시간(중앙값)과
+tracemalloc 최대 메모리를 수면 기록 수(기본값 10^2 ~ 10^6)와 데이터 구성별로 측정합니다.
+
+    python src/data_analysis/benchmarks/analyzer_benchmark.py --output results.json
+    python src/data_analysis/benchmarks/analyzer_benchmark.py --sizes 100,10000 --baseline baseline.json
+
+데이터 구성:
+    sleep: 수면 데이터만
+    full: 수면 + 활동 + 스트레스 + 피드백
+
+수면 기록은 오늘까지 하루 한 건이며, 기록 수가 MAX_SPAN_DAYS를 넘으면 같은 기간에
+하루 여러 건(낮잠 등)으로 배치합니다. 활동/스트레스/피드백은 하루 한 건입니다.
+같은 시드로 생성한 데이터셋은 항상 같습니다.
+"""
+import argparse
+import json
+import os
+import platform
+import statistics
+import sys
+import time
+import tracemalloc
+
+PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '../../../'))
+if PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT)
+
+import numpy as np
+import pandas as pd
+from src.data_analysis.src.analysis.sleep_analyzer import SleepAnalyzer
+
+DEFAULT_SIZES = (100, 1000, 10000, 100000, 1000000)
+VARIANTS = ("sleep", "full")
+
+# 생성 데이터의 최대 기간 (일) - 날짜는 Python date 범위 안에 있어야 하므로 약 100년으로 제한
+MAX_SPAN_DAYS = 36500
+
+# 측정 대상 (이름, 로드된 분석기를 받아 실행할 함수)
+OPERATIONS = (
+    ("get_sleep_summary", lambda analyzer: analyzer.get_sleep_summary()),
+    ("get_optimal_sleep_time", lambda analyzer: analyzer.get_optimal_sleep_time()),
+    ("analyze_sleep_trends", lambda analyzer: analyzer.analyze_sleep_trends(days=30)),
+    ("analyze_correlations", lambda analyzer: analyzer.analyze_correlations()),
+    ("get_comprehensive_analysis", lambda analyzer: analyzer.get_comprehensive_analysis())
+)
+
+# 기준 결과 대비 이 비율 이상 느려지면 회귀로 표시
+DEFAULT_THRESHOLD = 0.10
+
+# 이보다 짧은 차이는 측정 오차로 보고 회귀로 표시하지 않음 (초)
+MIN_REGRESSION_SECONDS = 0.001
+
+def generate_dataset(size, variant, seed=0, value_format="numpy"):
+    """
+    벤치마크용 데이터셋 생성
+
+    Args:
+        size (int): 수면 기록 수
+        variant (str): 데이터 구성 (sleep, full)
+        seed (int): 난수 시드
+        value_format (str): numpy (decode_records/메모리 매핑 배열과 같은 컬럼형 배열) 또는
+            strings (저장소 fetch_columns와 같은 ISO 문자열 리스트)
+
+    Returns:
+        dict: load_data 인자 이름 -> 컬럼형 데이터
+    """
+    rng = np.random.default_rng(seed)
+    span = min(size, MAX_SPAN_DAYS)
+    today = np.datetime64('today', 'D')
+    first_day = today - np.timedelta64(span - 1, 'D')
+
+    # 수면: 22시 전후 취침, 기록이 기간보다 많으면 하루 여러 건
+    days = first_day + (np.arange(size, dtype=np.int64) * span // size).astype('timedelta64[D]')
+    bedtime_minutes = np.clip(rng.normal(22 * 60 + 30, 45, size), 18 * 60, 26 * 60).astype(np.int64)
+    start = days.astype('datetime64[s]') + (bedtime_minutes * 60).astype('timedelta64[s]')
+    duration = np.clip(rng.normal(450, 45, size), 180, 720).astype(np.int64)
+    end = start + (duration * 60).astype('timedelta64[s]')
+    deep = np.round(duration * rng.uniform(0.15, 0.25, size), 1)
+    rem = np.round(duration * rng.uniform(0.18, 0.26, size), 1)
+    awake = np.round(duration * rng.uniform(0.03, 0.10, size), 1)
+    sleep = {
+        "id": np.array([f"sleep_{index}" for index in range(size)], dtype=object),
+        "start_time": start,
+        "end_time": end,
+        "duration": duration,
+        "efficiency": np.round(np.clip(rng.normal(88, 5, size), 50, 100), 1),
+        "stages_deep": deep,
+        "stages_light": np.round(duration - deep - rem - awake, 1),
+        "stages_rem": rem,
+        "stages_awake": awake
+    }
+    dataset = {"sleep_data": sleep}
+
+    if variant == "full":
+        dates = first_day + np.arange(span).astype('timedelta64[D]')
+        average_stress = np.round(rng.uniform(20, 70, span), 1)
+        dataset["activity_data"] = {
+            "id": np.array([f"activity_{index}" for index in range(span)], dtype=object),
+            "date": dates,
+            "steps": rng.integers(2000, 15000, span),
+            "active_minutes": rng.integers(10, 120, span),
+            "calories": np.round(rng.uniform(1500, 3200, span), 1)
+        }
+        dataset["stress_data"] = {
+            "id": np.array([f"stress_{index}" for index in range(span)], dtype=object),
+            "date": dates,
+            "average_score": average_stress,
+            "max_score": np.minimum(100, average_stress + 20),
+            "min_score": np.maximum(0, average_stress - 15)
+        }
+        dataset["feedback_data"] = {
+            "date": dates,
+            "sleep_satisfaction": rng.integers(1, 6, span),
+            "morning_condition": rng.integers(1, 6, span),
+            "notes": np.full(span, None, dtype=object)
+        }
+
+    if value_format == "strings":
+        dataset = {name: _as_strings(columns) for name, columns in dataset.items()}
+    return dataset
+
+def _as_strings(columns):
+    """
+    컬럼형 배열을 저장소 조회 결과 형식(날짜/시간은 ISO 문자열, 값은 리스트)으로 변환
+    """
+    converted = {}
+    for name, values in columns.items():
+        if np.issubdtype(values.dtype, np.datetime64):
+            values = np.datetime_as_string(values)
+        converted[name] = values.tolist()
+    return converted
+
+def _load(dataset):
+    analyzer = SleepAnalyzer()
+    analyzer.load_data(**dataset)
+    return analyzer
+
+def _time(function, repeat):
+    """
+    함수 실행 시간 측정
+
+    Returns:
+        list: 실행 시간 목록 (초)
+    """
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        function()
+        timings.append(time.perf_counter() - started)
+    return timings
+
+def _peak_memory(function):
+    """
+    함수 실행 중 tracemalloc 최대 메모리 (MB, 실행 전 사용량 제외)
+    """
+    tracemalloc.start()
+    try:
+        tracemalloc.reset_peak()
+        baseline, _ = tracemalloc.get_traced_memory()
+        function()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return (peak - baseline) / (1024 * 1024)
+
+def benchmark(size, variant, repeat=3, seed=0, value_format="numpy", memory=True):
+    """
+    한 데이터 크기/구성의 측정
+
+    분석 메서드는 매번 새로 로드한 분석기에서 실행합니다 (API 요청마다 로드 후
+    분석하는 것과 같고, 로드 시 계산하는 중간 결과 재사용 효과는 종합 분석에 포함).
+    시간과 메모리는 tracemalloc 오버헤드가 시간 측정에 섞이지 않도록 따로 측정합니다.
+
+    Returns:
+        list: 측정 결과 목록
+    """
+    dataset = generate_dataset(size, variant, seed, value_format)
+    # 첫 실행의 지연 초기화가 측정에 섞이지 않도록 한 번 실행
+    for _, operation in OPERATIONS:
+        operation(_load(dataset))
+
+    results = []
+    timings = _time(lambda: _load(dataset), repeat)
+    peak = _peak_memory(lambda: _load(dataset)) if memory else None
+    results.append(_result(size, variant, value_format, "load_data", timings, peak))
+
+    for name, operation in OPERATIONS:
+        timings = []
+        for _ in range(repeat):
+            analyzer = _load(dataset)
+            timings += _time(lambda: operation(analyzer), 1)
+        peak = None
+        if memory:
+            analyzer = _load(dataset)
+            peak = _peak_memory(lambda: operation(analyzer))
+        results.append(_result(size, variant, value_format, name, timings, peak))
+    return results
+
+def _result(size, variant, value_format, operation, timings, peak_memory_mb):
+    return {
+        "size": size,
+        "variant": variant,
+        "format": value_format,
+        "operation": operation,
+        "median_seconds": round(statistics.median(timings), 6),
+        "min_seconds": round(min(timings), 6),
+        "peak_memory_mb": None if peak_memory_mb is None else round(peak_memory_mb, 3)
+    }
+
+def compare(results, baseline, threshold=DEFAULT_THRESHOLD):
+    """
+    기준 결과와 비교
+
+    Args:
+        results (list): 현재 측정 결과
+        baseline (dict): 기준 결과 파일 내용
+        threshold (float): 회귀로 표시할 느려짐 비율
+
+    Returns:
+        list: 같은 크기/구성/형식/대상의 비교 결과 (ratio = 현재 / 기준 중앙값)
+    """
+    key = lambda result: (result["size"], result["variant"], result.get("format", "numpy"), result["operation"])
+    previous = {key(result): result for result in baseline.get("results", [])}
+    comparison = []
+    for result in results:
+        before = previous.get(key(result))
+        if before is None:
+            continue
+        ratio = result["median_seconds"] / before["median_seconds"] if before["median_seconds"] else None
+        slower = result["median_seconds"] - before["median_seconds"]
+        entry = {
+            "size": result["size"],
+            "variant": result["variant"],
+            "format": result["format"],
+            "operation": result["operation"],
+            "baseline_seconds": before["median_seconds"],
+            "current_seconds": result["median_seconds"],
+            "ratio": None if ratio is None else round(ratio, 3),
+            "regression": ratio is not None and ratio > 1 + threshold and slower > MIN_REGRESSION_SECONDS
+        }
+        if result["peak_memory_mb"] is not None and before.get("peak_memory_mb"):
+            entry["memory_ratio"] = round(result["peak_memory_mb"] / before["peak_memory_mb"], 3)
+        comparison.append(entry)
+    return comparison
+
+def main():
+    parser = argparse.ArgumentParser(description='분석 엔진 벤치마크')
+    parser.add_argument('--sizes', default=','.join(str(size) for size in DEFAULT_SIZES), help='쉼표로 구분한 수면 기록 수')
+    parser.add_argument('--variants', default=','.join(VARIANTS), help='쉼표로 구분한 데이터 구성 (sleep, full)')
+    parser.add_argument('--repeat', type=int, default=3, help='측정 반복 횟수 (중앙값 사용)')
+    parser.add_argument('--seed', type=int, default=0, help='데이터 생성 시드')
+    parser.add_argument('--format', choices=('numpy', 'strings'), default='numpy', help='입력 데이터 형식')
+    parser.add_argument('--no-memory', action='store_true', help='tracemalloc 메모리 측정 생략')
+    parser.add_argument('--baseline', help='비교할 기준 결과 JSON 파일')
+    parser.add_argument('--threshold', type=float, default=DEFAULT_THRESHOLD, help='회귀로 표시할 느려짐 비율')
+    parser.add_argument('--fail-on-regression', action='store_true', help='회귀가 있으면 종료 코드 1')
+    parser.add_argument('--output', help='결과 JSON 파일 경로')
+    args = parser.parse_args()
+
+    sizes = [int(value) for value in args.sizes.split(',') if value]
+    variants = [value for value in args.variants.split(',') if value]
+    unknown = [variant for variant in variants if variant not in VARIANTS]
+    if unknown:
+        parser.error(f"알 수 없는 데이터 구성입니다: {', '.join(unknown)}")
+
+    results = []
+    for size in sizes:
+        for variant in variants:
+            results += benchmark(size, variant, args.repeat, args.seed, args.format, memory=not args.no_memory)
+            print(f"{size} {variant} 완료", file=sys.stderr)
+
+    report = {
+        "meta": {
+            "python": platform.python_version(),
+            "numpy": np.__version__,
+            "pandas": pd.__version__,
+            "platform": platform.platform(),
+            "repeat": args.repeat,
+            "seed": args.seed,
+            "format": args.format
+        },
+        "results": results
+    }
+    regressions = []
+    if args.baseline:
+        with open(args.baseline, encoding='utf-8') as f:
+            report["comparison"] = compare(results, json.load(f), args.threshold)
+        regressions = [entry for entry in report["comparison"] if entry["regression"]]
+        report["regressions"] = len(regressions)
+
+    text = json.dumps(report, indent=2, ensure_ascii=False)
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            f.write(text + '\n')
+    print(text)
+
+    if regressions and args.fail_on_regression:
+        sys.exit(1)
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,164 @@
+import numpy as np
+from typing import Dict, List, Mapping, Sequence
+
+# 지원하는 집계 단위
+RESOLUTIONS = ("day", "week", "month")
+
+# 레코드 유형별 날짜 컬럼과 LTTB 기본 기준 값 컬럼
+DATE_COLUMNS = {
+    "sleep": "start_time",
+    "activity": "date",
+    "stress": "date"
+}
+PRIMARY_FIELDS = {
+    "sleep": "duration",
+    "activity": "steps",
+    "stress": "average_score"
+}
+
+def to_days(values: Sequence) -> np.ndarray:
+    """
+    날짜 또는 날짜/시간 문자열을 일 단위 datetime64 배열로 변환
+
+    Args:
+        values: ISO 8601 문자열 시퀀스 (YYYY-MM-DD 또는 YYYY-MM-DDTHH:MM:SS)
+
+    Returns:
+        np.ndarray: datetime64[D] 배열
+    """
+    array = np.asarray(values)
+    if array.dtype.kind in ("U", "S", "O"):
+        array = array.astype("U10")
+    return array.astype("datetime64[D]")
+
+def bucket_keys(days: np.ndarray, resolution: str) -> np.ndarray:
+    """
+    각 날짜가 속한 구간의 시작 날짜
+
+    Args:
+        days: datetime64[D] 배열
+        resolution: 집계 단위 (day, week, month)
+
+    Returns:
+        np.ndarray: 구간 시작 날짜 (datetime64[D]) - 주 단위는 월요일 시작
+    """
+    if resolution == "day":
+        return days
+    if resolution == "week":
+        # 1970-01-01은 목요일이므로 (일수 + 3) % 7이 월요일 기준 요일
+        offsets = (days.astype(np.int64) + 3) % 7
+        return days - offsets.astype("timedelta64[D]")
+    if resolution == "month":
+        return days.astype("datetime64[M]").astype("datetime64[D]")
+    raise ValueError(f"지원하지 않는 집계 단위입니다: {resolution}")
+
+def aggregate_buckets(days: np.ndarray, columns: Mapping[str, Sequence], resolution: str) -> List[Dict]:
+    """
+    날짜 구간별 평균/최소/최대 집계 (벡터 연산)
+
+    구간 키를 정렬한 뒤 구간 경계에서 reduceat으로 한 번에 집계합니다.
+    결측값(NaN)은 집계에서 제외됩니다.
+
+    Args:
+        days: datetime64[D] 배열
+        columns: 컬럼 이름 -> 숫자 값 시퀀스
+        resolution: 집계 단위 (day, week, month)
+
+    Returns:
+        List[Dict]: 구간별 {"bucket", "count", 컬럼: {"mean", "min", "max"}} 목록 (날짜순)
+    """
+    if len(days) == 0:
+        return []
+
+    keys = bucket_keys(days, resolution)
+    order = np.argsort(keys, kind="stable")
+    keys = keys[order]
+    buckets, starts, counts = np.unique(keys, return_index=True, return_counts=True)
+
+    results = [
+        {"bucket": str(bucket), "count": int(count)}
+        for bucket, count in zip(buckets, counts)
+    ]
+
+    for name, values in columns.items():
+        values = np.asarray(values, dtype=np.float64)[order]
+        missing = np.isnan(values)
+        present = np.add.reduceat(~missing, starts)
+        sums = np.add.reduceat(np.where(missing, 0.0, values), starts)
+        # fmin/fmax는 NaN을 무시 (구간 전체가 NaN이면 NaN)
+        minimums = np.fmin.reduceat(values, starts)
+        maximums = np.fmax.reduceat(values, starts)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            means = sums / present
+
+        for result, mean, low, high, n in zip(results, means, minimums, maximums, present):
+            result[name] = None if n == 0 else {
+                "mean": round(float(mean), 2),
+                "min": float(low),
+                "max": float(high)
+            }
+
+    return results
+
+def lttb_indices(x: np.ndarray, y: np.ndarray, threshold: int) -> np.ndarray:
+    """
+    LTTB(Largest-Triangle-Three-Buckets) 다운샘플링으로 남길 점의 위치
+
+    첫 점과 마지막 점을 유지하고, 나머지를 threshold - 2개 구간으로 나눠
+    직전에 선택한 점과 다음 구간 평균점이 이루는 삼각형 넓이가 가장 큰 점을
+    구간마다 하나씩 선택합니다. 구간 안의 넓이 계산은 벡터 연산입니다.
+
+    Args:
+        x: x 값 (오름차순, 예: 일수)
+        y: y 값 (NaN은 0으로 취급)
+        threshold: 남길 점 수 (3 이상)
+
+    Returns:
+        np.ndarray: 선택된 점의 위치 (오름차순)
+    """
+    n = len(x)
+    if threshold >= n or threshold < 3:
+        return np.arange(n)
+
+    x = np.asarray(x, dtype=np.float64)
+    y = np.nan_to_num(np.asarray(y, dtype=np.float64))
+
+    # 첫/마지막 점을 제외한 구간 경계
+    edges = np.linspace(1, n - 1, threshold - 1).astype(np.int64)
+    selected = np.empty(threshold, dtype=np.int64)
+    selected[0] = 0
+    selected[-1] = n - 1
+    previous = 0
+
+    for bucket in range(threshold - 2):
+        start, end = edges[bucket], edges[bucket + 1]
+        # 다음 구간의 평균점 (마지막 구간은 마지막 점)
+        next_start, next_end = end, edges[bucket + 2] if bucket + 2 < len(edges) else n
+        avg_x = x[next_start:next_end].mean()
+        avg_y = y[next_start:next_end].mean()
+
+        areas = np.abs(
+            (x[previous] - avg_x) * (y[start:end] - y[previous])
+            - (x[previous] - x[start:end]) * (avg_y - y[previous])
+        )
+        previous = start + int(np.argmax(areas))
+        selected[bucket + 1] = previous
+
+    return selected
+
+def downsample_columns(record_type: str, columns: Mapping[str, Sequence], max_points: int, field: str = None) -> np.ndarray:
+    """
+    컬럼형 레코드에서 LTTB로 남길 행 위치 계산
+
+    Args:
+        record_type: 레코드 유형 (sleep, activity, stress)
+        columns: 컬럼 이름 -> 값 시퀀스 (날짜순)
+        max_points: 남길 최대 점 수
+        field: 기준 값 컬럼 (기본값: 레코드 유형별 기본 컬럼)
+
+    Returns:
+        np.ndarray: 선택된 행 위치
+    """
+    days = to_days(columns[DATE_COLUMNS[record_type]])
+    values = columns[field or PRIMARY_FIELDS[record_type]]
+    return lttb_indices(days.astype(np.int64), np.asarray(values, dtype=np.float64), max_points)
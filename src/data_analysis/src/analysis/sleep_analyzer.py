@@ -1,13 +1,22 @@
 import numpy as np
 import pandas as pd
 from datetime import datetime, timedelta
-from typing import Dict, List, Tuple, Optional
+from typing import Dict, List, Mapping, Tuple, Optional, Union
+from src.data_analysis.src.instrumentation import timed_stage
 
 class SleepAnalyzer:
     """
     수면 데이터 분석을 위한 클래스
     """
     
+    # 분석 섹션 이름 -> 분석 메서드
+    SECTIONS = {
+        "summary": "get_sleep_summary",
+        "optimal_sleep": "get_optimal_sleep_time",
+        "trends": "analyze_sleep_trends",
+        "correlations": "analyze_correlations"
+    }
+    
     def __init__(self):
         """
         SleepAnalyzer 초기화
@@ -16,12 +25,18 @@ class SleepAnalyzer:
         self.activity_data = None
         self.stress_data = None
         self.feedback_data = None
+        # 여러 분석에서 함께 쓰는 중간 계산 결과 (load_data 시 초기화)
+        self._sleep_hours = None
     
-    def load_data(self, sleep_data: List[Dict], activity_data: List[Dict] = None, 
-                 stress_data: List[Dict] = None, feedback_data: List[Dict] = None):
+    @timed_stage("load_data")
+    def load_data(self, sleep_data: Union[List[Dict], Mapping], activity_data: Union[List[Dict], Mapping] = None, 
+                 stress_data: Union[List[Dict], Mapping] = None, feedback_data: Union[List[Dict], Mapping] = None):
         """
         분석을 위한 데이터 로드
         
+        각 데이터는 레코드 리스트 또는 health_connect_schema.decode_records가 만든
+        컬럼형 매핑(컬럼 이름 -> 배열)으로 전달할 수 있습니다.
+        
         Args:
             sleep_data: 수면 데이터 리스트
             activity_data: 활동 데이터 리스트 (선택)
@@ -37,9 +52,12 @@ class SleepAnalyzer:
         if 'end_time' in self.sleep_data.columns:
             self.sleep_data['end_time'] = pd.to_datetime(self.sleep_data['end_time'])
         
-        # 날짜 컬럼 추가
+        # 날짜 컬럼 추가 및 시작 시간순 정렬 (추세 분석에서 반복 정렬하지 않도록 한 번만)
         if 'start_time' in self.sleep_data.columns:
             self.sleep_data['date'] = self.sleep_data['start_time'].dt.date
+            if not self.sleep_data['start_time'].is_monotonic_increasing:
+                self.sleep_data = self.sleep_data.sort_values('start_time')
+        self._sleep_hours = None
         
         # 활동 데이터가 제공된 경우 DataFrame으로 변환
         if activity_data:
@@ -59,6 +77,20 @@ class SleepAnalyzer:
             if 'date' in self.feedback_data.columns:
                 self.feedback_data['date'] = pd.to_datetime(self.feedback_data['date']).dt.date
     
+    def _get_sleep_hours(self) -> Tuple[pd.Series, pd.Series]:
+        """
+        취침/기상 시각을 시간 단위 실수로 변환한 값 (한 번 계산 후 재사용)
+        
+        Returns:
+            Tuple: (취침 시각, 기상 시각) Series
+        """
+        if self._sleep_hours is None:
+            start = self.sleep_data['start_time'].dt
+            end = self.sleep_data['end_time'].dt
+            self._sleep_hours = (start.hour + start.minute / 60, end.hour + end.minute / 60)
+        return self._sleep_hours
+    
+    @timed_stage("summary")
     def get_sleep_summary(self) -> Dict:
         """
         수면 데이터 요약 정보 계산
@@ -88,7 +120,15 @@ class SleepAnalyzer:
         avg_rem = 0
         avg_awake = 0
         
-        if 'stages' in self.sleep_data.columns:
+        if 'stages_deep' in self.sleep_data.columns:
+            # 디코딩 단계에서 평탄화된 수면 단계 컬럼인 경우 (누락값은 NaN으로 제외)
+            stage_means = self.sleep_data[['stages_deep', 'stages_light', 'stages_rem', 'stages_awake']].mean()
+            stage_means = stage_means.fillna(0)
+            avg_deep = float(stage_means['stages_deep'])
+            avg_light = float(stage_means['stages_light'])
+            avg_rem = float(stage_means['stages_rem'])
+            avg_awake = float(stage_means['stages_awake'])
+        elif 'stages' in self.sleep_data.columns:
             # 수면 단계 데이터가 중첩된 딕셔너리 형태인 경우
             stages_data = self.sleep_data['stages'].tolist()
             deep_values = [stage.get('deep', 0) for stage in stages_data if isinstance(stage, dict)]
@@ -119,6 +159,7 @@ class SleepAnalyzer:
             "average_awake_time_hours": round(avg_awake / 60, 2)
         }
     
+    @timed_stage("optimal")
     def get_optimal_sleep_time(self) -> Dict:
         """
         최적의 수면 시간 및 패턴 분석
@@ -146,18 +187,17 @@ class SleepAnalyzer:
             
             # 좋은 날의 데이터가 충분한 경우
             if len(good_sleep) >= 3:
-                bedtimes = good_sleep['start_time'].dt.hour + good_sleep['start_time'].dt.minute / 60
-                waketimes = good_sleep['end_time'].dt.hour + good_sleep['end_time'].dt.minute / 60
+                all_bedtimes, all_waketimes = self._get_sleep_hours()
+                bedtimes = all_bedtimes.loc[good_sleep.index]
+                waketimes = all_waketimes.loc[good_sleep.index]
                 durations = good_sleep['duration']
             else:
                 # 충분하지 않은 경우 전체 데이터 사용
-                bedtimes = self.sleep_data['start_time'].dt.hour + self.sleep_data['start_time'].dt.minute / 60
-                waketimes = self.sleep_data['end_time'].dt.hour + self.sleep_data['end_time'].dt.minute / 60
+                bedtimes, waketimes = self._get_sleep_hours()
                 durations = self.sleep_data['duration']
         else:
             # 피드백 데이터가 없는 경우 전체 데이터 사용
-            bedtimes = self.sleep_data['start_time'].dt.hour + self.sleep_data['start_time'].dt.minute / 60
-            waketimes = self.sleep_data['end_time'].dt.hour + self.sleep_data['end_time'].dt.minute / 60
+            bedtimes, waketimes = self._get_sleep_hours()
             durations = self.sleep_data['duration']
         
         # 평균 취침 시간 및 기상 시간 계산
@@ -187,6 +227,7 @@ class SleepAnalyzer:
             "optimal_duration_hours": round(avg_duration / 60, 2)
         }
     
+    @timed_stage("trends")
     def analyze_sleep_trends(self, days: int = 30) -> Dict:
         """
         수면 트렌드 분석
@@ -204,8 +245,10 @@ class SleepAnalyzer:
                 "monthly_change": 0
             }
         
-        # 날짜별로 정렬
-        self.sleep_data = self.sleep_data.sort_values('start_time')
+        # 날짜별로 정렬 (load_data에서 이미 정렬된 경우 생략)
+        if not self.sleep_data['start_time'].is_monotonic_increasing:
+            self.sleep_data = self.sleep_data.sort_values('start_time')
+            self._sleep_hours = None
         
         # 최근 데이터만 필터링
         cutoff_date = datetime.now() - timedelta(days=days)
@@ -262,6 +305,7 @@ class SleepAnalyzer:
             "monthly_change_hours": round(monthly_change / 60, 2)
         }
     
+    @timed_stage("correlations")
     def analyze_correlations(self) -> Dict:
         """
         수면과 다른 지표 간의 상관관계 분석
@@ -347,6 +391,23 @@ class SleepAnalyzer:
         
         return correlations
     
+    def get_sections(self, sections: List[str], days: int = 30) -> Dict:
+        """
+        요청한 분석 섹션만 한 번에 계산 (로드된 데이터와 중간 계산 결과 공유)
+        
+        Args:
+            sections: 섹션 이름 목록 (summary, optimal_sleep, trends, correlations)
+            days: 추세 분석 기간 (일)
+            
+        Returns:
+            Dict: 섹션 이름 -> 분석 결과
+        """
+        results = {}
+        for section in sections:
+            method = getattr(self, self.SECTIONS[section])
+            results[section] = method(days=days) if section == "trends" else method()
+        return results
+    
     def get_comprehensive_analysis(self) -> Dict:
         """
         종합적인 수면 분석 결과 제공
@@ -355,15 +416,4 @@ class SleepAnalyzer:
             Dict: 종합 분석 결과
         """
         # 각 분석 결과 통합
-        summary = self.get_sleep_summary()
-        optimal = self.get_optimal_sleep_time()
-        trends = self.analyze_sleep_trends()
-        correlations = self.analyze_correlations()
-        
-        # 종합 분석 결과
-        return {
-            "summary": summary,
-            "optimal_sleep": optimal,
-            "trends": trends,
-            "correlations": correlations
-        }
+        return self.get_sections(list(self.SECTIONS))
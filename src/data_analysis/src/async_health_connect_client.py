@@ -0,0 +1,204 @@
+import asyncio
+import contextlib
+import json
+import os
+import time
+from datetime import datetime, timedelta
+from src.data_analysis.src import instrumentation
+from src.data_analysis.src.health_connect_client import HealthConnectClient
+from src.data_analysis.src.health_connect_schema import decode_records
+from src.data_analysis.src.rate_limiter import parse_retry_after
+from src.data_analysis.src.response_cache import window_ttl
+
+# aiohttp가 설치되어 있어야 실제 업스트림 요청 가능 (pip install aiohttp)
+try:
+    import aiohttp
+except ImportError:
+    aiohttp = None
+
+class AsyncHealthConnectClient:
+    """
+    비동기 Health Connect API 클라이언트
+    ASGI 모드에서 업스트림 요청을 기다리는 동안 이벤트 루프를 막지 않도록 aiohttp로 요청합니다.
+    세션 하나를 공유하며, 동시 요청 수는 세마포어로 제한합니다.
+    속도 제한기와 디스크 캐시는 동기 클라이언트(HealthConnectClient)와 같은 방식으로 사용합니다.
+    """
+
+    def __init__(self, base_url=None, api_key=None, use_sample_data=None, timeout=30,
+                 max_retries=3, max_concurrency=100, rate_limiter=None, cache=None, user_id=None,
+                 recent_ttl=5 * 60):
+        """
+        AsyncHealthConnectClient 초기화
+
+        Args:
+            base_url (str): Health Connect API 기본 URL (선택)
+            api_key (str): Health Connect API 키 (선택)
+            use_sample_data (bool): 실제 API 대신 샘플 데이터 사용 여부 (선택, 기본값은 HEALTH_CONNECT_USE_SAMPLE 환경 변수)
+            timeout (int): API 요청 타임아웃 (초)
+            max_retries (int): 429/5xx 응답 시 최대 재시도 횟수
+            max_concurrency (int): 최대 동시 업스트림 요청 수
+            rate_limiter (AdaptiveRateLimiter): 요청 속도 및 동시성 제어기 (선택)
+            cache (DiskResponseCache): 응답 디스크 캐시 (선택, 파일 입출력은 실행기에서 처리)
+            user_id (str): 캐시 키에 사용할 사용자 식별자 (선택, 기본값은 API 키)
+            recent_ttl (int): 오늘 날짜가 포함된 구간의 캐시 유효 시간 (초)
+        """
+        self.base_url = base_url or os.environ.get('HEALTH_CONNECT_URL', 'https://healthconnect-api.example.com')
+        self.api_key = api_key or os.environ.get('HEALTH_CONNECT_API_KEY', '')
+        if use_sample_data is None:
+            use_sample_data = os.environ.get('HEALTH_CONNECT_USE_SAMPLE', '1') != '0'
+        self.use_sample_data = use_sample_data
+        self.timeout = timeout
+        self.max_retries = max_retries
+        self.max_concurrency = max_concurrency
+        self.rate_limiter = rate_limiter
+        self.cache = cache
+        self.user_id = user_id or self.api_key
+        self.recent_ttl = recent_ttl
+        self.headers = {
+            'Content-Type': 'application/json',
+            'Authorization': f'Bearer {self.api_key}'
+        }
+        self.session = None
+        self.semaphore = None
+        # 샘플 데이터 생성은 동기 클라이언트 구현 재사용
+        self.sample_client = HealthConnectClient(use_sample_data=True) if use_sample_data else None
+
+        if not use_sample_data and aiohttp is None:
+            raise ImportError("비동기 Health Connect 요청에는 aiohttp가 필요합니다. (pip install aiohttp)")
+
+    async def _get_session(self):
+        """
+        공유 세션 생성 (이벤트 루프 안에서 처음 사용할 때)
+        """
+        if self.session is None:
+            self.session = aiohttp.ClientSession(
+                headers=self.headers,
+                timeout=aiohttp.ClientTimeout(total=self.timeout),
+                connector=aiohttp.TCPConnector(limit=self.max_concurrency)
+            )
+            self.semaphore = asyncio.Semaphore(self.max_concurrency)
+        return self.session
+
+    async def close(self):
+        """
+        공유 세션 종료
+        """
+        if self.session is not None:
+            await self.session.close()
+            self.session = None
+
+    async def fetch_records(self, record_type, start_date=None, end_date=None):
+        """
+        레코드 가져오기
+
+        Args:
+            record_type (str): 레코드 유형 (sleep, activity, stress)
+            start_date (str): 시작 날짜 (YYYY-MM-DD, 기본값: 30일 전)
+            end_date (str): 종료 날짜 (YYYY-MM-DD, 기본값: 오늘)
+
+        Returns:
+            list: 레코드 목록
+        """
+        if not start_date:
+            start_date = (datetime.now() - timedelta(days=30)).strftime('%Y-%m-%d')
+        if not end_date:
+            end_date = datetime.now().strftime('%Y-%m-%d')
+
+        if self.use_sample_data:
+            sample = {
+                'sleep': self.sample_client._get_sample_sleep_data,
+                'activity': self.sample_client._get_sample_activity_data,
+                'stress': self.sample_client._get_sample_stress_data
+            }[record_type]
+            return sample(start_date, end_date)
+
+        loop = asyncio.get_running_loop()
+        if self.cache:
+            payload = await loop.run_in_executor(None, self.cache.get, self.user_id, record_type, start_date, end_date)
+            if payload is not None:
+                instrumentation.count("health_connect_cache_hits", record_type=record_type)
+                return json.loads(payload)
+
+        url = f"{self.base_url}/{record_type}"
+        params = {
+            'start_date': start_date,
+            'end_date': end_date
+        }
+        with instrumentation.timed("health_connect_fetch", record_type=record_type):
+            payload = await self._get(url, params)
+        records = json.loads(payload)
+
+        if self.cache:
+            await loop.run_in_executor(None, self._cache_records, record_type, start_date, end_date, records, payload)
+        return records
+
+    def _cache_records(self, record_type, start_date, end_date, records, payload):
+        """
+        스키마 검증을 통과한 응답만 캐시에 저장 (실행기에서 호출)
+        """
+        decode_records(records, record_type)
+        self.cache.set(self.user_id, record_type, start_date, end_date, payload, ttl=window_ttl(end_date, self.recent_ttl))
+
+    def _limiter_slot(self):
+        """
+        속도 제한기의 비동기 슬롯 (속도 제한기가 없으면 아무것도 하지 않음)
+        """
+        if self.rate_limiter is None:
+            return contextlib.nullcontext()
+        return self.rate_limiter.async_slot()
+
+    async def _get(self, url, params):
+        """
+        재시도를 적용한 비동기 GET 요청
+
+        429/503 응답은 Retry-After만큼, 5xx 및 네트워크 오류는 지수 백오프만큼
+        대기한 뒤 재시도합니다. 대기 중에는 동시 요청 슬롯을 반납합니다.
+        rate_limiter가 있으면 응답 결과를 전달해 요청 속도와 동시성을 조절합니다
+        (스로틀링 대기는 속도 제한기가 담당).
+
+        Args:
+            url (str): 요청 URL
+            params (dict): 쿼리 파라미터
+
+        Returns:
+            bytes: 응답 본문
+        """
+        session = await self._get_session()
+        limiter = self.rate_limiter
+
+        for attempt in range(self.max_retries + 1):
+            last_attempt = attempt == self.max_retries
+            try:
+                async with self.semaphore, self._limiter_slot():
+                    started = time.monotonic()
+                    async with session.get(url, params=params) as response:
+                        status = response.status
+                        retry_after = parse_retry_after(response.headers.get('Retry-After'))
+                        if status < 400:
+                            payload = await response.read()
+                            if limiter:
+                                limiter.record_success(time.monotonic() - started)
+                            return payload
+                        if limiter and status in (429, 503):
+                            limiter.record_throttle(retry_after)
+                        elif limiter and status >= 500:
+                            limiter.record_error()
+                        if last_attempt or (status < 500 and status != 429):
+                            response.raise_for_status()
+            except (aiohttp.ClientConnectionError, asyncio.TimeoutError):
+                if limiter:
+                    limiter.record_error()
+                if last_attempt:
+                    raise
+                instrumentation.count("health_connect_retries", reason="network")
+                await asyncio.sleep(min(30, 2 ** attempt))
+                continue
+
+            # 스로틀링 응답: Retry-After 동안 대기 후 재시도
+            if status in (429, 503):
+                instrumentation.count("health_connect_retries", reason="throttled")
+                if not limiter:
+                    await asyncio.sleep(retry_after if retry_after is not None else min(30, 2 ** attempt))
+            else:
+                instrumentation.count("health_connect_retries", reason="server_error")
+                await asyncio.sleep(min(30, 2 ** attempt))
@@ -1,8 +1,33 @@
 import os
 import sys
 import json
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
+import numpy as np
 import requests
+from src.data_analysis.src import instrumentation
+from src.data_analysis.src.health_connect_schema import decode_records
+from src.data_analysis.src.rate_limiter import parse_retry_after
+from src.data_analysis.src.response_cache import window_ttl
+
+class BackfillError(Exception):
+    """
+    backfill에서 재시도 후에도 실패한 날짜 구간이 있을 때 발생하는 예외
+    
+    Attributes:
+        record_type (str): 레코드 유형
+        failed_windows (list): (시작 날짜, 종료 날짜, 예외) 목록 - 이 구간만 다시 요청하면 됨
+        partial (list 또는 dict): 성공한 구간만 병합한 결과
+    """
+    
+    def __init__(self, record_type, failed_windows, partial):
+        self.record_type = record_type
+        self.failed_windows = failed_windows
+        self.partial = partial
+        ranges = ", ".join(f"{start}~{end}" for start, end, _ in failed_windows)
+        super().__init__(f"{record_type} 데이터 {len(failed_windows)}개 구간을 가져오지 못했습니다: {ranges}")
 
 class HealthConnectClient:
     """
@@ -10,125 +35,137 @@ class HealthConnectClient:
     실제 Health Connect API와 통신하여 수면, 활동, 스트레스 데이터를 가져옵니다.
     """
     
-    def __init__(self, base_url=None, api_key=None):
+    def __init__(self, base_url=None, api_key=None, use_sample_data=None, timeout=30,
+                 rate_limiter=None, max_retries=3, cache=None, user_id=None, recent_ttl=5 * 60):
         """
         HealthConnectClient 초기화
         
         Args:
             base_url (str): Health Connect API 기본 URL (선택)
             api_key (str): Health Connect API 키 (선택)
+            use_sample_data (bool): 실제 API 대신 샘플 데이터 사용 여부 (선택, 기본값은 HEALTH_CONNECT_USE_SAMPLE 환경 변수)
+            timeout (int): API 요청 타임아웃 (초)
+            rate_limiter (AdaptiveRateLimiter): 요청 속도 및 동시성 제어기 (선택)
+            max_retries (int): 429/5xx 응답 시 최대 재시도 횟수
+            cache (DiskResponseCache): 응답 디스크 캐시 (선택)
+            user_id (str): 캐시 키에 사용할 사용자 식별자 (선택, 기본값은 API 키)
+            recent_ttl (int): 오늘 날짜가 포함된 구간의 캐시 유효 시간 (초)
         """
         self.base_url = base_url or os.environ.get('HEALTH_CONNECT_URL', 'https://healthconnect-api.example.com')
         self.api_key = api_key or os.environ.get('HEALTH_CONNECT_API_KEY', '')
+        if use_sample_data is None:
+            use_sample_data = os.environ.get('HEALTH_CONNECT_USE_SAMPLE', '1') != '0'
+        self.use_sample_data = use_sample_data
+        self.timeout = timeout
+        self.rate_limiter = rate_limiter
+        self.max_retries = max_retries
+        self.cache = cache
+        self.user_id = user_id or self.api_key
+        self.recent_ttl = recent_ttl
+        # requests.Session은 스레드 안전하지 않으므로 backfill 작업 스레드마다 따로 사용
+        self._local = threading.local()
         self.headers = {
             'Content-Type': 'application/json',
             'Authorization': f'Bearer {self.api_key}'
         }
     
-    def get_sleep_data(self, start_date=None, end_date=None):
+    @property
+    def session(self):
+        """
+        현재 스레드의 requests.Session (처음 사용할 때 생성)
+        """
+        session = getattr(self._local, 'session', None)
+        if session is None:
+            session = self._local.session = requests.Session()
+        return session
+    
+    def fetch_records(self, record_type, start_date=None, end_date=None, columnar=False):
         """
-        수면 데이터 가져오기
+        레코드 가져오기 (get_*_data와 달리 업스트림 오류를 그대로 발생)
         
         Args:
-            start_date (str): 시작 날짜 (YYYY-MM-DD)
-            end_date (str): 종료 날짜 (YYYY-MM-DD)
+            record_type (str): 레코드 유형 (sleep, activity, stress)
+            start_date (str): 시작 날짜 (YYYY-MM-DD, 기본값: 30일 전)
+            end_date (str): 종료 날짜 (YYYY-MM-DD, 기본값: 오늘)
+            columnar (bool): 컬럼형 배열(dict)로 반환할지 여부
             
         Returns:
-            list: 수면 데이터 목록
+            list: 레코드 목록 (columnar=True인 경우 컬럼 이름 -> 배열 dict)
         """
-        try:
-            # 날짜 범위 설정
-            if not start_date:
-                start_date = (datetime.now() - timedelta(days=30)).strftime('%Y-%m-%d')
-            if not end_date:
-                end_date = datetime.now().strftime('%Y-%m-%d')
-            
+        # 날짜 범위 설정
+        if not start_date:
+            start_date = (datetime.now() - timedelta(days=30)).strftime('%Y-%m-%d')
+        if not end_date:
+            end_date = datetime.now().strftime('%Y-%m-%d')
+        
+        if not self.use_sample_data:
             # API 요청 URL 및 파라미터
-            url = f"{self.base_url}/sleep"
+            url = f"{self.base_url}/{record_type}"
             params = {
                 'start_date': start_date,
                 'end_date': end_date
             }
+            return self._request_records(url, params, record_type, columnar)
+        
+        # 샘플 데이터 반환
+        sample = {
+            'sleep': self._get_sample_sleep_data,
+            'activity': self._get_sample_activity_data,
+            'stress': self._get_sample_stress_data
+        }[record_type]
+        sample_data = sample(start_date, end_date)
+        return decode_records(sample_data, record_type) if columnar else sample_data
+    
+    def get_sleep_data(self, start_date=None, end_date=None, columnar=False):
+        """
+        수면 데이터 가져오기 (오류 시 빈 목록)
+        
+        Args:
+            start_date (str): 시작 날짜 (YYYY-MM-DD)
+            end_date (str): 종료 날짜 (YYYY-MM-DD)
+            columnar (bool): 컬럼형 배열(dict)로 반환할지 여부
             
-            # 실제 구현에서는 API 요청
-            # response = requests.get(url, headers=self.headers, params=params)
-            # response.raise_for_status()
-            # return response.json()
-            
-            # 현재는 샘플 데이터 반환
-            return self._get_sample_sleep_data(start_date, end_date)
+        Returns:
+            list: 수면 데이터 목록 (columnar=True인 경우 컬럼 이름 -> 배열 dict)
+        """
+        try:
+            return self.fetch_records('sleep', start_date, end_date, columnar)
         except Exception as e:
             print(f"수면 데이터 가져오기 오류: {e}")
             return []
     
-    def get_activity_data(self, start_date=None, end_date=None):
+    def get_activity_data(self, start_date=None, end_date=None, columnar=False):
         """
-        활동 데이터 가져오기
+        활동 데이터 가져오기 (오류 시 빈 목록)
         
         Args:
             start_date (str): 시작 날짜 (YYYY-MM-DD)
             end_date (str): 종료 날짜 (YYYY-MM-DD)
+            columnar (bool): 컬럼형 배열(dict)로 반환할지 여부
             
         Returns:
-            list: 활동 데이터 목록
+            list: 활동 데이터 목록 (columnar=True인 경우 컬럼 이름 -> 배열 dict)
         """
         try:
-            # 날짜 범위 설정
-            if not start_date:
-                start_date = (datetime.now() - timedelta(days=30)).strftime('%Y-%m-%d')
-            if not end_date:
-                end_date = datetime.now().strftime('%Y-%m-%d')
-            
-            # API 요청 URL 및 파라미터
-            url = f"{self.base_url}/activity"
-            params = {
-                'start_date': start_date,
-                'end_date': end_date
-            }
-            
-            # 실제 구현에서는 API 요청
-            # response = requests.get(url, headers=self.headers, params=params)
-            # response.raise_for_status()
-            # return response.json()
-            
-            # 현재는 샘플 데이터 반환
-            return self._get_sample_activity_data(start_date, end_date)
+            return self.fetch_records('activity', start_date, end_date, columnar)
         except Exception as e:
             print(f"활동 데이터 가져오기 오류: {e}")
             return []
     
-    def get_stress_data(self, start_date=None, end_date=None):
+    def get_stress_data(self, start_date=None, end_date=None, columnar=False):
         """
-        스트레스 데이터 가져오기
+        스트레스 데이터 가져오기 (오류 시 빈 목록)
         
         Args:
             start_date (str): 시작 날짜 (YYYY-MM-DD)
             end_date (str): 종료 날짜 (YYYY-MM-DD)
+            columnar (bool): 컬럼형 배열(dict)로 반환할지 여부
             
         Returns:
-            list: 스트레스 데이터 목록
+            list: 스트레스 데이터 목록 (columnar=True인 경우 컬럼 이름 -> 배열 dict)
         """
         try:
-            # 날짜 범위 설정
-            if not start_date:
-                start_date = (datetime.now() - timedelta(days=30)).strftime('%Y-%m-%d')
-            if not end_date:
-                end_date = datetime.now().strftime('%Y-%m-%d')
-            
-            # API 요청 URL 및 파라미터
-            url = f"{self.base_url}/stress"
-            params = {
-                'start_date': start_date,
-                'end_date': end_date
-            }
-            
-            # 실제 구현에서는 API 요청
-            # response = requests.get(url, headers=self.headers, params=params)
-            # response.raise_for_status()
-            # return response.json()
-            
-            # 현재는 샘플 데이터 반환
-            return self._get_sample_stress_data(start_date, end_date)
+            return self.fetch_records('stress', start_date, end_date, columnar)
         except Exception as e:
             print(f"스트레스 데이터 가져오기 오류: {e}")
             return []
@@ -171,6 +208,168 @@ class HealthConnectClient:
                 "last_sync": datetime.now().isoformat()
             }
     
+    def _request_records(self, url, params, record_type, columnar=False):
+        """
+        Health Connect API 요청 및 응답 디코딩 (디스크 캐시가 있으면 캐시 우선)
+        
+        Args:
+            url (str): 요청 URL
+            params (dict): 쿼리 파라미터 (start_date, end_date)
+            record_type (str): 레코드 유형 (sleep, activity, stress, 캐시 키의 엔드포인트)
+            columnar (bool): 응답 바이트를 컬럼형 배열로 직접 디코딩할지 여부
+            
+        Returns:
+            list 또는 dict: 레코드 목록 또는 컬럼형 배열
+        """
+        start_date = params.get('start_date')
+        end_date = params.get('end_date')
+        
+        payload = None
+        if self.cache:
+            payload = self.cache.get(self.user_id, record_type, start_date, end_date)
+            if payload is not None:
+                instrumentation.count("health_connect_cache_hits", record_type=record_type)
+        cached = payload is not None
+        
+        if not cached:
+            with instrumentation.timed("health_connect_fetch", record_type=record_type):
+                payload = self._get(url, params).content
+        
+        # 컬럼형 요청은 응답 바이트를 중간 DataFrame 없이 바로 배열로 디코딩
+        result = decode_records(payload, record_type) if columnar else json.loads(payload)
+        
+        if self.cache and not cached:
+            # 스키마 검증을 통과한 응답만 캐시 (잘못된 응답이 유효 시간 동안 재사용되지 않도록)
+            if not columnar:
+                decode_records(result, record_type)
+            self.cache.set(self.user_id, record_type, start_date, end_date, payload, ttl=window_ttl(end_date, self.recent_ttl))
+        return result
+    
+    def _get(self, url, params):
+        """
+        속도 제한 및 재시도를 적용한 GET 요청
+        
+        429/503 응답은 Retry-After만큼 대기한 뒤, 5xx 및 네트워크 오류는
+        지수 백오프 후 재시도합니다. rate_limiter가 있으면 응답 결과를 전달해
+        요청 속도와 동시성을 조절합니다.
+        
+        Args:
+            url (str): 요청 URL
+            params (dict): 쿼리 파라미터
+            
+        Returns:
+            requests.Response: 성공한 응답
+        """
+        limiter = self.rate_limiter
+        
+        for attempt in range(self.max_retries + 1):
+            last_attempt = attempt == self.max_retries
+            try:
+                if limiter:
+                    with limiter.slot():
+                        started = time.monotonic()
+                        response = self.session.get(url, headers=self.headers, params=params, timeout=self.timeout)
+                else:
+                    started = time.monotonic()
+                    response = self.session.get(url, headers=self.headers, params=params, timeout=self.timeout)
+                latency = time.monotonic() - started
+            except requests.RequestException:
+                if limiter:
+                    limiter.record_error()
+                if last_attempt:
+                    raise
+                instrumentation.count("health_connect_retries", reason="network")
+                time.sleep(min(30, 2 ** attempt))
+                continue
+            
+            # 스로틀링 응답: Retry-After 동안 대기 후 재시도
+            if response.status_code in (429, 503):
+                retry_after = parse_retry_after(response.headers.get('Retry-After'))
+                if limiter:
+                    limiter.record_throttle(retry_after)
+                if last_attempt:
+                    response.raise_for_status()
+                instrumentation.count("health_connect_retries", reason="throttled")
+                if not limiter:
+                    time.sleep(retry_after if retry_after is not None else min(30, 2 ** attempt))
+                continue
+            
+            # 서버 오류: 백오프 후 재시도
+            if response.status_code >= 500:
+                if limiter:
+                    limiter.record_error()
+                if last_attempt:
+                    response.raise_for_status()
+                instrumentation.count("health_connect_retries", reason="server_error")
+                time.sleep(min(30, 2 ** attempt))
+                continue
+            
+            response.raise_for_status()
+            if limiter:
+                limiter.record_success(latency)
+            return response
+    
+    def backfill(self, record_type, start_date, end_date, window_days=30, max_workers=None, columnar=True):
+        """
+        긴 기간의 데이터를 날짜 구간으로 나누어 병렬로 가져오기
+        
+        동시 요청 수는 rate_limiter가 업스트림 상태에 맞춰 조절하므로
+        max_workers는 상한으로만 사용됩니다. 재시도 후에도 실패한 구간이 있으면
+        나머지 구간을 모두 가져온 뒤 BackfillError를 발생시킵니다.
+        
+        Args:
+            record_type (str): 레코드 유형 (sleep, activity, stress)
+            start_date (str): 시작 날짜 (YYYY-MM-DD)
+            end_date (str): 종료 날짜 (YYYY-MM-DD)
+            window_days (int): 요청 하나가 담당할 날짜 구간 길이 (일)
+            max_workers (int): 최대 작업 스레드 수 (기본값: rate_limiter의 최대 동시성 또는 4)
+            columnar (bool): 컬럼형 배열로 병합할지 여부
+            
+        Returns:
+            list 또는 dict: 날짜순으로 병합된 레코드 목록 또는 컬럼형 배열
+            
+        Raises:
+            BackfillError: 실패한 구간 목록과 성공한 구간만 병합한 결과
+            ValueError: window_days가 1보다 작은 경우
+        """
+        if window_days < 1:
+            raise ValueError(f"window_days는 1 이상이어야 합니다: {window_days}")
+        
+        # 날짜 구간 분할
+        start = datetime.strptime(start_date, '%Y-%m-%d')
+        end = datetime.strptime(end_date, '%Y-%m-%d')
+        windows = []
+        while start <= end:
+            window_end = min(end, start + timedelta(days=window_days - 1))
+            windows.append((start.strftime('%Y-%m-%d'), window_end.strftime('%Y-%m-%d')))
+            start = window_end + timedelta(days=1)
+        
+        if max_workers is None:
+            max_workers = self.rate_limiter.max_concurrency if self.rate_limiter else 4
+        
+        def fetch(window):
+            try:
+                return self.fetch_records(record_type, window[0], window[1], columnar=columnar), None
+            except Exception as e:
+                return None, e
+        
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            outcomes = list(executor.map(fetch, windows))
+        
+        results = [result for result, error in outcomes if error is None]
+        if not columnar:
+            merged = [record for result in results for record in result]
+        elif results:
+            # 구간별 컬럼 배열 병합
+            merged = {column: np.concatenate([result[column] for result in results]) for column in results[0]}
+        else:
+            merged = decode_records([], record_type)
+        
+        failed = [(window[0], window[1], error) for window, (_, error) in zip(windows, outcomes) if error is not None]
+        if failed:
+            raise BackfillError(record_type, failed, merged)
+        return merged
+    
     def _get_sample_sleep_data(self, start_date, end_date):
         """
         샘플 수면 데이터 생성
@@ -12,8 +12,11 @@ class HealthConnectInterface:
     def __init__(self):
         """
         HealthConnectInterface 초기화
+        
+        분석기는 호출마다 새로 만들어 요청 스레드와 백그라운드 작업이
+        같은 인터페이스를 동시에 사용해도 데이터가 섞이지 않도록 합니다.
         """
-        self.analyzer = SleepAnalyzer()
+        self.analyzer_class = SleepAnalyzer
     
     def process_data(self, sleep_data, activity_data=None, stress_data=None, feedback_data=None):
         """
@@ -29,7 +32,8 @@ class HealthConnectInterface:
             Dict: 분석 결과
         """
         # 데이터 로드
-        self.analyzer.load_data(
+        analyzer = self.analyzer_class()
+        analyzer.load_data(
             sleep_data=sleep_data,
             activity_data=activity_data,
             stress_data=stress_data,
@@ -37,7 +41,7 @@ class HealthConnectInterface:
         )
         
         # 종합 분석 실행
-        return self.analyzer.get_comprehensive_analysis()
+        return analyzer.get_comprehensive_analysis()
     
     def get_sleep_summary(self, sleep_data):
         """
@@ -49,8 +53,9 @@ class HealthConnectInterface:
         Returns:
             Dict: 수면 요약 정보
         """
-        self.analyzer.load_data(sleep_data=sleep_data)
-        return self.analyzer.get_sleep_summary()
+        analyzer = self.analyzer_class()
+        analyzer.load_data(sleep_data=sleep_data)
+        return analyzer.get_sleep_summary()
     
     def get_optimal_sleep_time(self, sleep_data, feedback_data=None):
         """
@@ -63,8 +68,9 @@ class HealthConnectInterface:
         Returns:
             Dict: 최적 수면 시간 정보
         """
-        self.analyzer.load_data(sleep_data=sleep_data, feedback_data=feedback_data)
-        return self.analyzer.get_optimal_sleep_time()
+        analyzer = self.analyzer_class()
+        analyzer.load_data(sleep_data=sleep_data, feedback_data=feedback_data)
+        return analyzer.get_optimal_sleep_time()
     
     def analyze_sleep_trends(self, sleep_data, days=30):
         """
@@ -77,8 +83,9 @@ class HealthConnectInterface:
         Returns:
             Dict: 수면 트렌드 분석 결과
         """
-        self.analyzer.load_data(sleep_data=sleep_data)
-        return self.analyzer.analyze_sleep_trends(days=days)
+        analyzer = self.analyzer_class()
+        analyzer.load_data(sleep_data=sleep_data)
+        return analyzer.analyze_sleep_trends(days=days)
     
     def analyze_correlations(self, sleep_data, activity_data=None, stress_data=None):
         """
@@ -92,12 +99,37 @@ class HealthConnectInterface:
         Returns:
             Dict: 상관관계 분석 결과
         """
-        self.analyzer.load_data(
+        analyzer = self.analyzer_class()
+        analyzer.load_data(
             sleep_data=sleep_data,
             activity_data=activity_data,
             stress_data=stress_data
         )
-        return self.analyzer.analyze_correlations()
+        return analyzer.analyze_correlations()
+
+    def analyze_sections(self, sections, sleep_data, activity_data=None, stress_data=None, feedback_data=None, days=30):
+        """
+        여러 분석 섹션을 데이터 한 번 로드로 계산
+        
+        Args:
+            sections: 섹션 이름 목록 (summary, optimal_sleep, trends, correlations)
+            sleep_data: 수면 데이터
+            activity_data: 활동 데이터 (선택)
+            stress_data: 스트레스 데이터 (선택)
+            feedback_data: 사용자 피드백 데이터 (선택)
+            days: 추세 분석 기간 (일)
+            
+        Returns:
+            Dict: 섹션 이름 -> 분석 결과
+        """
+        analyzer = self.analyzer_class()
+        analyzer.load_data(
+            sleep_data=sleep_data,
+            activity_data=activity_data,
+            stress_data=stress_data,
+            feedback_data=feedback_data
+        )
+        return analyzer.get_sections(sections, days=days)
 
 # 테스트 코드
 if __name__ == "__main__":
@@ -0,0 +1,303 @@
+import json
+from collections import namedtuple
+from collections.abc import Mapping
+from datetime import datetime, date
+import numpy as np
+
+class RecordValidationError(ValueError):
+    """
+    Health Connect 레코드 검증 오류
+    실패한 레코드 유형, 레코드 위치(index), 필드 이름을 함께 보관합니다.
+    """
+
+    def __init__(self, record_type, index, field, message):
+        """
+        RecordValidationError 초기화
+
+        Args:
+            record_type (str): 레코드 유형 (sleep, activity, stress, feedback)
+            index (int): 페이로드 내 레코드 위치 (없으면 None)
+            field (str): 오류가 발생한 필드 경로 (없으면 None)
+            message (str): 오류 설명
+        """
+        self.record_type = record_type
+        self.index = index
+        self.field = field
+        self.message = message
+
+        location = record_type
+        if index is not None:
+            location += f"[{index}]"
+        if field:
+            location += f".{field}"
+        super().__init__(f"{location}: {message}")
+
+# 필드 정의
+# column: 디코딩 결과 컬럼 이름, path: 원본 JSON 경로, kind: 값 타입,
+# required: 필수 여부, bounds: 허용 범위 (최소, 최대)
+FieldSpec = namedtuple('FieldSpec', ['column', 'path', 'kind', 'required', 'bounds'], defaults=(True, None))
+
+# 레코드 유형별 스키마 - 중첩된 stages는 stages_<단계> 컬럼으로 평탄화
+SCHEMAS = {
+    "sleep": (
+        FieldSpec("id", ("id",), "str"),
+        FieldSpec("start_time", ("start_time",), "datetime"),
+        FieldSpec("end_time", ("end_time",), "datetime"),
+        FieldSpec("duration", ("duration",), "int", bounds=(0, 24 * 60)),
+        FieldSpec("efficiency", ("efficiency",), "float", required=False, bounds=(0, 100)),
+        FieldSpec("stages_deep", ("stages", "deep"), "float", required=False, bounds=(0, 24 * 60)),
+        FieldSpec("stages_light", ("stages", "light"), "float", required=False, bounds=(0, 24 * 60)),
+        FieldSpec("stages_rem", ("stages", "rem"), "float", required=False, bounds=(0, 24 * 60)),
+        FieldSpec("stages_awake", ("stages", "awake"), "float", required=False, bounds=(0, 24 * 60))
+    ),
+    "activity": (
+        FieldSpec("id", ("id",), "str", required=False),
+        FieldSpec("date", ("date",), "date"),
+        FieldSpec("steps", ("steps",), "int", bounds=(0, None)),
+        FieldSpec("active_minutes", ("active_minutes",), "int", bounds=(0, 24 * 60)),
+        FieldSpec("calories", ("calories",), "float", required=False, bounds=(0, None))
+    ),
+    "stress": (
+        FieldSpec("id", ("id",), "str", required=False),
+        FieldSpec("date", ("date",), "date"),
+        FieldSpec("average_score", ("average_score",), "float", bounds=(0, 100)),
+        FieldSpec("max_score", ("max_score",), "float", required=False, bounds=(0, 100)),
+        FieldSpec("min_score", ("min_score",), "float", required=False, bounds=(0, 100))
+    ),
+    "feedback": (
+        FieldSpec("date", ("date",), "date"),
+        FieldSpec("sleep_satisfaction", ("sleep_satisfaction",), "int", bounds=(1, 5)),
+        FieldSpec("morning_condition", ("morning_condition",), "int", bounds=(1, 5)),
+        FieldSpec("notes", ("notes",), "str", required=False)
+    )
+}
+
+# 값 타입별 NumPy dtype
+_DTYPES = {
+    "str": object,
+    "int": np.int64,
+    "float": np.float64,
+    "datetime": "datetime64[s]",
+    "date": "datetime64[D]"
+}
+
+def get_schema(record_type):
+    """
+    레코드 유형의 스키마 조회
+
+    Args:
+        record_type (str): 레코드 유형
+
+    Returns:
+        tuple: FieldSpec 목록
+    """
+    schema = SCHEMAS.get(record_type)
+    if schema is None:
+        raise RecordValidationError(record_type, None, None, "알 수 없는 레코드 유형입니다.")
+    return schema
+
+def _convert(value, spec, record_type, index):
+    """
+    단일 필드 값을 스키마 타입으로 변환 및 검증
+
+    Args:
+        value: 원본 값
+        spec (FieldSpec): 필드 정의
+        record_type (str): 레코드 유형
+        index (int): 레코드 위치
+
+    Returns:
+        변환된 값
+    """
+    field = ".".join(spec.path)
+    kind = spec.kind
+
+    # bool은 int의 하위 타입이므로 숫자 필드에서 명시적으로 거부
+    if kind == "int":
+        if isinstance(value, bool) or not isinstance(value, (int, float)):
+            raise RecordValidationError(record_type, index, field, f"정수가 필요하지만 {type(value).__name__} 값이 입력되었습니다.")
+        if isinstance(value, float) and not value.is_integer():
+            raise RecordValidationError(record_type, index, field, f"정수가 필요하지만 {value!r} 값이 입력되었습니다.")
+        value = int(value)
+    elif kind == "float":
+        if isinstance(value, bool) or not isinstance(value, (int, float)):
+            raise RecordValidationError(record_type, index, field, f"숫자가 필요하지만 {type(value).__name__} 값이 입력되었습니다.")
+        value = float(value)
+        if value != value:
+            raise RecordValidationError(record_type, index, field, "NaN 값은 허용되지 않습니다.")
+    elif kind == "str":
+        if not isinstance(value, str):
+            raise RecordValidationError(record_type, index, field, f"문자열이 필요하지만 {type(value).__name__} 값이 입력되었습니다.")
+        return value
+    elif kind == "datetime":
+        if not isinstance(value, str):
+            raise RecordValidationError(record_type, index, field, "ISO 8601 날짜/시간 문자열이 필요합니다.")
+        try:
+            parsed = datetime.fromisoformat(value)
+        except ValueError:
+            raise RecordValidationError(record_type, index, field, f"잘못된 날짜/시간 형식입니다: {value!r}")
+        # 취침/기상 시각 분석은 기기 기준 벽시계 시간을 사용하므로 시간대 정보만 제거
+        return parsed.replace(tzinfo=None)
+    elif kind == "date":
+        if not isinstance(value, str):
+            raise RecordValidationError(record_type, index, field, "YYYY-MM-DD 형식의 날짜 문자열이 필요합니다.")
+        try:
+            return date.fromisoformat(value[:10])
+        except ValueError:
+            raise RecordValidationError(record_type, index, field, f"잘못된 날짜 형식입니다: {value!r}")
+
+    # 숫자 범위 검증
+    if spec.bounds:
+        low, high = spec.bounds
+        if (low is not None and value < low) or (high is not None and value > high):
+            raise RecordValidationError(record_type, index, field, f"허용 범위({low}~{high})를 벗어난 값입니다: {value}")
+
+    return value
+
+def _lookup(record, path):
+    """
+    중첩 경로의 값 조회 (없으면 None)
+    """
+    value = record
+    for key in path:
+        if not isinstance(value, Mapping):
+            return None
+        value = value.get(key)
+    return value
+
+def validate_record(record, record_type, index=None):
+    """
+    단일 레코드 검증 및 평탄화
+
+    Args:
+        record (dict): 원본 레코드
+        record_type (str): 레코드 유형
+        index (int): 레코드 위치 (오류 메시지용, 선택)
+
+    Returns:
+        tuple: 스키마 컬럼 순서의 변환된 값 (누락된 선택 필드는 None)
+    """
+    schema = get_schema(record_type)
+    if not isinstance(record, Mapping):
+        raise RecordValidationError(record_type, index, None, f"객체가 필요하지만 {type(record).__name__} 값이 입력되었습니다.")
+
+    # stages가 존재하면 객체여야 함
+    if record_type == "sleep" and record.get("stages") is not None and not isinstance(record["stages"], Mapping):
+        raise RecordValidationError(record_type, index, "stages", "수면 단계 정보는 객체여야 합니다.")
+
+    values = []
+    for spec in schema:
+        value = _lookup(record, spec.path)
+        if value is None:
+            if spec.required:
+                raise RecordValidationError(record_type, index, ".".join(spec.path), "필수 필드가 누락되었습니다.")
+            values.append(None)
+        else:
+            values.append(_convert(value, spec, record_type, index))
+    return tuple(values)
+
+def _unwrap(payload, record_type):
+    """
+    페이로드를 레코드 리스트로 변환 (bytes/str은 JSON 디코딩, {"data": [...]} 응답 형식 지원)
+    """
+    if isinstance(payload, (bytes, bytearray, memoryview, str)):
+        try:
+            payload = json.loads(bytes(payload) if isinstance(payload, memoryview) else payload)
+        except ValueError as e:
+            raise RecordValidationError(record_type, None, None, f"JSON 디코딩 실패: {e}")
+
+    if isinstance(payload, Mapping) and "data" in payload:
+        payload = payload["data"]
+
+    if not isinstance(payload, list):
+        raise RecordValidationError(record_type, None, None, "레코드 배열이 필요합니다.")
+    return payload
+
+def decode_records(payload, record_type):
+    """
+    Health Connect 응답을 스키마에 맞는 컬럼형 배열로 디코딩
+
+    레코드별 딕셔너리 리스트와 DataFrame 변환을 거치지 않고, 한 번의 순회로
+    타입이 지정된 NumPy 배열을 채웁니다. 잘못된 레코드는 위치와 필드를 포함한
+    RecordValidationError로 거부됩니다.
+
+    Args:
+        payload: 응답 본문 (bytes/str) 또는 이미 디코딩된 레코드 리스트
+        record_type (str): 레코드 유형 (sleep, activity, stress, feedback)
+
+    Returns:
+        dict: 컬럼 이름 -> NumPy 배열
+    """
+    schema = get_schema(record_type)
+    records = _unwrap(payload, record_type)
+    count = len(records)
+
+    # 컬럼 배열 미리 할당 (선택 숫자 필드는 NaN, 문자열 필드는 None으로 채움)
+    columns = {}
+    for spec in schema:
+        dtype = _DTYPES[spec.kind]
+        if spec.kind == "float":
+            columns[spec.column] = np.full(count, np.nan, dtype=dtype)
+        elif spec.kind == "str":
+            columns[spec.column] = np.full(count, None, dtype=dtype)
+        else:
+            columns[spec.column] = np.empty(count, dtype=dtype)
+
+    targets = [columns[spec.column] for spec in schema]
+    for index, record in enumerate(records):
+        values = validate_record(record, record_type, index)
+        for target, value in zip(targets, values):
+            if value is not None:
+                target[index] = value
+
+    return columns
+
+def to_record(values, record_type):
+    """
+    스키마 컬럼 순서의 값을 원본 JSON 형태의 레코드로 복원 (stages 등 중첩 구조 재구성)
+
+    Args:
+        values: 스키마 컬럼 순서의 값 시퀀스
+        record_type (str): 레코드 유형
+
+    Returns:
+        dict: 레코드
+    """
+    record = {}
+    for spec, value in zip(get_schema(record_type), values):
+        if value is None:
+            continue
+        target = record
+        for key in spec.path[:-1]:
+            target = target.setdefault(key, {})
+        target[spec.path[-1]] = value
+    return record
+
+def record_from_columns(row, record_type, index=None):
+    """
+    평탄화된 컬럼 이름 -> 문자열 값 형태의 행(CSV 등)을 원본 레코드 형태로 변환
+
+    숫자 필드의 문자열은 숫자로 변환하고 빈 문자열은 누락으로 처리합니다.
+    결과는 validate_record로 검증해야 합니다.
+
+    Args:
+        row (dict): 컬럼 이름 -> 문자열 값
+        record_type (str): 레코드 유형
+        index (int): 행 위치 (오류 메시지용, 선택)
+
+    Returns:
+        dict: 레코드
+    """
+    values = []
+    for spec in get_schema(record_type):
+        value = row.get(spec.column)
+        if value is None or value == "":
+            values.append(None)
+            continue
+        if spec.kind in ("int", "float"):
+            try:
+                value = float(value) if spec.kind == "float" or "." in value else int(value)
+            except ValueError:
+                raise RecordValidationError(record_type, index, ".".join(spec.path), f"숫자가 아닌 값입니다: {value!r}")
+        values.append(value)
+    return to_record(values, record_type)
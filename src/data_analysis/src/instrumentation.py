@@ -0,0 +1,120 @@
+import threading
+import time
+from contextlib import contextmanager
+from functools import wraps
+
+# 관찰자 목록 - observer(kind, name, value, labels) 형태로 호출
+# kind: "timing"(초 단위 소요 시간), "count"(증가량) 또는 "gauge"(현재 값)
+_observers = []
+_observers_lock = threading.Lock()
+
+def add_observer(observer):
+    """
+    측정 이벤트 관찰자 등록
+
+    Args:
+        observer (callable): observer(kind, name, value, labels) 형태의 함수
+    """
+    with _observers_lock:
+        if observer not in _observers:
+            _observers.append(observer)
+
+def remove_observer(observer):
+    """
+    측정 이벤트 관찰자 제거
+
+    Args:
+        observer (callable): 등록한 관찰자
+    """
+    with _observers_lock:
+        if observer in _observers:
+            _observers.remove(observer)
+
+def emit(kind, name, value, **labels):
+    """
+    측정 이벤트 전달 (관찰자가 없으면 아무것도 하지 않음)
+
+    Args:
+        kind (str): 이벤트 종류 (timing, count, gauge)
+        name (str): 측정 항목 이름
+        value (float): 측정값
+        **labels: 레이블
+    """
+    for observer in tuple(_observers):
+        try:
+            observer(kind, name, value, labels)
+        except Exception:
+            # 측정 실패가 분석 결과에 영향을 주지 않도록 무시
+            pass
+
+def count(name, value=1, **labels):
+    """
+    카운터 이벤트 전달
+
+    Args:
+        name (str): 측정 항목 이름
+        value (float): 증가량
+        **labels: 레이블
+    """
+    if _observers:
+        emit("count", name, value, **labels)
+
+def observe(name, seconds, **labels):
+    """
+    이미 측정한 소요 시간 이벤트 전달
+
+    Args:
+        name (str): 측정 항목 이름
+        seconds (float): 소요 시간 (초)
+        **labels: 레이블
+    """
+    if _observers:
+        emit("timing", name, seconds, **labels)
+
+def gauge(name, value, **labels):
+    """
+    현재 값 이벤트 전달
+
+    Args:
+        name (str): 측정 항목 이름
+        value (float): 현재 값
+        **labels: 레이블
+    """
+    if _observers:
+        emit("gauge", name, value, **labels)
+
+@contextmanager
+def timed(name, **labels):
+    """
+    블록 실행 시간 측정 컨텍스트 매니저 (관찰자가 없으면 측정하지 않음)
+
+    Args:
+        name (str): 측정 항목 이름
+        **labels: 레이블
+    """
+    if not _observers:
+        yield
+        return
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        emit("timing", name, time.perf_counter() - started, **labels)
+
+def timed_stage(stage, name="sleep_analyzer_stage"):
+    """
+    분석 단계 실행 시간 측정 데코레이터
+
+    Args:
+        stage (str): 단계 이름 (stage 레이블)
+        name (str): 측정 항목 이름
+    """
+    def decorator(fn):
+        @wraps(fn)
+        def wrapper(*args, **kwargs):
+            if not _observers:
+                return fn(*args, **kwargs)
+            with timed(name, stage=stage):
+                return fn(*args, **kwargs)
+        return wrapper
+    return decorator
@@ -0,0 +1,343 @@
+import asyncio
+import threading
+import time
+from contextlib import asynccontextmanager, contextmanager
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from src.data_analysis.src import instrumentation
+
+# 이벤트 루프에서 동시성 슬롯을 다시 확인하는 간격 (초)
+ASYNC_SLOT_POLL_INTERVAL = 0.01
+
+def parse_retry_after(value):
+    """
+    Retry-After 헤더 값을 대기 시간(초)으로 변환
+
+    Args:
+        value (str): 초 단위 정수 또는 HTTP 날짜 형식의 헤더 값
+
+    Returns:
+        float: 대기 시간 (초), 해석할 수 없으면 None
+    """
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+
+class TokenBucket:
+    """
+    토큰 버킷 기반 요청 속도 제한기
+    초당 rate개의 토큰이 채워지며, 요청마다 토큰 하나를 소비합니다.
+    """
+
+    def __init__(self, rate, capacity=None):
+        """
+        TokenBucket 초기화
+
+        Args:
+            rate (float): 초당 토큰 보충 속도
+            capacity (float): 버킷 최대 크기 (기본값: rate, 최소 1)
+        """
+        self.rate = float(rate)
+        self.capacity = float(capacity) if capacity else max(1.0, self.rate)
+        self.tokens = self.capacity
+        self.updated_at = time.monotonic()
+        self.paused_until = 0.0
+        self.lock = threading.Lock()
+
+    def _refill(self, now):
+        """
+        경과 시간만큼 토큰 보충 (lock을 잡은 상태에서 호출)
+        """
+        elapsed = now - self.updated_at
+        if elapsed > 0:
+            self.tokens = min(self.capacity, self.tokens + elapsed * self.rate)
+            self.updated_at = now
+
+    def set_rate(self, rate):
+        """
+        토큰 보충 속도 변경
+
+        Args:
+            rate (float): 새 초당 토큰 보충 속도
+        """
+        with self.lock:
+            self._refill(time.monotonic())
+            self.rate = float(rate)
+            self.capacity = max(1.0, self.rate)
+            self.tokens = min(self.tokens, self.capacity)
+
+    def pause(self, seconds):
+        """
+        지정한 시간 동안 토큰 발급 중단 (Retry-After 대응)
+
+        Args:
+            seconds (float): 중단 시간 (초)
+        """
+        with self.lock:
+            now = time.monotonic()
+            self.paused_until = max(self.paused_until, now + seconds)
+            self.tokens = 0.0
+            self.updated_at = max(now, self.paused_until)
+
+    def try_acquire(self):
+        """
+        대기 없이 토큰 하나 획득 시도
+
+        Returns:
+            float: 획득했으면 0, 아니면 다음 토큰까지 기다려야 하는 시간 (초)
+        """
+        with self.lock:
+            now = time.monotonic()
+            if now < self.paused_until:
+                return self.paused_until - now
+            self._refill(now)
+            if self.tokens >= 1:
+                self.tokens -= 1
+                return 0.0
+            return (1 - self.tokens) / self.rate
+
+    def acquire(self, timeout=None):
+        """
+        토큰 하나를 획득할 때까지 대기
+
+        Args:
+            timeout (float): 최대 대기 시간 (초, None이면 무제한)
+
+        Returns:
+            float: 실제 대기한 시간 (초), 시간 초과 시 None
+        """
+        started = time.monotonic()
+        deadline = None if timeout is None else started + timeout
+
+        while True:
+            wait = self.try_acquire()
+            if not wait:
+                return time.monotonic() - started
+
+            if deadline is not None:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return None
+                wait = min(wait, remaining)
+            time.sleep(wait)
+
+class AdaptiveRateLimiter:
+    """
+    AIMD(가산 증가 / 승산 감소) 방식의 적응형 속도 및 동시성 제어기
+    업스트림이 정상이면 요청 속도와 동시 요청 수를 조금씩 늘리고,
+    429/Retry-After 응답이나 지연 시간 증가가 감지되면 빠르게 줄입니다.
+    """
+
+    def __init__(self, rate=5.0, min_rate=0.5, max_rate=50.0,
+                 concurrency=4, min_concurrency=1, max_concurrency=32,
+                 increase_step=1.0, decrease_factor=0.5,
+                 latency_tolerance=2.0, cooldown=1.0):
+        """
+        AdaptiveRateLimiter 초기화
+
+        Args:
+            rate (float): 초기 초당 요청 수
+            min_rate (float): 최소 초당 요청 수
+            max_rate (float): 최대 초당 요청 수
+            concurrency (int): 초기 동시 요청 수 한도
+            min_concurrency (int): 최소 동시 요청 수 한도
+            max_concurrency (int): 최대 동시 요청 수 한도
+            increase_step (float): 정상 응답 한 주기(한도만큼의 응답)당 증가량
+            decrease_factor (float): 혼잡 감지 시 곱할 감소 비율
+            latency_tolerance (float): 기준 지연 시간 대비 혼잡으로 판단할 배수
+            cooldown (float): 연속 감소를 막기 위한 최소 간격 (초)
+        """
+        self.min_rate = min_rate
+        self.max_rate = max_rate
+        self.min_concurrency = min_concurrency
+        self.max_concurrency = max_concurrency
+        self.increase_step = increase_step
+        self.decrease_factor = decrease_factor
+        self.latency_tolerance = latency_tolerance
+        self.cooldown = cooldown
+
+        self.rate = float(min(max(rate, min_rate), max_rate))
+        self.bucket = TokenBucket(self.rate)
+        self.concurrency_limit = float(min(max(concurrency, min_concurrency), max_concurrency))
+        self.in_flight = 0
+        self.baseline_latency = None
+        self.last_decrease_at = 0.0
+        self.condition = threading.Condition()
+        self._report_state()
+
+        # 메트릭
+        self.metrics = {
+            "requests": 0,
+            "successes": 0,
+            "throttled": 0,
+            "errors": 0,
+            "latency_backoffs": 0,
+            "wait_seconds": 0.0,
+            "last_retry_after": None
+        }
+
+    @contextmanager
+    def slot(self, timeout=None):
+        """
+        동시성 슬롯과 토큰을 획득하는 컨텍스트 매니저
+
+        Args:
+            timeout (float): 슬롯 대기 최대 시간 (초, None이면 무제한)
+        """
+        started = time.monotonic()
+        with self.condition:
+            while self.in_flight >= int(self.concurrency_limit):
+                remaining = None if timeout is None else timeout - (time.monotonic() - started)
+                if remaining is not None and remaining <= 0:
+                    raise TimeoutError("동시 요청 슬롯을 얻지 못했습니다.")
+                self.condition.wait(remaining)
+            self.in_flight += 1
+
+        try:
+            remaining = None if timeout is None else max(0.0, timeout - (time.monotonic() - started))
+            if self.bucket.acquire(remaining) is None:
+                raise TimeoutError("요청 토큰을 얻지 못했습니다.")
+            waited = time.monotonic() - started
+            with self.condition:
+                self.metrics["requests"] += 1
+                self.metrics["wait_seconds"] += waited
+            instrumentation.observe("health_connect_limiter_wait", waited)
+            yield
+        finally:
+            with self.condition:
+                self.in_flight -= 1
+                self.condition.notify()
+
+    @asynccontextmanager
+    async def async_slot(self):
+        """
+        slot()의 비동기 버전 - 이벤트 루프를 막지 않고 동시성 슬롯과 토큰을 기다림 (ASGI 모드)
+        """
+        started = time.monotonic()
+        while True:
+            with self.condition:
+                if self.in_flight < int(self.concurrency_limit):
+                    self.in_flight += 1
+                    break
+            await asyncio.sleep(ASYNC_SLOT_POLL_INTERVAL)
+
+        try:
+            while True:
+                wait = self.bucket.try_acquire()
+                if not wait:
+                    break
+                await asyncio.sleep(wait)
+            waited = time.monotonic() - started
+            with self.condition:
+                self.metrics["requests"] += 1
+                self.metrics["wait_seconds"] += waited
+            instrumentation.observe("health_connect_limiter_wait", waited)
+            yield
+        finally:
+            with self.condition:
+                self.in_flight -= 1
+                self.condition.notify()
+
+    def record_success(self, latency):
+        """
+        정상 응답 기록 - 지연 시간이 기준 이내면 가산 증가
+
+        Args:
+            latency (float): 응답 지연 시간 (초)
+        """
+        with self.condition:
+            self.metrics["successes"] += 1
+
+            if self.baseline_latency is None:
+                self.baseline_latency = latency
+            elif latency > self.baseline_latency * self.latency_tolerance:
+                # 지연 시간 증가는 업스트림 혼잡 신호로 간주
+                self.metrics["latency_backoffs"] += 1
+                self._decrease("latency")
+                return
+            else:
+                # 기준 지연 시간은 정상 응답으로만 천천히 갱신
+                self.baseline_latency = 0.9 * self.baseline_latency + 0.1 * latency
+
+            # 한도만큼의 응답이 돌아오면 increase_step만큼 증가하도록 분할 증가
+            self.concurrency_limit = min(self.max_concurrency, self.concurrency_limit + self.increase_step / self.concurrency_limit)
+            self.rate = min(self.max_rate, self.rate + self.increase_step / max(1.0, self.rate))
+            self.bucket.set_rate(self.rate)
+            self._report_state()
+            self.condition.notify_all()
+
+    def record_throttle(self, retry_after=None):
+        """
+        429 등 스로틀링 응답 기록 - 승산 감소 및 Retry-After 동안 대기
+
+        동시에 보낸 요청들이 함께 받은 429는 혼잡 한 번으로 보고 cooldown 안에서는
+        한 번만 감소합니다 (Retry-After 대기는 매번 적용).
+
+        Args:
+            retry_after (float): 업스트림이 요청한 대기 시간 (초, 선택)
+        """
+        with self.condition:
+            self.metrics["throttled"] += 1
+            self.metrics["last_retry_after"] = retry_after
+            self._decrease("throttled")
+        if retry_after:
+            self.bucket.pause(retry_after)
+
+    def record_error(self):
+        """
+        네트워크 오류 및 5xx 응답 기록
+        """
+        with self.condition:
+            self.metrics["errors"] += 1
+            self._decrease("error")
+
+    def _decrease(self, reason):
+        """
+        속도 및 동시성 한도 승산 감소 (condition lock을 잡은 상태에서 호출, cooldown 안에서는 한 번만)
+
+        Args:
+            reason (str): 감소 원인 (throttled, error, latency - /metrics 레이블)
+        """
+        now = time.monotonic()
+        if now - self.last_decrease_at < self.cooldown:
+            return
+        self.last_decrease_at = now
+        self.concurrency_limit = max(self.min_concurrency, self.concurrency_limit * self.decrease_factor)
+        self.rate = max(self.min_rate, self.rate * self.decrease_factor)
+        self.bucket.set_rate(self.rate)
+        instrumentation.count("health_connect_limiter_backoffs", reason=reason)
+        self._report_state()
+
+    def _report_state(self):
+        """
+        현재 속도 및 동시성 한도를 측정 이벤트로 전달 (/metrics 게이지)
+        """
+        instrumentation.gauge("health_connect_limiter_rate", self.rate)
+        instrumentation.gauge("health_connect_limiter_concurrency", int(self.concurrency_limit))
+
+    def get_metrics(self):
+        """
+        현재 제어 상태 및 누적 메트릭 조회
+
+        Returns:
+            dict: 메트릭 정보
+        """
+        with self.condition:
+            metrics = dict(self.metrics)
+            metrics.update({
+                "rate": round(self.rate, 3),
+                "concurrency_limit": int(self.concurrency_limit),
+                "in_flight": self.in_flight,
+                "baseline_latency": self.baseline_latency
+            })
+            return metrics
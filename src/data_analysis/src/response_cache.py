@@ -0,0 +1,232 @@
+import hashlib
+import os
+import struct
+import tempfile
+import time
+import zlib
+
+# 캐시 파일 헤더: 포맷 버전(1바이트) + 만료 시각(epoch 초, double)
+_HEADER = struct.Struct('>Bd')
+_FORMAT_VERSION = 1
+
+# 이 시간(초)보다 오래된 임시 파일은 쓰던 프로세스가 중단된 것으로 보고 삭제
+STALE_TEMP_SECONDS = 10 * 60
+
+def window_ttl(end_date, recent_ttl):
+    """
+    날짜 구간의 캐시 유효 시간 (오늘이 포함된 구간은 새 데이터가 추가될 수 있으므로 짧게 보관)
+
+    Args:
+        end_date (str): 구간 종료 날짜 (YYYY-MM-DD)
+        recent_ttl (int): 오늘이 포함된 구간의 유효 시간 (초)
+
+    Returns:
+        int: 유효 시간 (초), 기본 유효 시간을 쓰면 None
+    """
+    today = time.strftime('%Y-%m-%d')
+    return recent_ttl if end_date and end_date >= today else None
+
+class DiskResponseCache:
+    """
+    Health Connect 응답을 위한 디스크 캐시
+    (사용자, 엔드포인트, 날짜 구간) 단위로 압축된 응답 본문을 저장합니다.
+
+    파일은 임시 파일에 쓴 뒤 os.replace로 교체하므로 여러 워커 프로세스가
+    같은 디렉토리를 공유해도 반쯤 쓰인 파일을 읽지 않습니다.
+    """
+
+    def __init__(self, directory=None, ttl=6 * 60 * 60, max_bytes=512 * 1024 * 1024, compress_level=6):
+        """
+        DiskResponseCache 초기화
+
+        Args:
+            directory (str): 캐시 디렉토리 (기본값: HEALTH_CONNECT_CACHE_DIR 환경 변수 또는 시스템 임시 디렉토리)
+            ttl (int): 기본 유효 시간 (초)
+            max_bytes (int): 캐시 디렉토리 최대 크기 (바이트)
+            compress_level (int): zlib 압축 레벨 (1-9)
+        """
+        self.directory = directory or os.environ.get(
+            'HEALTH_CONNECT_CACHE_DIR',
+            os.path.join(tempfile.gettempdir(), 'health_connect_cache')
+        )
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        self.compress_level = compress_level
+        # 마지막 디렉토리 검사 이후 기록한 바이트 수 (None이면 아직 검사 전)
+        self._written_since_scan = None
+        os.makedirs(self.directory, exist_ok=True)
+
+    @staticmethod
+    def make_key(user_id, endpoint, start_date, end_date):
+        """
+        캐시 키 생성
+
+        Args:
+            user_id (str): 사용자 식별자
+            endpoint (str): 엔드포인트 이름 (sleep, activity, stress)
+            start_date (str): 시작 날짜 (YYYY-MM-DD)
+            end_date (str): 종료 날짜 (YYYY-MM-DD)
+
+        Returns:
+            str: SHA-256 기반 캐시 키
+        """
+        raw = '\x1f'.join(str(part) for part in (user_id, endpoint, start_date, end_date))
+        return hashlib.sha256(raw.encode('utf-8')).hexdigest()
+
+    def _path(self, key):
+        """
+        캐시 키에 해당하는 파일 경로 (디렉토리 하나에 파일이 몰리지 않도록 2단계로 분산)
+        """
+        return os.path.join(self.directory, key[:2], key + '.bin')
+
+    def get(self, user_id, endpoint, start_date, end_date):
+        """
+        캐시된 응답 본문 조회
+
+        Returns:
+            bytes: 압축 해제된 응답 본문, 없거나 만료되었으면 None
+        """
+        path = self._path(self.make_key(user_id, endpoint, start_date, end_date))
+        try:
+            with open(path, 'rb') as f:
+                data = f.read()
+        except FileNotFoundError:
+            return None
+
+        try:
+            version, expires_at = _HEADER.unpack_from(data)
+            if version != _FORMAT_VERSION:
+                raise ValueError("지원하지 않는 캐시 포맷입니다.")
+            if expires_at < time.time():
+                self._remove(path)
+                return None
+            payload = zlib.decompress(data[_HEADER.size:])
+        except (struct.error, zlib.error, ValueError):
+            # 손상된 파일은 삭제하고 캐시 미스로 처리
+            self._remove(path)
+            return None
+
+        # 접근 시각 갱신 - 크기 제한 시 최근에 사용하지 않은 파일부터 제거
+        try:
+            os.utime(path, None)
+        except OSError:
+            pass
+        return payload
+
+    def set(self, user_id, endpoint, start_date, end_date, payload, ttl=None):
+        """
+        응답 본문 저장 (원자적 교체)
+
+        Args:
+            user_id (str): 사용자 식별자
+            endpoint (str): 엔드포인트 이름
+            start_date (str): 시작 날짜 (YYYY-MM-DD)
+            end_date (str): 종료 날짜 (YYYY-MM-DD)
+            payload (bytes): 응답 본문
+            ttl (int): 유효 시간 (초, 기본값: self.ttl)
+        """
+        path = self._path(self.make_key(user_id, endpoint, start_date, end_date))
+        directory = os.path.dirname(path)
+        os.makedirs(directory, exist_ok=True)
+
+        expires_at = time.time() + (self.ttl if ttl is None else ttl)
+        data = _HEADER.pack(_FORMAT_VERSION, expires_at) + zlib.compress(payload, self.compress_level)
+
+        # 같은 디렉토리의 임시 파일에 쓴 뒤 교체
+        fd, tmp_path = tempfile.mkstemp(dir=directory, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(data)
+            os.replace(tmp_path, path)
+        except BaseException:
+            self._remove(tmp_path)
+            raise
+
+        # 기록량이 최대 크기의 10%를 넘을 때마다 디렉토리를 검사해 크기 제한 적용
+        if self._written_since_scan is None or self._written_since_scan + len(data) > self.max_bytes // 10:
+            self.evict()
+        else:
+            self._written_since_scan += len(data)
+
+    def delete(self, user_id, endpoint, start_date, end_date):
+        """
+        캐시 항목 삭제
+        """
+        self._remove(self._path(self.make_key(user_id, endpoint, start_date, end_date)))
+
+    def clear(self):
+        """
+        모든 캐시 항목 삭제
+        """
+        for path, _, _ in self._entries():
+            self._remove(path)
+        self._written_since_scan = 0
+
+    def evict(self):
+        """
+        만료된 항목, 중단된 쓰기의 임시 파일, 크기 제한을 넘는 오래된 항목 제거
+
+        Returns:
+            int: 제거 후 캐시 전체 크기 (바이트, 쓰는 중인 임시 파일 포함)
+        """
+        now = time.time()
+        entries = []
+        total = 0
+
+        # 교체 전에 프로세스가 종료되어 남은 임시 파일 (쓰는 중일 수 있는 최근 파일은 크기만 셈)
+        for path, size, mtime in self._entries('.tmp'):
+            if mtime < now - STALE_TEMP_SECONDS:
+                self._remove(path)
+            else:
+                total += size
+
+        for path, size, mtime in self._entries():
+            try:
+                with open(path, 'rb') as f:
+                    _, expires_at = _HEADER.unpack(f.read(_HEADER.size))
+            except (OSError, struct.error):
+                continue
+            if expires_at < now:
+                self._remove(path)
+                continue
+            entries.append((mtime, size, path))
+            total += size
+
+        # 최근 접근 시각이 오래된 순서로 제거
+        entries.sort()
+        for _, size, path in entries:
+            if total <= self.max_bytes:
+                break
+            self._remove(path)
+            total -= size
+
+        self._written_since_scan = 0
+        return total
+
+    def _entries(self, suffix='.bin'):
+        """
+        캐시 파일 목록 (경로, 크기, 수정 시각) - 다른 프로세스가 동시에 삭제한 파일은 건너뜀
+
+        Args:
+            suffix (str): 파일 확장자 (.bin: 캐시 항목, .tmp: 임시 파일)
+        """
+        for root, _, files in os.walk(self.directory):
+            for name in files:
+                if not name.endswith(suffix):
+                    continue
+                path = os.path.join(root, name)
+                try:
+                    stat = os.stat(path)
+                except FileNotFoundError:
+                    continue
+                yield path, stat.st_size, stat.st_mtime
+
+    @staticmethod
+    def _remove(path):
+        """
+        파일 삭제 (이미 삭제된 경우 무시)
+        """
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
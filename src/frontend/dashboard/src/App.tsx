@@ -22,10 +22,18 @@ const App: React.FC = () => {
       }
       
       try {
-        // 실제 구현에서는 토큰 검증 API 호출
-        // 현재는 토큰 존재 여부만 확인
+        // 토큰 검증 API 호출 (만료되었거나 유효하지 않으면 로그아웃 처리)
+        const response = await fetch('http://localhost:5000/api/auth/verify', {
+          headers: { Authorization: `Bearer ${token}` }
+        });
+        
+        if (!response.ok) {
+          throw new Error(`토큰 검증 실패: ${response.status}`);
+        }
+        
+        const result = await response.json();
         setIsAuthenticated(true);
-        setUser(JSON.parse(localStorage.getItem('user') || '{}'));
+        setUser(result.user);
       } catch (error) {
         console.error('인증 오류:', error);
         setIsAuthenticated(false);
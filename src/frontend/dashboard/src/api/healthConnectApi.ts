@@ -60,36 +60,76 @@ interface ApiResponse<T> {
   message?: string;
 }
 
+// 페이지 단위 응답 타입 정의
+interface PagedResponse<T> extends ApiResponse<T[]> {
+  next?: string | null;
+}
+
 /**
- * 수면 데이터를 가져오는 함수
+ * 로그인 시 저장한 토큰으로 인증 헤더 생성
+ * @param headers 추가 헤더 (선택)
+ * @returns 요청 헤더
+ */
+const authHeaders = (headers: Record<string, string> = {}): Record<string, string> => {
+  const token = localStorage.getItem('token');
+  return token ? { ...headers, Authorization: `Bearer ${token}` } : headers;
+};
+
+/**
+ * 날짜 범위 쿼리 파라미터 생성
  * @param dateRange 날짜 범위 (선택)
- * @returns 수면 데이터 배열
+ * @returns 쿼리 파라미터
  */
-export const fetchSleepData = async (dateRange?: DateRange): Promise<SleepData[]> => {
-  try {
-    let url = `${API_BASE_URL}/health_connect/sleep`;
-    
-    // 날짜 범위가 제공된 경우 쿼리 파라미터 추가
-    if (dateRange) {
-      const params = new URLSearchParams();
-      if (dateRange.startDate) params.append('start_date', dateRange.startDate);
-      if (dateRange.endDate) params.append('end_date', dateRange.endDate);
-      url += `?${params.toString()}`;
-    }
-    
-    const response = await fetch(url);
-    
+const buildDateParams = (dateRange?: DateRange): URLSearchParams => {
+  const params = new URLSearchParams();
+  if (dateRange?.startDate) params.append('start_date', dateRange.startDate);
+  if (dateRange?.endDate) params.append('end_date', dateRange.endDate);
+  return params;
+};
+
+/**
+ * 커서 페이지네이션 응답을 마지막 페이지까지 이어서 가져오는 함수
+ * @param endpoint API 엔드포인트 경로
+ * @param dateRange 날짜 범위 (선택)
+ * @returns 전체 레코드 배열
+ */
+const fetchAllPages = async <T>(endpoint: string, dateRange?: DateRange): Promise<T[]> => {
+  const records: T[] = [];
+  let next: string | null | undefined = null;
+
+  do {
+    const params = buildDateParams(dateRange);
+    if (next) params.append('next', next);
+    const query = params.toString();
+    const url = `${API_BASE_URL}${endpoint}${query ? `?${query}` : ''}`;
+
+    const response = await fetch(url, { headers: authHeaders() });
+
     if (!response.ok) {
       throw new Error(`API 요청 실패: ${response.status}`);
     }
-    
-    const result: ApiResponse<SleepData[]> = await response.json();
-    
+
+    const result: PagedResponse<T> = await response.json();
+
     if (!result.success) {
       throw new Error(result.message || '데이터를 가져오는데 실패했습니다.');
     }
-    
-    return result.data;
+
+    records.push(...result.data);
+    next = result.next;
+  } while (next);
+
+  return records;
+};
+
+/**
+ * 수면 데이터를 가져오는 함수
+ * @param dateRange 날짜 범위 (선택)
+ * @returns 수면 데이터 배열
+ */
+export const fetchSleepData = async (dateRange?: DateRange): Promise<SleepData[]> => {
+  try {
+    return await fetchAllPages<SleepData>('/health_connect/sleep', dateRange);
   } catch (error) {
     console.error('수면 데이터 가져오기 오류:', error);
     return [];
@@ -103,29 +143,7 @@ export const fetchSleepData = async (dateRange?: DateRange): Promise<SleepData[]
  */
 export const fetchActivityData = async (dateRange?: DateRange): Promise<ActivityData[]> => {
   try {
-    let url = `${API_BASE_URL}/health_connect/activity`;
-    
-    // 날짜 범위가 제공된 경우 쿼리 파라미터 추가
-    if (dateRange) {
-      const params = new URLSearchParams();
-      if (dateRange.startDate) params.append('start_date', dateRange.startDate);
-      if (dateRange.endDate) params.append('end_date', dateRange.endDate);
-      url += `?${params.toString()}`;
-    }
-    
-    const response = await fetch(url);
-    
-    if (!response.ok) {
-      throw new Error(`API 요청 실패: ${response.status}`);
-    }
-    
-    const result: ApiResponse<ActivityData[]> = await response.json();
-    
-    if (!result.success) {
-      throw new Error(result.message || '데이터를 가져오는데 실패했습니다.');
-    }
-    
-    return result.data;
+    return await fetchAllPages<ActivityData>('/health_connect/activity', dateRange);
   } catch (error) {
     console.error('활동 데이터 가져오기 오류:', error);
     return [];
@@ -139,35 +157,114 @@ export const fetchActivityData = async (dateRange?: DateRange): Promise<Activity
  */
 export const fetchStressData = async (dateRange?: DateRange): Promise<StressData[]> => {
   try {
-    let url = `${API_BASE_URL}/health_connect/stress`;
-    
-    // 날짜 범위가 제공된 경우 쿼리 파라미터 추가
-    if (dateRange) {
-      const params = new URLSearchParams();
-      if (dateRange.startDate) params.append('start_date', dateRange.startDate);
-      if (dateRange.endDate) params.append('end_date', dateRange.endDate);
-      url += `?${params.toString()}`;
+    return await fetchAllPages<StressData>('/health_connect/stress', dateRange);
+  } catch (error) {
+    console.error('스트레스 데이터 가져오기 오류:', error);
+    return [];
+  }
+};
+
+// 차트 시계열 구간 집계 값
+interface BucketStats {
+  mean: number;
+  min: number;
+  max: number;
+}
+
+// 차트 시계열 구간 (resolution 요청 결과)
+interface SeriesBucket {
+  bucket: string;
+  count: number;
+  [field: string]: BucketStats | string | number | null;
+}
+
+// 차트 시계열 요청 옵션 (resolution과 maxPoints 중 하나만 사용)
+type SeriesOptions = { resolution: 'day' | 'week' | 'month' } | { maxPoints: number };
+
+type RecordType = 'sleep' | 'activity' | 'stress';
+
+/**
+ * 차트용으로 서버에서 줄인 시계열을 가져오는 함수
+ * resolution은 구간별 평균/최소/최대, maxPoints는 LTTB로 선택한 원본 레코드를 반환합니다.
+ * @param recordType 레코드 유형
+ * @param options 집계 단위 또는 최대 점 수
+ * @param dateRange 날짜 범위 (선택)
+ * @returns 구간 목록 또는 레코드 목록
+ */
+export const fetchSeries = async (
+  recordType: RecordType,
+  options: SeriesOptions,
+  dateRange?: DateRange
+): Promise<SeriesBucket[] | Array<SleepData | ActivityData | StressData>> => {
+  try {
+    const params = buildDateParams(dateRange);
+    if ('resolution' in options) {
+      params.append('resolution', options.resolution);
+    } else {
+      params.append('max_points', String(options.maxPoints));
     }
-    
-    const response = await fetch(url);
-    
+    const url = `${API_BASE_URL}/health_connect/${recordType}?${params.toString()}`;
+
+    const response = await fetch(url, { headers: authHeaders() });
+
     if (!response.ok) {
       throw new Error(`API 요청 실패: ${response.status}`);
     }
-    
-    const result: ApiResponse<StressData[]> = await response.json();
-    
+
+    const result: ApiResponse<SeriesBucket[] | Array<SleepData | ActivityData | StressData>> = await response.json();
+
     if (!result.success) {
-      throw new Error(result.message || '데이터를 가져오는데 실패했습니다.');
+      throw new Error(result.message || '시계열 데이터를 가져오는데 실패했습니다.');
     }
-    
+
     return result.data;
   } catch (error) {
-    console.error('스트레스 데이터 가져오기 오류:', error);
+    console.error('시계열 데이터 가져오기 오류:', error);
     return [];
   }
 };
 
+// 배치 분석 섹션 이름
+type AnalysisSection = 'summary' | 'optimal_sleep' | 'trends' | 'correlations';
+
+/**
+ * 여러 분석 섹션을 한 번의 요청으로 가져오는 함수
+ * 섹션별 결과는 개별 분석 API와 같습니다 (trends는 최근 days*2일, correlations는 전체 기간).
+ * @param sections 분석 섹션 목록
+ * @param dateRange 날짜 범위 (선택, summary와 optimal_sleep에 적용)
+ * @param days 추세 분석 기간 (일, 선택)
+ * @returns 섹션 이름 -> 분석 결과
+ */
+export const fetchAnalysisBatch = async (
+  sections: AnalysisSection[],
+  dateRange?: DateRange,
+  days?: number
+): Promise<Partial<Record<AnalysisSection, any>>> => {
+  try {
+    const params = buildDateParams(dateRange);
+    params.append('sections', sections.join(','));
+    if (days) params.append('days', String(days));
+    const url = `${API_BASE_URL}/analysis/batch?${params.toString()}`;
+
+    const response = await fetch(url, { headers: authHeaders() });
+
+    if (!response.ok) {
+      throw new Error(`API 요청 실패: ${response.status}`);
+    }
+
+    const result: ApiResponse<Partial<Record<AnalysisSection, any>>> = await response.json();
+
+    if (!result.success) {
+      throw new Error(result.message || '분석 결과를 가져오는데 실패했습니다.');
+    }
+
+    return result.data;
+  } catch (error) {
+    console.error('배치 분석 가져오기 오류:', error);
+    return {};
+  }
+};
+
 /**
  * Health Connect 연결 상태를 확인하는 함수
  * @returns 연결 상태 정보
@@ -184,7 +281,7 @@ export const checkConnectionStatus = async (): Promise<{
   try {
     const url = `${API_BASE_URL}/health_connect/status`;
     
-    const response = await fetch(url);
+    const response = await fetch(url, { headers: authHeaders() });
     
     if (!response.ok) {
       throw new Error(`API 요청 실패: ${response.status}`);
@@ -222,9 +319,9 @@ export const saveUserFeedback = async (feedback: UserFeedback): Promise<boolean>
     
     const response = await fetch(url, {
       method: 'POST',
-      headers: {
+      headers: authHeaders({
         'Content-Type': 'application/json'
-      },
+      }),
       body: JSON.stringify(feedback)
     });
     
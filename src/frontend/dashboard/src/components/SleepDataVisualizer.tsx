@@ -1,8 +1,33 @@
 import React, { useEffect, useState } from 'react';
-import { fetchSleepData, fetchActivityData, fetchStressData } from '../api/healthConnectApi';
+import { LineChart, Line, XAxis, YAxis, CartesianGrid, Tooltip, Legend, ResponsiveContainer } from 'recharts';
+import { fetchAnalysisBatch, fetchSeries } from '../api/healthConnectApi';
 
-// 차트 라이브러리 가져오기 (실제 구현 시 설치 필요)
-// import { LineChart, Line, BarChart, Bar, PieChart, Pie, XAxis, YAxis, CartesianGrid, Tooltip, Legend, ResponsiveContainer } from 'recharts';
+// 수면 시간 트렌드 차트 기간 - 서버가 기간에 맞는 단위로 집계한 구간만 받아 그림
+const TREND_PERIODS = [
+  { key: '30d', label: '30일', days: 30, resolution: 'day' as const },
+  { key: '6m', label: '6개월', days: 182, resolution: 'week' as const },
+  { key: '2y', label: '2년', days: 730, resolution: 'month' as const }
+];
+
+/**
+ * 오늘까지 최근 days일의 날짜 범위
+ * @param days 기간 (일)
+ * @returns 날짜 범위
+ */
+const recentRange = (days: number) => {
+  const start = new Date();
+  start.setDate(start.getDate() - days);
+  return {
+    startDate: start.toISOString().split('T')[0],
+    endDate: new Date().toISOString().split('T')[0]
+  };
+};
+
+// 트렌드 차트 점 (구간별 평균 수면 시간)
+interface TrendPoint {
+  date: string;
+  duration: number;
+}
 
 interface SleepDataVisualizerProps {
   sleepData: any[];
@@ -38,90 +63,88 @@ const SleepDataVisualizer: React.FC<SleepDataVisualizerProps> = ({
     trend: 'stable'
   });
 
-  // 데이터 처리 및 계산
+  const [trendPeriod, setTrendPeriod] = useState(TREND_PERIODS[0].key);
+  const [trendPoints, setTrendPoints] = useState<TrendPoint[]>([]);
+
+  // 트렌드 차트는 원본 레코드 대신 서버에서 집계한 구간 평균만 가져옴
   useEffect(() => {
-    if (sleepData && sleepData.length > 0) {
-      // 평균 수면 시간 계산
-      const totalDuration = sleepData.reduce((sum, item) => sum + item.duration, 0);
-      const avgDuration = totalDuration / sleepData.length;
-      
-      // 평균 수면 효율 계산
-      const totalEfficiency = sleepData.reduce((sum, item) => sum + item.efficiency, 0);
-      const avgEfficiency = totalEfficiency / sleepData.length;
-      
-      // 수면 단계 비율 계산
-      let totalDeep = 0;
-      let totalLight = 0;
-      let totalRem = 0;
-      let totalAwake = 0;
-      
-      sleepData.forEach(item => {
-        if (item.stages) {
-          totalDeep += item.stages.deep || 0;
-          totalLight += item.stages.light || 0;
-          totalRem += item.stages.rem || 0;
-          totalAwake += item.stages.awake || 0;
-        }
-      });
-      
-      const totalStages = totalDeep + totalLight + totalRem + totalAwake;
-      
-      setSummaryData({
-        averageDuration: avgDuration,
-        averageEfficiency: avgEfficiency,
-        deepSleepPercentage: totalStages > 0 ? (totalDeep / totalStages) * 100 : 0,
-        lightSleepPercentage: totalStages > 0 ? (totalLight / totalStages) * 100 : 0,
-        remSleepPercentage: totalStages > 0 ? (totalRem / totalStages) * 100 : 0,
-        awakePercentage: totalStages > 0 ? (totalAwake / totalStages) * 100 : 0
-      });
-      
-      // 최적 수면 시간 계산 (간단한 예시)
-      // 실제로는 백엔드 API를 통해 분석 결과를 가져와야 함
-      const bedtimeHours = sleepData.map(item => {
-        const startTime = new Date(item.start_time);
-        return startTime.getHours() + startTime.getMinutes() / 60;
-      });
-      
-      const waketimeHours = sleepData.map(item => {
-        const endTime = new Date(item.end_time);
-        return endTime.getHours() + endTime.getMinutes() / 60;
-      });
-      
-      const avgBedtimeHour = bedtimeHours.reduce((sum, hour) => sum + hour, 0) / bedtimeHours.length;
-      const avgWaketimeHour = waketimeHours.reduce((sum, hour) => sum + hour, 0) / waketimeHours.length;
-      
-      const bedtimeHour = Math.floor(avgBedtimeHour);
-      const bedtimeMinute = Math.floor((avgBedtimeHour - bedtimeHour) * 60);
-      
-      const waketimeHour = Math.floor(avgWaketimeHour);
-      const waketimeMinute = Math.floor((avgWaketimeHour - waketimeHour) * 60);
-      
-      setOptimalSleepTime({
-        bedtime: `${bedtimeHour.toString().padStart(2, '0')}:${bedtimeMinute.toString().padStart(2, '0')}`,
-        waketime: `${waketimeHour.toString().padStart(2, '0')}:${waketimeMinute.toString().padStart(2, '0')}`,
-        duration: `${Math.floor(avgDuration / 60)}시간 ${Math.floor(avgDuration % 60)}분`
-      });
-      
-      // 트렌드 계산 (간단한 예시)
-      // 실제로는 백엔드 API를 통해 분석 결과를 가져와야 함
-      if (sleepData.length >= 7) {
-        const recentData = sleepData.slice(0, 7);
-        const olderData = sleepData.slice(7, 14);
-        
-        if (olderData.length > 0) {
-          const recentAvg = recentData.reduce((sum, item) => sum + item.duration, 0) / recentData.length;
-          const olderAvg = olderData.reduce((sum, item) => sum + item.duration, 0) / olderData.length;
-          
-          const weeklyChange = recentAvg - olderAvg;
-          
-          setSleepTrend({
-            weeklyChange,
-            monthlyChange: weeklyChange * 4, // 간단한 예시
-            trend: weeklyChange > 10 ? 'improving' : weeklyChange < -10 ? 'declining' : 'stable'
-          });
-        }
+    if (!sleepData || sleepData.length === 0) return;
+
+    let cancelled = false;
+    const period = TREND_PERIODS.find(item => item.key === trendPeriod) || TREND_PERIODS[0];
+
+    const loadSeries = async () => {
+      const buckets = await fetchSeries('sleep', { resolution: period.resolution }, recentRange(period.days));
+      if (cancelled) return;
+
+      // resolution 요청 결과는 구간 목록 (duration은 구간별 평균/최소/최대, 분 단위)
+      setTrendPoints((buckets as any[])
+        .filter(bucket => typeof bucket.duration?.mean === 'number')
+        .map(bucket => ({
+          date: bucket.bucket,
+          duration: Math.round((bucket.duration.mean / 60) * 100) / 100
+        })));
+    };
+
+    loadSeries();
+
+    return () => {
+      cancelled = true;
+    };
+  }, [sleepData, trendPeriod]);
+
+  // 분석 결과는 백엔드 배치 API로 한 번에 가져옴 (데이터 새로고침 시 다시 요청)
+  useEffect(() => {
+    if (!sleepData || sleepData.length === 0) return;
+
+    let cancelled = false;
+
+    const loadAnalysis = async () => {
+      // 대시보드와 같은 최근 30일 기준
+      const result = await fetchAnalysisBatch(['summary', 'optimal_sleep', 'trends'], recentRange(30));
+      if (cancelled) return;
+
+      const summary = result.summary;
+      if (summary && Object.keys(summary).length > 0) {
+        const totalStages = (summary.average_deep_sleep || 0) + (summary.average_light_sleep || 0)
+          + (summary.average_rem_sleep || 0) + (summary.average_awake_time || 0);
+        const percentage = (value: number | undefined) => totalStages > 0 ? ((value || 0) / totalStages) * 100 : 0;
+
+        setSummaryData({
+          averageDuration: summary.average_duration || 0,
+          averageEfficiency: summary.average_efficiency || 0,
+          deepSleepPercentage: percentage(summary.average_deep_sleep),
+          lightSleepPercentage: percentage(summary.average_light_sleep),
+          remSleepPercentage: percentage(summary.average_rem_sleep),
+          awakePercentage: percentage(summary.average_awake_time)
+        });
+      }
+
+      const optimal = result.optimal_sleep;
+      if (optimal && optimal.optimal_bedtime) {
+        const duration = optimal.optimal_duration || 0;
+        setOptimalSleepTime({
+          bedtime: optimal.optimal_bedtime,
+          waketime: optimal.optimal_waketime,
+          duration: `${Math.floor(duration / 60)}시간 ${Math.floor(duration % 60)}분`
+        });
       }
-    }
+
+      const trends = result.trends;
+      if (trends && trends.trend) {
+        setSleepTrend({
+          weeklyChange: trends.weekly_change || 0,
+          monthlyChange: trends.monthly_change || 0,
+          trend: trends.trend
+        });
+      }
+    };
+
+    loadAnalysis();
+
+    return () => {
+      cancelled = true;
+    };
   }, [sleepData]);
 
   // 데이터가 없는 경우
@@ -234,24 +257,41 @@ const SleepDataVisualizer: React.FC<SleepDataVisualizerProps> = ({
       
       {/* 수면 트렌드 섹션 */}
       <div className="bg-white rounded-lg shadow p-6">
-        <h2 className="text-xl font-semibold mb-4">수면 트렌드</h2>
-        <div className="h-64 flex items-center justify-center bg-gray-100 rounded mb-4">
-          <p className="text-gray-500">수면 시간 트렌드 차트가 표시됩니다</p>
-          {/* 실제 구현 시 차트 라이브러리 사용
-          <ResponsiveContainer width="100%" height="100%">
-            <LineChart data={sleepData.map(item => ({
-              date: new Date(item.start_time).toLocaleDateString(),
-              duration: item.duration / 60
-            }))}>
-              <CartesianGrid strokeDasharray="3 3" />
-              <XAxis dataKey="date" />
-              <YAxis />
-              <Tooltip />
-              <Legend />
-              <Line type="monotone" dataKey="duration" stroke="#8884d8" name="수면 시간 (시간)" />
-            </LineChart>
-          </ResponsiveContainer>
-          */}
+        <div className="flex justify-between items-center mb-4">
+          <h2 className="text-xl font-semibold">수면 트렌드</h2>
+          <div className="flex gap-1">
+            {TREND_PERIODS.map(period => (
+              <button
+                key={period.key}
+                className={`px-3 py-1 rounded text-sm transition-colors ${
+                  trendPeriod === period.key
+                    ? 'bg-blue-500 text-white'
+                    : 'bg-gray-100 text-gray-600 hover:bg-gray-200'
+                }`}
+                onClick={() => setTrendPeriod(period.key)}
+              >
+                {period.label}
+              </button>
+            ))}
+          </div>
+        </div>
+        <div className="h-64 bg-gray-100 rounded mb-4">
+          {trendPoints.length > 0 ? (
+            <ResponsiveContainer width="100%" height="100%">
+              <LineChart data={trendPoints}>
+                <CartesianGrid strokeDasharray="3 3" />
+                <XAxis dataKey="date" />
+                <YAxis />
+                <Tooltip />
+                <Legend />
+                <Line type="monotone" dataKey="duration" stroke="#8884d8" name="평균 수면 시간 (시간)" dot={false} />
+              </LineChart>
+            </ResponsiveContainer>
+          ) : (
+            <div className="h-full flex items-center justify-center">
+              <p className="text-gray-500">표시할 수면 기록이 없습니다</p>
+            </div>
+          )}
         </div>
         
         <div className="grid grid-cols-1 md:grid-cols-3 gap-4">